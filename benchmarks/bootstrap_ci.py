@@ -0,0 +1,39 @@
+"""Benchmark: bootstrap CIs for thousands of aggregate groups in one vectorized pass.
+
+Usage: python benchmarks/bootstrap_ci.py [--groups 3000] [--runs 3] [--resamples 10000]
+
+Times `bootstrap_ci` over synthetic groups with the same metric count as `aggregate_runs`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from agentic_economy.analysis import AGGREGATE_METRICS, CI_METHODS, bootstrap_ci
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--groups", type=int, default=3000)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--resamples", type=int, default=10_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    codes = np.repeat(np.arange(args.groups), args.runs)
+    values = rng.normal(size=(codes.size, len(AGGREGATE_METRICS)))
+    for method in CI_METHODS:
+        started = time.perf_counter()
+        bootstrap_ci(values, codes, args.groups, resamples=args.resamples, method=method)
+        elapsed = time.perf_counter() - started
+        print(
+            f"{method:>10}: {args.groups} groups x {args.runs} runs x {values.shape[1]} metrics, "
+            f"{args.resamples} resamples in {elapsed:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark: CLI start-up time and which heavy packages each entry point imports.
+
+Usage: python benchmarks/cli_startup.py [--repeat 5] [--top 8]
+
+Every command line runs in a fresh interpreter with `-X importtime`; the best wall time over
+the repeats is reported with the summed import time and the heavy packages that were loaded.
+`--help` and the offline entry points (export, results, analysis, reporting) should never load
+openai; `reporting --help` loads neither matplotlib nor pandas.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import time
+from typing import Dict, List, Sequence, Tuple
+
+HEAVY_PACKAGES = ("openai", "pandas", "matplotlib", "dotenv")
+COMMANDS: Sequence[Tuple[str, List[str]]] = (
+    ("--help", ["-m", "agentic_economy.cli", "--help"]),
+    ("run --help", ["-m", "agentic_economy.cli", "run", "--help"]),
+    ("llm-live --help", ["-m", "agentic_economy.cli", "llm-live", "--help"]),
+    ("export --help", ["-m", "agentic_economy.cli", "export", "--help"]),
+    ("results build --help", ["-m", "agentic_economy.cli", "results", "build", "--help"]),
+    ("analysis --help", ["-m", "agentic_economy.analysis", "--help"]),
+    ("reporting --help", ["-m", "agentic_economy.reporting", "--help"]),
+)
+
+
+def _imports(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """Module -> (self, cumulative) microseconds from `-X importtime` output."""
+    modules: Dict[str, Tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def measure(argv: List[str], repeat: int) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    best, modules = float("inf"), {}
+    for _ in range(repeat):
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", *argv],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        elapsed = time.perf_counter() - started
+        if elapsed < best:
+            best, modules = elapsed, _imports(completed.stderr)
+    return best, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--top", type=int, default=0, help="also list the N slowest imports (cumulative)"
+    )
+    args = parser.parse_args()
+
+    for label, argv in COMMANDS:
+        wall, modules = measure(argv, args.repeat)
+        imported = sum(self_us for self_us, _ in modules.values()) / 1e6
+        heavy = [name for name in HEAVY_PACKAGES if name in modules] or ["none"]
+        print(
+            f"{label:>22}: {wall:.3f} s wall, {imported:.3f} s importing; heavy: {', '.join(heavy)}"
+        )
+        if args.top:
+            slowest = sorted(modules.items(), key=lambda item: item[1][1], reverse=True)
+            for name, (_, cumulative_us) in slowest[: args.top]:
+                print(f"{'':>24}{cumulative_us / 1e6:.3f} s  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""Benchmark: simulation engine cost with scripted agents across conditions and N.
+
+Usage:
+  python benchmarks/engine.py run [--n 10 100 1000 10000] [--rounds 3] [--out PATH]
+  python benchmarks/engine.py compare [BASELINE] [CURRENT] [--threshold 0.25]
+
+`run` writes benchmarks/engine_current.json by default; the committed baseline is
+benchmarks/baselines/engine.json (refresh it with `run --out benchmarks/baselines/engine.json`).
+
+Agents are answered by a deterministic rule-based responder, so only engine cost is measured:
+prompt rendering, action handling, logging and analysis. Each (condition, N) case runs in a
+fresh process so its peak RSS is its own. For `run()`, `_behavior_summary`, `write_json` and
+`analysis.load_runs` the case records wall time (best of a few repeats for fast phases), peak
+traced allocations (tracemalloc, in a second untimed pass) and the process peak RSS after the
+phase. `compare` prints the ratio of every metric to the baseline, with times scaled by a
+calibration workload timed in the same process, and exits non-zero when one grew by more than
+`--threshold`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import re
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from agentic_economy import __version__
+from agentic_economy.analysis import load_runs
+from agentic_economy.simulation import CONDITIONS, BaseSimulation
+
+PHASES = ("run", "behavior_summary", "write_json", "load_runs")
+METRICS = ("seconds", "allocated_mb", "peak_rss_mb")
+BASELINE_PATH = Path("benchmarks/baselines/engine.json")
+CURRENT_PATH = Path("benchmarks/engine_current.json")
+# Fast phases are repeated (best time kept) until this much time is spent.
+REPEAT_BUDGET_SECONDS = 1.0
+# Differences below these are noise, whatever the ratio.
+METRIC_FLOORS = {"seconds": 0.01, "allocated_mb": 1.0, "peak_rss_mb": 5.0}
+
+_TARGET = re.compile(r'Your target good:\n"(g\d+)"')
+_HELD = re.compile(r'"(g\d+)":1')
+_INCOMING = re.compile(r'"direction":"incoming","from":"A\d+","to":"A\d+","message_id":"(m\d+)"')
+
+
+class _ScriptedLLM:
+    """Rule-based responder: accept the latest proposal, else offer a held good for the target.
+
+    The Exchange confirms every order at price 1 and monetary agents sell what they hold until
+    they can buy their target, so every condition trades and clears.
+    """
+
+    def complete_json(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        system_content = messages[0]["content"]
+        user_content = messages[1]["content"]
+        if "central Exchange" in system_content:
+            inbox = json.loads(user_content.split('inbox":\n', 1)[1].split("\n\nEach inbox")[0])
+            return {
+                "outbox": [
+                    {
+                        "to_message_id": item["message_id"],
+                        "response": {
+                            "action": "confirm",
+                            "good": item["payload"].get("good"),
+                            "quantity": 1,
+                            "price": 1.0,
+                            "side": "sell" if item["payload"].get("action") == "sell" else "buy",
+                        },
+                    }
+                    for item in inbox
+                ]
+            }
+
+        target_match = _TARGET.search(user_content)
+        target = target_match.group(1) if target_match else "g0"
+        held = _HELD.findall(user_content.split("Your current inventory:")[1])
+        if "monetary" in system_content:
+            if target in held:
+                return {"action": "idle"}
+            if held:
+                return {"action": "sell", "good": held[0], "quantity": 1}
+            return {"action": "buy", "good": target, "quantity": 1}
+
+        incoming = _INCOMING.findall(user_content)
+        if incoming:
+            return {"action": "accept", "of_message_id": incoming[-1]}
+        if held and target not in held:
+            agent = system_content.split("Your name:")[1].split("\n")[0].strip()
+            partner = f"A{int(agent[1:]) + 1}"
+            return {"action": "propose_trade", "to": partner, "give": held[0], "receive": target}
+        return {"action": "idle"}
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux and bytes on macOS.
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 1e6
+
+
+def _best_time(action: Callable[[], Callable[[], Any]], repeat: int) -> Tuple[Any, float]:
+    """Best wall time of up to `repeat` calls of `action()()`, stopping once a second is spent."""
+    value, best, spent = None, float("inf"), 0.0
+    for _ in range(repeat):
+        call = action()
+        started = time.perf_counter()
+        value = call()
+        elapsed = time.perf_counter() - started
+        best, spent = min(best, elapsed), spent + elapsed
+        if spent >= REPEAT_BUDGET_SECONDS:
+            break
+    return value, best
+
+
+def _calibration_seconds() -> float:
+    """Best time of a fixed pure-Python workload: the speed of this machine right now."""
+
+    def workload() -> Callable[[], Any]:
+        return lambda: sum(len(str({"i": i})) for i in range(50_000))
+
+    return min(_best_time(workload, 1)[1] for _ in range(5))
+
+
+def _allocated_mb(action: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    try:
+        action()
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(
+    condition: str, n_agents: int, rounds: int, allocations: bool, repeat: int = 5
+) -> Dict[str, Any]:
+    """Benchmark one condition at one N; meant to run in a fresh process."""
+
+    def simulation() -> BaseSimulation:
+        return CONDITIONS[condition](
+            n_agents, rounds, 0, 10, _ScriptedLLM(), "benchmark"  # type: ignore[arg-type]
+        )
+
+    phases: Dict[str, Dict[str, float]] = {}
+    calibration = _calibration_seconds()
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / f"{condition}_N{n_agents}.json"
+        sims: List[BaseSimulation] = []
+
+        def fresh_run() -> Callable[[], Any]:
+            sims.append(simulation())
+            return sims[-1].run
+
+        result, seconds = _best_time(fresh_run, repeat)
+        phases["run"] = {"seconds": seconds, "peak_rss_mb": _peak_rss_mb()}
+        sim = sims[-1]
+        actions: Dict[str, Callable[[], Any]] = {
+            "behavior_summary": sim._behavior_summary,
+            "write_json": lambda: result.write_json(log_path),
+            "load_runs": lambda: load_runs(str(log_path), workers=1, index_path=None),
+        }
+        del sims[:-1]
+        for phase, action in actions.items():
+            _, seconds = _best_time(lambda: action, repeat)
+            phases[phase] = {"seconds": seconds, "peak_rss_mb": _peak_rss_mb()}
+
+        if allocations:
+            phases["run"]["allocated_mb"] = _allocated_mb(simulation().run)
+            for phase, action in actions.items():
+                phases[phase]["allocated_mb"] = _allocated_mb(action)
+        log_mb = log_path.stat().st_size / 1e6
+    calibration = min(calibration, _calibration_seconds())
+
+    return {
+        "condition": condition,
+        "n_agents": n_agents,
+        "rounds_run": result.rounds_run,
+        "messages": len(result.messages),
+        "events": len(result.events),
+        "log_mb": round(log_mb, 3),
+        "seconds_per_round": phases["run"]["seconds"] / max(result.rounds_run, 1),
+        "calibration_seconds": calibration,
+        "phases": phases,
+    }
+
+
+def _run(args: argparse.Namespace) -> None:
+    cases = []
+    for n_agents in args.n:
+        for condition in args.conditions:
+            # A fresh interpreter per case keeps peak RSS and allocator state independent.
+            with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+                case = pool.submit(
+                    run_case,
+                    condition,
+                    n_agents,
+                    args.rounds,
+                    not args.no_allocations,
+                    args.repeat,
+                ).result()
+            run = case["phases"]["run"]
+            print(
+                f"{condition:>18} N={n_agents:<6} {case['seconds_per_round']:.4f}s/round "
+                f"run {run['seconds']:.3f}s rss {run['peak_rss_mb']:.0f}MB",
+                flush=True,
+            )
+            cases.append(case)
+
+    report = {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rounds": args.rounds,
+        },
+        "cases": cases,
+    }
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote {args.out}")
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[Dict[str, Any]]:
+    """Per-metric ratios of `current` to `baseline` for cases present in both."""
+    base_cases = {(case["condition"], case["n_agents"]): case for case in baseline["cases"]}
+    rows = []
+    for case in current["cases"]:
+        base = base_cases.get((case["condition"], case["n_agents"]))
+        if base is None:
+            continue
+        for phase in PHASES:
+            for metric in METRICS:
+                old = base["phases"].get(phase, {}).get(metric)
+                new = case["phases"].get(phase, {}).get(metric)
+                if old is None or new is None:
+                    continue
+                if metric == "seconds":
+                    # Express times in calibration units so a slower or busier machine cancels.
+                    speed = base["calibration_seconds"] / case["calibration_seconds"]
+                    new *= speed
+                ratio = new / old if old > 0 else float("inf") if new > 0 else 1.0
+                rows.append(
+                    {
+                        "condition": case["condition"],
+                        "n_agents": case["n_agents"],
+                        "phase": phase,
+                        "metric": metric,
+                        "baseline": old,
+                        "current": new,
+                        "ratio": ratio,
+                        "regression": ratio > 1 + threshold and new - old > METRIC_FLOORS[metric],
+                    }
+                )
+    return rows
+
+
+def _compare(args: argparse.Namespace) -> None:
+    rows = compare(
+        json.loads(args.baseline.read_text(encoding="utf-8")),
+        json.loads(args.current.read_text(encoding="utf-8")),
+        args.threshold,
+    )
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['condition']:>18} N={row['n_agents']:<6} {row['phase']:>16} "
+            f"{row['metric']:>12} {row['baseline']:>10.3f} -> {row['current']:>10.3f} "
+            f"x{row['ratio']:.2f} {flag}"
+        )
+    regressions = sum(row["regression"] for row in rows)
+    print(
+        f"{len(rows)} metrics compared, {regressions} regressions (threshold {args.threshold:.0%})"
+    )
+    if regressions:
+        sys.exit(1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="Benchmark every case and write a JSON report.")
+    run_parser.add_argument("--n", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    run_parser.add_argument("--conditions", nargs="+", choices=CONDITIONS, default=CONDITIONS)
+    run_parser.add_argument("--rounds", type=int, default=3)
+    run_parser.add_argument(
+        "--repeat", type=int, default=5, help="Best-of repeats for phases under a second."
+    )
+    run_parser.add_argument("--no-allocations", action="store_true", help="Skip tracemalloc.")
+    run_parser.add_argument("--out", type=Path, default=CURRENT_PATH)
+    compare_parser = subparsers.add_parser("compare", help="Flag regressions against a baseline.")
+    compare_parser.add_argument("baseline", type=Path, nargs="?", default=BASELINE_PATH)
+    compare_parser.add_argument("current", type=Path, nargs="?", default=CURRENT_PATH)
+    compare_parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args()
+    if args.command == "run":
+        _run(args)
+    else:
+        _compare(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark: run log size and write/read time for json, json.gz and json.zst.
+
+Usage: python benchmarks/log_compression.py [--agents 60] [--rounds 20] [--repeat 3]
+
+Ratios are relative to the default pretty-printed `.json` log.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from agentic_economy.logstream import LOG_FORMATS, open_log
+from agentic_economy.simulation import BarterChatCreditSimulation, SimulationResult
+
+
+class _RandomLLM:
+    """Cheap seeded responder that produces a realistic mix of barter traffic."""
+
+    def __init__(self, n_agents: int, seed: int):
+        self.n_agents = n_agents
+        self.rng = random.Random(seed)
+
+    def complete_json(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        other = f"A{self.rng.randrange(self.n_agents)}"
+        good = f"g{self.rng.randrange(self.n_agents)}"
+        roll = self.rng.random()
+        if roll < 0.4:
+            return {"action": "propose_trade", "to": other, "give": good, "receive": "g0"}
+        if roll < 0.7:
+            return {"action": "send_message", "to": other, "message": "want to trade " + good}
+        return {"action": "idle"}
+
+
+def _best_of(repeat: int, action: Any) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def _read(path: Path) -> None:
+    with open_log(path) as handle:
+        json.load(handle)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=60)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    llm = _RandomLLM(args.agents, seed=0)
+    simulation = BarterChatCreditSimulation(
+        args.agents, args.rounds, 0, 10, llm, "benchmark"  # type: ignore[arg-type]
+    )
+    result: SimulationResult = simulation.run()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for log_format in LOG_FORMATS:
+            path = Path(tmp) / f"run.{log_format}"
+            try:
+                write = _best_of(args.repeat, lambda: result.write_json(path))
+            except RuntimeError as exc:
+                print(f"{log_format:>9}: skipped ({exc})")
+                continue
+            read = _best_of(args.repeat, lambda: _read(path))
+            rows.append((log_format, path.stat().st_size, write, read))
+
+    _, base_size, base_write, base_read = rows[0]
+    print(f"N={args.agents}, rounds={args.rounds}, messages={len(result.messages)}")
+    print(f"{'format':>9} {'bytes':>10} {'size':>7} {'write':>7} {'read':>7}")
+    for log_format, size, write, read in rows:
+        print(
+            f"{log_format:>9} {size:>10} {size / base_size:>6.3f}x "
+            f"{write / base_write:>6.2f}x {read / base_read:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
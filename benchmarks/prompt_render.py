@@ -0,0 +1,67 @@
+"""Microbenchmark: per-round prompt building cost with and without the render cache.
+
+Usage: python benchmarks/prompt_render.py [--agents 1000] [--rounds 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Dict, List
+
+from agentic_economy import prompts
+from agentic_economy.simulation import AgentState, BarterSimulation
+
+
+class _Unused:
+    def complete_json(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        raise AssertionError("benchmark does not call the model")
+
+
+def _uncached_messages(simulation: BarterSimulation, agent: AgentState, round_number: int) -> None:
+    prompts.barter_system_prompt(agent.name, agent.inventory, agent.target_good)
+    prompts.barter_user_prompt(
+        round_number,
+        agent.recent_history_json(simulation.history_limit),
+        agent.inventory,
+        agent.target_good,
+    )
+
+
+def _touch(simulation: BarterSimulation, round_number: int, changed_fraction: float) -> None:
+    # Mimic a round where a fraction of agents trade or receive a message.
+    names = sorted(simulation.agents)
+    step = max(1, int(1 / changed_fraction)) if changed_fraction > 0 else len(names) + 1
+    for index in range(round_number % step, len(names), step):
+        agent = simulation.agents[names[index]]
+        agent.record_history({"round": round_number, "type": "received", "from": names[0]})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--changed-fraction", type=float, default=0.1)
+    args = parser.parse_args()
+
+    for label in ("uncached", "cached"):
+        simulation = BarterSimulation(
+            args.agents, args.rounds, 0, 5, _Unused(), "benchmark"  # type: ignore[arg-type]
+        )
+        started = time.perf_counter()
+        for round_number in range(1, args.rounds + 1):
+            _touch(simulation, round_number, args.changed_fraction)
+            for agent in simulation.agents.values():
+                if label == "cached":
+                    simulation._agent_messages(agent, round_number)
+                else:
+                    _uncached_messages(simulation, agent, round_number)
+        elapsed = time.perf_counter() - started
+        print(
+            f"{label:>8}: {elapsed / args.rounds * 1000:.2f} ms/round "
+            f"(N={args.agents}, rounds={args.rounds})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark: serial `load_runs` over many small logs and a few large ones.
+
+Usage: python benchmarks/summarize_runs.py [--large-agents 200] [--repeat 5]
+
+Parses with one worker and no summary index, so only the per-log summarize cost is measured.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from log_compression import _RandomLLM
+
+from agentic_economy.analysis import load_runs
+from agentic_economy.simulation import (
+    BarterChatCreditSimulation,
+    BarterSimulation,
+    MoneyExchangeSimulation,
+)
+
+
+def _write_logs(root: Path, large_agents: int) -> None:
+    for seed, n in enumerate([5, 6, 7, 8] * 2):
+        for cls in (BarterSimulation, BarterChatCreditSimulation, MoneyExchangeSimulation):
+            simulation = cls(n, 8, seed, 10, _RandomLLM(n, seed), "benchmark")  # type: ignore[arg-type]
+            result = simulation.run()
+            result.write_json(root / "small" / f"{result.condition}_N{n}_seed{seed}.json")
+    for seed in range(4):
+        llm = _RandomLLM(large_agents, seed)
+        simulation = BarterChatCreditSimulation(
+            large_agents, 20, seed, 10, llm, "benchmark"  # type: ignore[arg-type]
+        )
+        result = simulation.run()
+        result.write_json(root / "large" / f"{result.condition}_N{large_agents}_seed{seed}.json")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--large-agents", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _write_logs(root, args.large_agents)
+        for name in ("small", "large"):
+            pattern = str(root / name / "*.json")
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                runs = load_runs(pattern, workers=1, index_path=None)
+                timings.append(time.perf_counter() - started)
+            size = sum(path.stat().st_size for path in (root / name).glob("*.json"))
+            print(f"{name:>5}: {len(runs)} logs, {size / 1e6:.1f} MB, best {min(timings):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Adaptive seed allocation: spend runs on the cells whose success rate is least certain.
+
+A sweep with an `[adaptive]` table first runs its grid seeds, then repeatedly re-reads its run
+set with `analysis.load_runs` (through the summary index, so only new logs are parsed),
+aggregates it with `analysis.aggregate_runs`, and gives one more seed to each of the
+`batch_size` (condition, N) cells whose confidence interval of the mean success rate is
+widest, while it is wider than `target_ci_width`. Allocation stops when every cell is within
+the target or at `max_seeds`, or when no further seed fits the decision budget.
+
+Cells whose runs all agree (e.g. money_exchange at small N clearing every time) have a
+zero-width interval after two seeds and get no more; cells with fewer than two runs have no
+interval yet and come first.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .monitor import decision_budget
+from .simulation import SimulationSpec
+from .sweep import SweepConfig, sweep_specs
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_METRIC = "success_rate"
+DEFAULT_BATCH_SIZE = 4
+DEFAULT_MAX_SEEDS = 20
+
+
+@dataclass
+class Cell:
+    condition: str
+    n_agents: int
+    seeds: List[int]
+    # Width of the CI of the metric's mean; inf until the cell has two runs.
+    ci_width: float
+
+    @property
+    def name(self) -> str:
+        return f"{self.condition}_N{self.n_agents}"
+
+
+def _cell_rows(frame: Any, config: SweepConfig, condition: str, n_agents: int) -> Any:
+    """Rows of a `load_runs` or `aggregate_runs` frame that belong to one cell of the sweep."""
+    suffix = "_async" if config.backend == "async" else ""
+    return frame[
+        (frame["run_set"] == config.run_set)
+        & (frame["condition"] == condition + suffix)
+        & (frame["n_agents"] == n_agents)
+        & (frame["model"] == config.model)
+        & (frame["rounds_cap"] == config.rounds)
+        & (frame["history_limit"] == config.history_limit)
+    ]
+
+
+def cell_states(config: SweepConfig, runs: Any, aggregate: Any) -> List[Cell]:
+    """Seeds run so far and CI width of every (condition, N) cell of the sweep.
+
+    `runs` and `aggregate` are the `load_runs` and `aggregate_runs` frames of the run set.
+    """
+    metric = config.adaptive.get("metric", DEFAULT_METRIC)
+    cells: List[Cell] = []
+    for condition in config.conditions:
+        for n_agents in config.n_values:
+            seeds: List[int] = []
+            width = math.inf
+            if not runs.empty:
+                cell_runs = _cell_rows(runs, config, condition, n_agents)
+                seeds = sorted(int(seed) for seed in cell_runs["seed"])
+                row = _cell_rows(aggregate, config, condition, n_agents)
+                if len(row):
+                    spread = float(
+                        row[f"{metric}_ci_high"].iloc[0] - row[f"{metric}_ci_low"].iloc[0]
+                    )
+                    width = spread if math.isfinite(spread) else math.inf
+            cells.append(Cell(condition, n_agents, seeds, width))
+    return cells
+
+
+def allocate(
+    config: SweepConfig, cells: Sequence[Cell], budget_left: Optional[float]
+) -> List[SimulationSpec]:
+    """One new seed for each of the widest cells above the target, within budget."""
+    target = float(config.adaptive["target_ci_width"])
+    max_seeds = int(config.adaptive.get("max_seeds", DEFAULT_MAX_SEEDS))
+    batch_size = int(config.adaptive.get("batch_size", DEFAULT_BATCH_SIZE))
+    open_cells = [cell for cell in cells if cell.ci_width > target and len(cell.seeds) < max_seeds]
+    specs: List[SimulationSpec] = []
+    # Stable sort: cells tied on width (e.g. no interval yet) keep their grid order.
+    for cell in sorted(open_cells, key=lambda cell: -cell.ci_width):
+        if len(specs) == batch_size:
+            break
+        cost = decision_budget(cell.n_agents, config.rounds)
+        if budget_left is not None and cost > budget_left:
+            continue
+        if budget_left is not None:
+            budget_left -= cost
+        specs.extend(
+            sweep_specs(
+                [cell.condition],
+                [cell.n_agents],
+                [max(cell.seeds, default=-1) + 1],
+                config.rounds,
+                config.history_limit,
+                config.model,
+                config.options,
+            )
+        )
+    return specs
+
+
+def run_adaptive(
+    config: SweepConfig,
+    run_specs: Callable[[List[SimulationSpec]], None],
+    budget_left: Optional[float] = None,
+    index_path: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Allocate and run seeds until the sweep's target or budget is met; returns each round.
+
+    `index_path` defaults to the summary index `make results-*` use.
+    """
+    from . import analysis
+
+    index_path = index_path or analysis.DEFAULT_INDEX_PATH
+    pattern = f"{config.output_dir.as_posix()}/*.json"
+    suffix = "_async" if config.backend == "async" else ""
+    rounds: List[Dict[str, Any]] = []
+    while True:
+        runs = analysis.load_runs(pattern, index_path=index_path)
+        aggregate = runs if runs.empty else analysis.aggregate_runs(runs)
+        cells = cell_states(config, runs, aggregate)
+        specs = allocate(config, cells, budget_left)
+        record = {
+            "round": len(rounds) + 1,
+            "ci_width": {
+                cell.name: None if math.isinf(cell.ci_width) else round(cell.ci_width, 4)
+                for cell in cells
+            },
+            "allocated": [
+                f"{spec.condition}{suffix}_N{spec.n_agents}_seed{spec.seed}" for spec in specs
+            ],
+        }
+        logger.info(json.dumps({"event": "adaptive_round", **record}))
+        rounds.append(record)
+        if not specs:
+            return rounds
+        if budget_left is not None:
+            budget_left -= sum(decision_budget(spec.n_agents, spec.rounds) for spec in specs)
+        run_specs(specs)
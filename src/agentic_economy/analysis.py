@@ -3,14 +3,66 @@
 from __future__ import annotations
 
 import argparse
-import glob
 import json
+import os
+import sqlite3
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
+from itertools import chain
 from pathlib import Path
-from typing import List
+from statistics import NormalDist
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
+from .export import as_scalar
+from .logstream import log_paths, open_log, scan_log
+
+# Below this many files, process start-up costs more than it saves.
+PARALLEL_MIN_FILES = 32
+DEFAULT_INDEX_PATH = "results/.run_index.sqlite"
+# Bump when summarize_run changes so indexed rows are recomputed.
+SUMMARY_VERSION = 6
+CLEARING_LEVELS = (50, 90, 100)
+# Per-round vectors kept on each row for clearing metrics; too wide for the CSV/Markdown tables.
+CURVE_COLUMNS = ["success_by_round", "trades_by_round"]
+CLEARING_COLUMNS = [f"rounds_to_clear_{level}" for level in CLEARING_LEVELS] + [
+    "clearing_auc",
+    "first_trade_round",
+    "messages_per_success",
+]
+AGGREGATE_GROUP_COLUMNS = [
+    "run_set",
+    "condition",
+    "n_agents",
+    "model",
+    "rounds_cap",
+    "history_limit",
+]
+AGGREGATE_METRICS = [
+    "total_messages",
+    "unique_pairs",
+    "success_count",
+    "success_rate",
+    "rounds_run",
+    "exchange_inbox_messages",
+    "exchange_outbox_messages",
+    "exchange_price_update_count",
+    "exchange_price_abs_change",
+    "credit_proposals",
+    "credit_accepts",
+    "send_messages",
+    "invalid_actions",
+]
+CI_METHODS = ("bca", "percentile")
+CI_LEVEL = 0.95
+DEFAULT_RESAMPLES = 10_000
+# Upper bound on drawn values held at once (resamples x groups x runs x metrics), ~64 MB.
+BOOTSTRAP_BLOCK_CELLS = 1 << 23
+
 
 @dataclass
 class RunSummary:
@@ -35,154 +87,528 @@ class RunSummary:
     credit_accepts: int = 0
     send_messages: int = 0
     invalid_actions: int = 0
-
-
-def _unique_pairs(messages: List[dict]) -> int:
-    pairs = set()
-    for msg in messages:
-        sender = msg.get("sender")
-        receiver = msg.get("receiver")
-        if not sender or not receiver or sender == receiver:
+    success_by_round: Optional[List[int]] = None
+    trades_by_round: Optional[List[int]] = None
+    llm_calls: Optional[int] = None
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    total_tokens: Optional[int] = None
+    wall_clock_seconds: Optional[float] = None
+    llm_seconds: Optional[float] = None
+    skipped_rounds: int = 0
+    skipped_calls: int = 0
+
+
+def _exchange_metrics(data: Dict[str, Any]) -> Dict[str, Any]:
+    fields: Dict[str, Any] = {
+        "exchange_inbox_messages": 0,
+        "exchange_outbox_messages": 0,
+        "exchange_price_update_count": 0,
+        "exchange_price_abs_change": 0.0,
+    }
+    metrics = data.get("exchange_round_metrics") or []
+    if not isinstance(metrics, list):
+        return fields
+    for metric in metrics:
+        if not isinstance(metric, dict):
             continue
-        pairs.add(tuple(sorted((sender, receiver))))
-    return len(pairs)
-
-
-def load_runs(pattern: str = "runs/*.json") -> pd.DataFrame:
-    rows = []
-    for path in sorted(glob.glob(pattern)):
-        log_path = Path(path)
-        run_set = log_path.parent.name
-        with log_path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-
-        messages = data.get("messages", [])
-        total_messages = len(messages)
-        unique_pairs = _unique_pairs(messages)
-        agents = data.get("agents", {})
-        inventory_final = data.get("inventory_final", {})
-        goods = {f"g{i}" for i in range(int(data.get("N", 0)))}
-        parameters = data.get("parameters") or {}
-        seed = int(data.get("seed", 0))
-
-        success_count = 0
-        for agent_name, agent_meta in agents.items():
-            target = agent_meta.get("target")
-            inventory = inventory_final.get(agent_name, {})
-            if inventory.get(target, 0) >= 1:
-                success_count += 1
-
-        proposals = {
-            msg.get("message_id"): msg
-            for msg in messages
-            if msg.get("payload", {}).get("action") == "propose_trade"
-        }
-        credit_proposal_ids = [
-            pid
-            for pid, msg in proposals.items()
-            if msg
-            and (
-                msg.get("payload", {}).get("give") not in goods
-                or msg.get("payload", {}).get("receive") not in goods
-            )
-        ]
-        credit_proposals = len(credit_proposal_ids)
-        credit_accepts = sum(
-            1
-            for msg in messages
-            if msg.get("payload", {}).get("action") == "accept"
-            and msg.get("payload", {}).get("of_message_id") in credit_proposal_ids
-        )
-        send_messages = sum(
-            1 for msg in messages if msg.get("payload", {}).get("action") == "send_message"
+        fields["exchange_inbox_messages"] += int(metric.get("inbox_total", 0))
+        fields["exchange_outbox_messages"] += int(metric.get("outbox_total", 0))
+        fields["exchange_price_update_count"] += int(metric.get("price_update_count", 0))
+        fields["exchange_price_abs_change"] += float(metric.get("price_total_abs_change", 0.0))
+    return fields
+
+
+def _success_metrics(data: Dict[str, Any]) -> Dict[str, Any]:
+    agents = data.get("agents", {})
+    inventory_final = data.get("inventory_final", {})
+    success_count = sum(
+        1
+        for agent_name, agent_meta in agents.items()
+        if inventory_final.get(agent_name, {}).get(agent_meta.get("target"), 0) >= 1
+    )
+    return {
+        "success_count": success_count,
+        "success_rate": success_count / max(len(agents), 1),
+    }
+
+
+def _curve_metrics(data: Dict[str, Any]) -> Dict[str, Any]:
+    # Logs written before round_metrics existed have no curve; their clearing metrics are NaN.
+    round_metrics = data.get("round_metrics") or {}
+    return {
+        "success_by_round": round_metrics.get("successful_agents"),
+        "trades_by_round": round_metrics.get("trades"),
+    }
+
+
+def _usage_metrics(data: Dict[str, Any]) -> Dict[str, Any]:
+    # Token and timing totals are only recorded by newer logs; older ones stay empty.
+    usage = data.get("usage") or {}
+    timing = data.get("timing") or {}
+    fields: Dict[str, Any] = {
+        key: usage.get(key) for key in ("llm_calls", "input_tokens", "output_tokens")
+    }
+    if usage:
+        fields["total_tokens"] = int(usage.get("input_tokens", 0)) + int(
+            usage.get("output_tokens", 0)
         )
-        events = data.get("events") or []
-        invalid_actions = 0
-        if isinstance(events, list):
-            invalid_actions = sum(
-                1 for ev in events if isinstance(ev, dict) and ev.get("event") == "invalid_action"
+    fields["wall_clock_seconds"] = timing.get("wall_clock_seconds")
+    fields["llm_seconds"] = timing.get("llm_seconds")
+    return fields
+
+
+def _stall_metrics(data: Dict[str, Any]) -> Dict[str, Any]:
+    # Rounds after a stall and calls for satisfied agents that were never made (0 without
+    # stall detection).
+    stall = data.get("stall") or {}
+    return {
+        "skipped_rounds": int(stall.get("skipped_rounds", 0)),
+        "skipped_calls": int(stall.get("skipped_calls", 0)),
+    }
+
+
+# Each metric maps a decoded log (without `messages`/`events` when streaming) to RunSummary
+# fields; messages and events are folded by `RunningMetrics`. Add per-run metrics here and
+# cross-run derived metrics, computed on whole columns, in `add_clearing_metrics`.
+RUN_METRICS: List[Callable[[Dict[str, Any]], Dict[str, Any]]] = [
+    _exchange_metrics,
+    _success_metrics,
+    _curve_metrics,
+    _usage_metrics,
+    _stall_metrics,
+]
+
+
+def _curve_matrix(curves: pd.Series, width: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Stack ragged per-round curves into a (runs x width) matrix.
+
+    Rounds after a run stopped repeat its last value (runs stop early once everyone cleared).
+    Returns the matrix and the length of each curve (0 when a run has none).
+    """
+    lists = [curve if isinstance(curve, list) else [] for curve in curves]
+    lengths = np.fromiter((len(curve) for curve in lists), dtype=np.int64, count=len(lists))
+    flat = np.fromiter(chain.from_iterable(lists), dtype=np.float64, count=int(lengths.sum()))
+    matrix = np.full((len(lists), width), np.nan)
+    if flat.size:
+        rows = np.repeat(np.arange(len(lists)), lengths)
+        starts = np.cumsum(lengths) - lengths
+        cols = np.arange(flat.size) - np.repeat(starts, lengths)
+        matrix[rows, cols] = flat
+        has_curve = lengths > 0
+        last = np.full(len(lists), np.nan)
+        last[has_curve] = flat[(starts + lengths - 1)[has_curve]]
+        padding = np.arange(width)[None, :] >= lengths[:, None]
+        matrix = np.where(padding, last[:, None], matrix)
+    return matrix, lengths
+
+
+def add_clearing_metrics(df: pd.DataFrame) -> pd.DataFrame:
+    """Add clearing-curve metrics to per-run rows, vectorized across all runs.
+
+    - `rounds_to_clear_<k>`: first round with at least k% of agents holding their target.
+    - `clearing_auc`: mean cleared fraction over rounds 1..rounds_cap (1.0 = cleared at once).
+    - `first_trade_round`: first round with an executed trade.
+    - `messages_per_success`: total messages per successful agent.
+    """
+    df = df.copy()
+    if df.empty:
+        return df
+    for column in CURVE_COLUMNS:
+        if column not in df.columns:
+            df[column] = None
+    successes = df["success_by_round"]
+    lengths = successes.map(lambda curve: len(curve) if isinstance(curve, list) else 0)
+    caps = np.where(df["rounds_cap"] > 0, df["rounds_cap"], lengths).astype(np.int64)
+    width = int(max(caps.max(), lengths.max(), 1))
+    cleared, curve_lengths = _curve_matrix(successes, width)
+    has_curve = curve_lengths > 0
+    n_agents = df["n_agents"].to_numpy(dtype=np.float64)
+
+    for level in CLEARING_LEVELS:
+        needed = np.ceil(n_agents * level / 100.0)
+        reached = cleared >= needed[:, None]
+        first = reached.argmax(axis=1) + 1.0
+        df[f"rounds_to_clear_{level}"] = np.where(reached.any(axis=1), first, np.nan)
+
+    in_cap = np.arange(width)[None, :] < caps[:, None]
+    cleared_in_cap = np.where(in_cap, np.nan_to_num(cleared), 0.0).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        auc = cleared_in_cap / (np.maximum(caps, 1) * n_agents)
+    df["clearing_auc"] = np.where(has_curve & (n_agents > 0), auc, np.nan)
+
+    trades, _ = _curve_matrix(df["trades_by_round"], width)
+    traded = np.nan_to_num(trades) > 0
+    df["first_trade_round"] = np.where(traded.any(axis=1), traded.argmax(axis=1) + 1.0, np.nan)
+
+    success_count = df["success_count"].to_numpy(dtype=np.float64)
+    df["messages_per_success"] = np.where(
+        success_count > 0,
+        df["total_messages"].to_numpy(dtype=np.float64) / np.maximum(success_count, 1),
+        np.nan,
+    )
+    return df
+
+
+class RunningMetrics:
+    """Fold messages and events one at a time into their RunSummary fields.
+
+    One pass with sets and counters; the streaming path feeds it items as they are decoded.
+    """
+
+    def __init__(self) -> None:
+        self.total_messages = 0
+        self.pairs: Set[Tuple[str, str]] = set()
+        self.proposals: Dict[Any, Tuple[Any, Any]] = {}
+        self.accepted: Counter[Any] = Counter()
+        self.send_messages = 0
+        self.invalid_actions = 0
+
+    def add_message(self, message: Any) -> None:
+        self.total_messages += 1
+        if not isinstance(message, dict):
+            return
+        payload = message.get("payload") or {}
+        if not isinstance(payload, dict):
+            payload = {"value": payload}
+        sender = as_scalar(message.get("sender"))
+        receiver = as_scalar(message.get("receiver"))
+        if sender is not None and sender != "" and receiver is not None and receiver != "":
+            sender, receiver = str(sender), str(receiver)
+            if sender != receiver:
+                self.pairs.add((min(sender, receiver), max(sender, receiver)))
+        action = as_scalar(payload.get("action"))
+        if action == "propose_trade":
+            # A repeated proposal id counts once, using its latest payload.
+            self.proposals[as_scalar(message.get("message_id"))] = (
+                as_scalar(payload.get("give")),
+                as_scalar(payload.get("receive")),
             )
+        elif action == "accept":
+            self.accepted[as_scalar(payload.get("of_message_id"))] += 1
+        elif action == "send_message":
+            self.send_messages += 1
+
+    def add_event(self, event: Any) -> None:
+        if isinstance(event, dict) and as_scalar(event.get("event")) == "invalid_action":
+            self.invalid_actions += 1
+
+    def fields(self, n_agents: int) -> Dict[str, Any]:
+        goods = {f"g{i}" for i in range(n_agents)}
+        credit_ids = [
+            message_id
+            for message_id, (give, receive) in self.proposals.items()
+            if give not in goods or receive not in goods
+        ]
+        return {
+            "total_messages": self.total_messages,
+            "unique_pairs": len(self.pairs),
+            "credit_proposals": len(credit_ids),
+            "credit_accepts": sum(self.accepted[message_id] for message_id in credit_ids),
+            "send_messages": self.send_messages,
+            "invalid_actions": self.invalid_actions,
+        }
 
-        exchange_round_metrics = data.get("exchange_round_metrics") or []
-        exchange_inbox_messages = 0
-        exchange_outbox_messages = 0
-        exchange_price_update_count = 0
-        exchange_price_abs_change = 0.0
-        if isinstance(exchange_round_metrics, list):
-            for metric in exchange_round_metrics:
-                if not isinstance(metric, dict):
-                    continue
-                exchange_inbox_messages += int(metric.get("inbox_total", 0))
-                exchange_outbox_messages += int(metric.get("outbox_total", 0))
-                exchange_price_update_count += int(metric.get("price_update_count", 0))
-                exchange_price_abs_change += float(metric.get("price_total_abs_change", 0.0))
-
-        rows.append(
-            RunSummary(
-                run_set=run_set,
-                condition=data.get("condition", "unknown"),
-                n_agents=data.get("N", 0),
-                seed=seed,
-                model=str(parameters.get("model") or data.get("model") or "unknown"),
-                rounds_cap=int(parameters.get("rounds") or data.get("round_cap") or 0),
-                history_limit=int(parameters.get("history_limit") or 0),
-                total_messages=total_messages,
-                unique_pairs=unique_pairs,
-                success_count=success_count,
-                success_rate=success_count / max(len(agents), 1),
-                rounds_run=data.get("rounds_run", 0),
-                path=str(log_path.as_posix()),
-                exchange_inbox_messages=exchange_inbox_messages,
-                exchange_outbox_messages=exchange_outbox_messages,
-                exchange_price_update_count=exchange_price_update_count,
-                exchange_price_abs_change=exchange_price_abs_change,
-                credit_proposals=credit_proposals,
-                credit_accepts=credit_accepts,
-                send_messages=send_messages,
-                invalid_actions=invalid_actions,
-            ).__dict__
-        )
 
-    return pd.DataFrame(rows)
+def summarize_log(
+    data: Dict[str, Any], path: Path, running: Optional[RunningMetrics] = None
+) -> dict:
+    """Build the `RunSummary` row for a decoded run log.
+
+    Pass `running` when messages and events were already folded while streaming.
+    """
+    if running is None:
+        running = RunningMetrics()
+        for message in data.get("messages") or []:
+            running.add_message(message)
+        events = data.get("events") or []
+        for event in events if isinstance(events, list) else []:
+            running.add_event(event)
+    parameters = data.get("parameters") or {}
+    fields = running.fields(int(data.get("N", 0)))
+    for metric in RUN_METRICS:
+        fields.update(metric(data))
+    return RunSummary(
+        run_set=path.parent.name,
+        condition=data.get("condition", "unknown"),
+        n_agents=data.get("N", 0),
+        seed=int(data.get("seed", 0)),
+        model=str(parameters.get("model") or data.get("model") or "unknown"),
+        rounds_cap=int(parameters.get("rounds") or data.get("round_cap") or 0),
+        history_limit=int(parameters.get("history_limit") or 0),
+        rounds_run=data.get("rounds_run", 0),
+        path=str(path.as_posix()),
+        **fields,
+    ).__dict__
+
+
+def summarize_run(path: str, streaming: bool = False) -> dict:
+    """Parse one run log and return its `RunSummary` row.
+
+    `streaming=True` never holds `messages` or `events` in memory; the row is identical.
+    """
+    log_path = Path(path)
+    if streaming:
+        running = RunningMetrics()
+        data = scan_log(log_path, {"messages": running.add_message, "events": running.add_event})
+        return summarize_log(data, log_path, running)
+    with open_log(log_path) as handle:
+        data = json.load(handle)
+    return summarize_log(data, log_path)
+
+
+def summarize_runs(
+    paths: List[str], workers: Optional[int] = None, streaming: bool = False
+) -> List[dict]:
+    """Summarize run logs, fanning out to a process pool when there is enough work.
+
+    Rows come back in the order of `paths` regardless of which worker finished first.
+    """
+    summarize = partial(summarize_run, streaming=streaming)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(paths))
+    if workers <= 1 or len(paths) < PARALLEL_MIN_FILES:
+        return [summarize(path) for path in paths]
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(summarize, paths, chunksize=chunksize))
+
+
+class SummaryIndex:
+    """SQLite cache of `RunSummary` rows keyed on each log's path, size and mtime."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, version INTEGER, row TEXT)"
+        )
 
+    @staticmethod
+    def fingerprint(path: str) -> Tuple[int, int]:
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def lookup(self, paths: List[str]) -> Dict[str, dict]:
+        """Return cached rows for paths whose fingerprint still matches."""
+        cached = {
+            path: ((size, mtime_ns), version, row)
+            for path, size, mtime_ns, version, row in self._conn.execute(
+                "SELECT path, size, mtime_ns, version, row FROM summaries"
+            )
+        }
+        hits: Dict[str, dict] = {}
+        for path in paths:
+            if path not in cached:
+                continue
+            fingerprint, version, row = cached[path]
+            if version == SUMMARY_VERSION and fingerprint == self.fingerprint(path):
+                hits[path] = json.loads(row)
+        return hits
+
+    def store(self, rows: Dict[str, Tuple[Tuple[int, int], dict]]) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?, ?)",
+                [
+                    (path, size, mtime_ns, SUMMARY_VERSION, json.dumps(row))
+                    for path, ((size, mtime_ns), row) in rows.items()
+                ],
+            )
 
-def aggregate_runs(df: pd.DataFrame) -> pd.DataFrame:
+    def close(self) -> None:
+        self._conn.close()
+
+
+def load_runs(
+    pattern: str = "runs/*.json",
+    workers: Optional[int] = None,
+    index_path: Optional[str] = None,
+    streaming: bool = False,
+) -> pd.DataFrame:
+    """Summarize every log matching `pattern`.
+
+    With `index_path`, rows for unchanged files come from the summary index and only new or
+    modified logs are parsed. `streaming` bounds per-file memory for very large logs.
+    """
+    paths = log_paths(pattern)
+    if index_path is None:
+        rows = summarize_runs(paths, workers=workers, streaming=streaming)
+        return add_clearing_metrics(pd.DataFrame(rows))
+
+    index = SummaryIndex(index_path)
+    try:
+        cached = index.lookup(paths)
+        stale = [path for path in paths if path not in cached]
+        # Fingerprint before parsing so a log rewritten mid-parse is picked up next time.
+        fingerprints = {path: index.fingerprint(path) for path in stale}
+        fresh = dict(zip(stale, summarize_runs(stale, workers=workers, streaming=streaming)))
+        index.store({path: (fingerprints[path], row) for path, row in fresh.items()})
+        cached.update(fresh)
+    finally:
+        index.close()
+    return add_clearing_metrics(pd.DataFrame([cached[path] for path in paths]))
+
+
+def _padded_by_group(values: np.ndarray, codes: np.ndarray, groups: int) -> np.ndarray:
+    """(groups x max_runs x metrics) copy of per-run `values`, NaN-padded past each group's runs."""
+    counts = np.bincount(codes, minlength=groups)
+    order = np.argsort(codes, kind="stable")
+    slots = np.arange(codes.size) - (np.cumsum(counts) - counts)[codes[order]]
+    padded = np.full((groups, max(int(counts.max(initial=0)), 1), values.shape[1]), np.nan)
+    padded[codes[order], slots] = values[order]
+    return padded
+
+
+def _nanmean(values: np.ndarray, axis: int) -> np.ndarray:
+    present = ~np.isnan(values)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(present, values, 0.0).sum(axis=axis) / present.sum(axis=axis)
+
+
+def _resample_weights(
+    runs: np.ndarray, slots: int, resamples: int, rng: np.random.Generator
+) -> np.ndarray:
+    """(groups x slots x resamples) times each run is drawn, resampling `runs[g]` runs per group."""
+    groups = runs.size
+    draws = (rng.random((groups, slots, resamples)) * runs[:, None, None]).astype(np.intp)
+    bins = (np.arange(groups)[:, None, None] * slots + draws) * resamples + np.arange(resamples)
+    drawn = np.broadcast_to(np.arange(slots)[None, :, None] < runs[:, None, None], draws.shape)
+    weights = np.bincount(bins.ravel(), weights=drawn.ravel(), minlength=groups * slots * resamples)
+    return weights.reshape(groups, slots, resamples)
+
+
+def _quantiles(boot: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """Per-cell quantiles of `boot`, sorted along its last axis (NaN last), one `q` per cell."""
+    last = np.maximum((~np.isnan(boot)).sum(axis=-1) - 1, 0)
+    position = np.clip(q, 0.0, 1.0) * last
+    below = np.floor(position).astype(np.intp)
+    low = np.take_along_axis(boot, below[..., None], axis=-1)[..., 0]
+    high = np.take_along_axis(boot, np.minimum(below + 1, last)[..., None], axis=-1)[..., 0]
+    return low + (high - low) * (position - below)
+
+
+def bootstrap_ci(
+    values: np.ndarray,
+    codes: np.ndarray,
+    groups: int,
+    resamples: int = DEFAULT_RESAMPLES,
+    method: str = "bca",
+    level: float = CI_LEVEL,
+    seed: int = 0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Bootstrap CIs of the mean of every metric column in every group; (groups x metrics) each.
+
+    `values` is (runs x metrics) and `codes` gives each run's group in [0, groups). Runs are
+    resampled within their group and every metric shares the draws. Each resample is a vector
+    of draw counts per run, so the resampled means of all groups come from one batched matrix
+    product rather than a Python loop per group; groups are processed in blocks to bound memory.
+    `method` is "percentile" or "bca" (bias-corrected and accelerated, acceleration from the
+    jackknife). NaN values are left out of the means; cells with fewer than two values get NaN
+    bounds.
+    """
+    if method not in CI_METHODS:
+        raise ValueError(f"Unknown CI method {method!r}; expected one of {CI_METHODS}")
+    padded = _padded_by_group(values, codes, groups)
+    slots, metrics = padded.shape[1:]
+    counts = np.bincount(codes, minlength=groups)
+    ci_low = np.full((groups, metrics), np.nan)
+    ci_high = np.full((groups, metrics), np.nan)
+    tail = (1.0 - level) / 2.0
+    rng = np.random.default_rng(seed)
+    block = max(1, BOOTSTRAP_BLOCK_CELLS // (resamples * max(slots, metrics)))
+    for start in range(0, groups, block):
+        sample = padded[start : start + block]
+        runs = counts[start : start + block]
+        present = ~np.isnan(sample)
+        weights = _resample_weights(runs, slots, resamples, rng)
+        # (groups x metrics x slots) @ (groups x slots x resamples): resampled sums per metric.
+        boot = np.matmul(np.where(present, sample, 0.0).transpose(0, 2, 1), weights)
+        if (present.sum(axis=1) == runs[:, None]).all():
+            boot /= runs[:, None, None]
+        else:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                boot /= np.matmul(present.transpose(0, 2, 1).astype(float), weights)
+        boot.sort(axis=-1)
+
+        q_low = np.full(boot.shape[:2], tail)
+        q_high = np.full(boot.shape[:2], 1.0 - tail)
+        if method == "bca":
+            q_low, q_high = _bca_levels(sample, boot, tail)
+        enough = present.sum(axis=1) >= 2
+        ci_low[start : start + block] = np.where(enough, _quantiles(boot, q_low), np.nan)
+        ci_high[start : start + block] = np.where(enough, _quantiles(boot, q_high), np.nan)
+    return ci_low, ci_high
+
+
+def _bca_levels(sample: np.ndarray, boot: np.ndarray, tail: float) -> Tuple[np.ndarray, np.ndarray]:
+    """BCa-adjusted lower/upper quantile levels per (group, metric) cell."""
+    estimate = _nanmean(sample, axis=1)[..., None]
+    resamples = boot.shape[-1]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Ties count half so the discrete bootstrap of a handful of seeds is not biased downward.
+        below = (boot < estimate).sum(axis=-1) + 0.5 * (boot == estimate).sum(axis=-1)
+        share = below / (~np.isnan(boot)).sum(axis=-1)
+
+        present = ~np.isnan(sample)
+        total = np.where(present, sample, 0.0).sum(axis=1, keepdims=True)
+        jackknife = (total - sample) / (present.sum(axis=1, keepdims=True) - 1)
+        spread = _nanmean(jackknife, axis=1)[:, None] - jackknife
+        acceleration = np.nansum(spread**3, axis=1) / (6.0 * np.nansum(spread**2, axis=1) ** 1.5)
+    share = np.clip(np.where(np.isnan(share), 0.5, share), 0.5 / resamples, 1 - 0.5 / resamples)
+    z0 = _normal_ppf(share)
+    acceleration = np.where(np.isfinite(acceleration), acceleration, 0.0)
+
+    def adjusted(level: float) -> np.ndarray:
+        z = z0 + _NORMAL.inv_cdf(level)
+        return _normal_cdf(z0 + z / (1.0 - acceleration * z))
+
+    return adjusted(tail), adjusted(1.0 - tail)
+
+
+_NORMAL = NormalDist()
+_normal_cdf = np.vectorize(_NORMAL.cdf, otypes=[float])
+_normal_ppf = np.vectorize(_NORMAL.inv_cdf, otypes=[float])
+
+
+def aggregate_runs(
+    df: pd.DataFrame,
+    resamples: int = DEFAULT_RESAMPLES,
+    ci_method: str = "bca",
+    seed: int = 0,
+) -> pd.DataFrame:
+    """Per-group run count and mean/std/bootstrap CI of every metric.
+
+    `{metric}_ci_low`/`{metric}_ci_high` bound the mean at `CI_LEVEL`; see `bootstrap_ci`.
+    """
     if df.empty:
         return df
-    return (
-        df.groupby(["run_set", "condition", "n_agents", "model", "rounds_cap", "history_limit"])
-        .agg(
-            runs=("path", "count"),
-            total_messages_mean=("total_messages", "mean"),
-            total_messages_std=("total_messages", "std"),
-            unique_pairs_mean=("unique_pairs", "mean"),
-            unique_pairs_std=("unique_pairs", "std"),
-            success_count_mean=("success_count", "mean"),
-            success_count_std=("success_count", "std"),
-            success_rate_mean=("success_rate", "mean"),
-            success_rate_std=("success_rate", "std"),
-            rounds_run_mean=("rounds_run", "mean"),
-            rounds_run_std=("rounds_run", "std"),
-            exchange_inbox_messages_mean=("exchange_inbox_messages", "mean"),
-            exchange_inbox_messages_std=("exchange_inbox_messages", "std"),
-            exchange_outbox_messages_mean=("exchange_outbox_messages", "mean"),
-            exchange_outbox_messages_std=("exchange_outbox_messages", "std"),
-            exchange_price_update_count_mean=("exchange_price_update_count", "mean"),
-            exchange_price_update_count_std=("exchange_price_update_count", "std"),
-            exchange_price_abs_change_mean=("exchange_price_abs_change", "mean"),
-            exchange_price_abs_change_std=("exchange_price_abs_change", "std"),
-            credit_proposals_mean=("credit_proposals", "mean"),
-            credit_proposals_std=("credit_proposals", "std"),
-            credit_accepts_mean=("credit_accepts", "mean"),
-            credit_accepts_std=("credit_accepts", "std"),
-            send_messages_mean=("send_messages", "mean"),
-            send_messages_std=("send_messages", "std"),
-            invalid_actions_mean=("invalid_actions", "mean"),
-            invalid_actions_std=("invalid_actions", "std"),
-        )
-        .reset_index()
-        .sort_values(["run_set", "condition", "n_agents"])
+    metrics = AGGREGATE_METRICS + [column for column in CLEARING_COLUMNS if column in df.columns]
+    grouped = df.groupby(AGGREGATE_GROUP_COLUMNS)
+    aggregated = grouped.agg(
+        runs=("path", "count"),
+        **{f"{metric}_{stat}": (metric, stat) for metric in metrics for stat in ("mean", "std")},
+    )
+    codes = grouped.ngroup().to_numpy()
+    grouped_rows = codes >= 0
+    ci_low, ci_high = bootstrap_ci(
+        df.loc[grouped_rows, metrics].to_numpy(dtype=float),
+        codes[grouped_rows],
+        len(aggregated),
+        resamples=resamples,
+        method=ci_method,
+        seed=seed,
     )
+    for position, metric in enumerate(metrics):
+        aggregated[f"{metric}_ci_low"] = ci_low[:, position]
+        aggregated[f"{metric}_ci_high"] = ci_high[:, position]
+    columns = ["runs"] + [
+        f"{metric}_{stat}" for metric in metrics for stat in ("mean", "std", "ci_low", "ci_high")
+    ]
+    return aggregated[columns].reset_index().sort_values(["run_set", "condition", "n_agents"])
 
 
 def _stringify_cell(value: object) -> str:
@@ -221,7 +647,7 @@ def _write_outputs(
     if out_csv:
         out_path = Path(out_csv)
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        runs_df.to_csv(out_path, index=False)
+        runs_df.drop(columns=CURVE_COLUMNS, errors="ignore").to_csv(out_path, index=False)
 
     if out_aggregate_csv:
         out_path = Path(out_aggregate_csv)
@@ -262,7 +688,11 @@ def _write_outputs(
     if out_aggregate_md:
         out_path = Path(out_aggregate_md)
         markdown_df = aggregate_df.copy()
-        float_columns = [col for col in markdown_df.columns if col.endswith(("_mean", "_std"))]
+        float_columns = [
+            col
+            for col in markdown_df.columns
+            if col.endswith(("_mean", "_std", "_ci_low", "_ci_high"))
+        ]
         for col in float_columns:
             markdown_df[col] = markdown_df[col].round(3)
         markdown_columns = [
@@ -275,12 +705,20 @@ def _write_outputs(
             "runs",
             "success_rate_mean",
             "success_rate_std",
+            "success_rate_ci_low",
+            "success_rate_ci_high",
             "rounds_run_mean",
             "rounds_run_std",
+            "rounds_run_ci_low",
+            "rounds_run_ci_high",
             "total_messages_mean",
             "total_messages_std",
+            "total_messages_ci_low",
+            "total_messages_ci_high",
             "unique_pairs_mean",
             "unique_pairs_std",
+            "unique_pairs_ci_low",
+            "unique_pairs_ci_high",
             "exchange_inbox_messages_mean",
             "exchange_outbox_messages_mean",
             "exchange_price_update_count_mean",
@@ -296,7 +734,10 @@ def _write_outputs(
             out_path,
             markdown_columns,
             title="Aggregated results",
-            subtitle=f"Grouped summary (means/std) from `{pattern}`.",
+            subtitle=(
+                f"Grouped summary from `{pattern}`: means, std and {CI_LEVEL:.0%} bootstrap "
+                "confidence intervals of the mean (empty for single-run groups)."
+            ),
         )
 
 
@@ -327,12 +768,61 @@ def main() -> None:
         default="",
         help="Write aggregated Markdown table to this path.",
     )
+    parser.add_argument(
+        "--runs-csv",
+        type=str,
+        default="",
+        help="Aggregate a per-run CSV from `--out-csv` instead of parsing run logs.",
+    )
+    parser.add_argument(
+        "--index",
+        type=str,
+        default=DEFAULT_INDEX_PATH,
+        help="SQLite summary index; unchanged logs are not re-parsed.",
+    )
+    parser.add_argument(
+        "--resamples",
+        type=int,
+        default=DEFAULT_RESAMPLES,
+        help="Bootstrap resamples for the aggregated confidence intervals.",
+    )
+    parser.add_argument(
+        "--ci-method",
+        choices=CI_METHODS,
+        default="bca",
+        help="Bootstrap interval: bias-corrected and accelerated (bca) or plain percentile.",
+    )
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help="Parse every log and leave the summary index untouched.",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream messages/events item by item instead of loading each log whole.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to parse run logs (default: CPU count; 1 disables the pool).",
+    )
     args = parser.parse_args()
-    df = load_runs(args.pattern)
+    if args.runs_csv:
+        df = pd.read_csv(args.runs_csv)
+    else:
+        df = load_runs(
+            args.pattern,
+            workers=args.workers,
+            index_path=None if args.no_index else args.index,
+            streaming=args.streaming,
+        )
+    source = args.runs_csv or args.pattern
     if df.empty:
-        print(f"No run logs found for pattern {args.pattern}")
+        print(f"No run logs found for pattern {source}")
         return
-    aggregated = aggregate_runs(df)
+    aggregated = aggregate_runs(df, resamples=args.resamples, ci_method=args.ci_method)
 
     if args.out_csv or args.out_md or args.out_aggregate_csv or args.out_aggregate_md:
         _write_outputs(
@@ -342,7 +832,7 @@ def main() -> None:
             out_md=args.out_md or None,
             out_aggregate_csv=args.out_aggregate_csv or None,
             out_aggregate_md=args.out_aggregate_md or None,
-            pattern=args.pattern,
+            pattern=source,
         )
         return
 
@@ -0,0 +1,277 @@
+"""Offline batch execution: advance many simulations in lockstep through provider batch jobs.
+
+Each lockstep step gathers the pending decision phase of every active simulation into one
+JSONL request file, submits it as a single batch job, polls until it completes, and maps each
+response back to its (run, round, agent) before resuming the simulations.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence, Tuple
+
+from .llm_client import usage_counts
+from .simulation import BaseSimulation, DecisionBatch, SimulationResult, resume_steps
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/responses"
+TERMINAL_FAILURE_STATUSES = {"failed", "expired", "cancelled"}
+
+
+class BatchBackend(Protocol):
+    def submit(self, input_path: Path) -> str:
+        """Submit a JSONL request file and return a job id."""
+        ...
+
+    def fetch(self, job_id: str, output_path: Path) -> bool:
+        """Write the job's output JSONL to `output_path`; return False while still running."""
+        ...
+
+
+class OpenAIBatchBackend:
+    def __init__(self, client: Optional[Any] = None, completion_window: str = "24h"):
+        if client is None:
+            from openai import OpenAI
+
+            client = OpenAI()
+        self._client: Any = client
+        self.completion_window = completion_window
+
+    def submit(self, input_path: Path) -> str:
+        with input_path.open("rb") as handle:
+            uploaded = self._client.files.create(file=handle, purpose="batch")
+        batch = self._client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=self.completion_window,
+        )
+        return str(batch.id)
+
+    def fetch(self, job_id: str, output_path: Path) -> bool:
+        batch = self._client.batches.retrieve(job_id)
+        if batch.status in TERMINAL_FAILURE_STATUSES:
+            raise RuntimeError(f"Batch {job_id} ended with status {batch.status}")
+        if batch.status != "completed":
+            return False
+
+        # Failed requests land in a separate error file; merge both so every
+        # custom_id is accounted for and can be retried.
+        chunks: List[bytes] = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                chunks.append(self._client.files.content(file_id).content)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(b"".join(chunk.rstrip(b"\n") + b"\n" for chunk in chunks if chunk))
+        return True
+
+
+class LocalBatchBackend:
+    """Process batch request files in-process; a stand-in for the provider in tests."""
+
+    def __init__(self, complete_json: Callable[[List[Dict[str, str]]], Dict[str, Any]]):
+        self.complete_json = complete_json
+        self._jobs: Dict[str, List[Dict[str, Any]]] = {}
+
+    def submit(self, input_path: Path) -> str:
+        records: List[Dict[str, Any]] = []
+        with input_path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                request = json.loads(line)
+                action = self.complete_json(request["body"]["input"])
+                records.append(
+                    {
+                        "id": f"batch_req_{len(records)}",
+                        "custom_id": request["custom_id"],
+                        "response": {
+                            "status_code": 200,
+                            "body": {
+                                "output": [
+                                    {
+                                        "type": "message",
+                                        "content": [
+                                            {"type": "output_text", "text": json.dumps(action)}
+                                        ],
+                                    }
+                                ]
+                            },
+                        },
+                        "error": None,
+                    }
+                )
+        job_id = f"local_{len(self._jobs)}"
+        self._jobs[job_id] = records
+        return job_id
+
+    def fetch(self, job_id: str, output_path: Path) -> bool:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with output_path.open("w", encoding="utf-8") as handle:
+            for record in self._jobs.pop(job_id):
+                handle.write(json.dumps(record) + "\n")
+        return True
+
+
+def _request_line(custom_id: str, model: str, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": BATCH_ENDPOINT,
+        "body": {
+            "model": model,
+            "input": messages,
+            "text": {"format": {"type": "json_object"}},
+        },
+    }
+
+
+def _extract_body_json(body: Dict[str, Any]) -> Dict[str, Any]:
+    """Pull the JSON action out of a raw responses API body (reasoning items are skipped)."""
+    text_parts: List[str] = []
+    for item in body.get("output") or []:
+        if item.get("type") != "message":
+            continue
+        for part in item.get("content") or []:
+            text = part.get("text")
+            if text:
+                text_parts.append(text)
+    if not text_parts:
+        raise ValueError("No text content in batch response")
+    return json.loads("".join(text_parts))
+
+
+def parse_batch_output(output_path: Path) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+    """Return (parsed responses, errors) keyed by custom_id."""
+    responses, errors, _ = _read_batch_output(output_path)
+    return responses, errors
+
+
+def _read_batch_output(
+    output_path: Path,
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str], Dict[str, Dict[str, int]]]:
+    responses: Dict[str, Dict[str, Any]] = {}
+    errors: Dict[str, str] = {}
+    usage: Dict[str, Dict[str, int]] = {}
+    with output_path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            custom_id = record["custom_id"]
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                errors[custom_id] = json.dumps(record.get("error") or response.get("body"))
+                continue
+            responses[custom_id] = _extract_body_json(response["body"])
+            usage[custom_id] = usage_counts(response["body"].get("usage"))
+    return responses, errors, usage
+
+
+def run_batch(
+    simulations: Sequence[BaseSimulation],
+    backend: BatchBackend,
+    work_dir: Path,
+    poll_interval: float = 30.0,
+    max_retries: int = 2,
+) -> List[SimulationResult]:
+    """Run simulations in lockstep, one batch job per decision phase across all runs."""
+    work_dir.mkdir(parents=True, exist_ok=True)
+    steppers = [simulation.steps() for simulation in simulations]
+    results: Dict[int, SimulationResult] = {}
+    pending: Dict[int, DecisionBatch] = {}
+    for run_index, steps in enumerate(steppers):
+        outcome = resume_steps(steps, None)
+        if isinstance(outcome, SimulationResult):
+            results[run_index] = outcome
+        else:
+            pending[run_index] = outcome
+
+    step = 0
+    while pending:
+        requests: Dict[str, Tuple[int, str, List[Dict[str, str]]]] = {}
+        for run_index, batch in pending.items():
+            round_number = simulations[run_index].current_round
+            for key, messages in batch.items():
+                custom_id = f"run{run_index}-round{round_number}-{key}"
+                requests[custom_id] = (run_index, key, messages)
+
+        answered = _execute_step(
+            requests, simulations, backend, work_dir, step, poll_interval, max_retries
+        )
+
+        responses_by_run: Dict[int, Dict[str, Dict[str, Any]]] = {idx: {} for idx in pending}
+        for custom_id, (run_index, key, _) in requests.items():
+            responses_by_run[run_index][key] = answered[custom_id]
+
+        next_pending: Dict[int, DecisionBatch] = {}
+        for run_index, responses in responses_by_run.items():
+            outcome = resume_steps(steppers[run_index], responses)
+            if isinstance(outcome, SimulationResult):
+                results[run_index] = outcome
+            else:
+                next_pending[run_index] = outcome
+        pending = next_pending
+        step += 1
+
+    return [results[idx] for idx in range(len(simulations))]
+
+
+def _execute_step(
+    requests: Dict[str, Tuple[int, str, List[Dict[str, str]]]],
+    simulations: Sequence[BaseSimulation],
+    backend: BatchBackend,
+    work_dir: Path,
+    step: int,
+    poll_interval: float,
+    max_retries: int,
+) -> Dict[str, Dict[str, Any]]:
+    answered: Dict[str, Dict[str, Any]] = {}
+    outstanding = list(requests)
+    attempt = 0
+    while True:
+        suffix = f"step{step:04d}" if attempt == 0 else f"step{step:04d}_retry{attempt}"
+        input_path = work_dir / f"{suffix}_input.jsonl"
+        output_path = work_dir / f"{suffix}_output.jsonl"
+        with input_path.open("w", encoding="utf-8") as handle:
+            for custom_id in outstanding:
+                run_index, _, messages = requests[custom_id]
+                line = _request_line(custom_id, simulations[run_index].model_name, messages)
+                handle.write(json.dumps(line, ensure_ascii=True) + "\n")
+
+        job_id = backend.submit(input_path)
+        logger.info(
+            json.dumps(
+                {
+                    "event": "batch_submitted",
+                    "step": step,
+                    "attempt": attempt,
+                    "job_id": job_id,
+                    "requests": len(outstanding),
+                    "input": str(input_path),
+                }
+            )
+        )
+        while not backend.fetch(job_id, output_path):
+            time.sleep(poll_interval)
+
+        responses, errors, usage = _read_batch_output(output_path)
+        for custom_id, tokens in usage.items():
+            simulations[requests[custom_id][0]].record_usage(tokens)
+        answered.update(responses)
+        outstanding = [custom_id for custom_id in outstanding if custom_id not in answered]
+        if not outstanding:
+            return answered
+        if attempt >= max_retries:
+            sample = {custom_id: errors.get(custom_id, "missing") for custom_id in outstanding[:3]}
+            raise RuntimeError(
+                f"Batch step {step} left {len(outstanding)} requests unanswered: {sample}"
+            )
+        logger.warning(
+            "batch_retry",
+            extra={"step": step, "attempt": attempt + 1, "failed_requests": len(outstanding)},
+        )
+        attempt += 1
@@ -0,0 +1,306 @@
+"""Incremental regeneration of the committed `results/` artifacts.
+
+Each artifact group is a `Target` with input files, parameters, the package modules that
+render it and the files it writes. A target's fingerprint hashes the content of its input
+CSVs (run logs by path, size and mtime, like the summary index), its parameters and the
+source of its modules and of every package module they import, directly or lazily. Targets run in dependency order and are skipped when the fingerprint
+matches the one recorded after their last build and all outputs exist, so an unchanged
+`results/` tree rebuilds nothing and matplotlib only renders figures whose inputs changed.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence
+
+from . import __version__
+from .logstream import log_paths
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_PATH = "results/.build_state.json"
+
+
+@dataclass
+class Target:
+    name: str
+    inputs: List[str]
+    outputs: List[Path]
+    build: Callable[[], None]
+    modules: List[ModuleType]
+    params: Dict[str, Any] = field(default_factory=dict)
+    # Run-log glob inputs; the target is skipped (keeping committed outputs) when none match.
+    logs: Optional[str] = None
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def module_sources(modules: Sequence[ModuleType]) -> List[Path]:
+    """Source files of `modules` and of the package modules they import, transitively.
+
+    Relative imports inside functions count too, since the package defers heavy ones.
+    """
+    package_dir = Path(__file__).resolve().parent
+    pending = [Path(str(module.__file__)).resolve() for module in modules]
+    seen: Dict[Path, None] = {}
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen[path] = None
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            if not isinstance(node, ast.ImportFrom) or node.level != 1:
+                continue
+            # `from .x import y` names module x; `from . import x, y` names x and y.
+            names = [node.module] if node.module else [alias.name for alias in node.names]
+            for name in names:
+                source = package_dir / f"{name.split('.')[0]}.py"
+                if source.exists():
+                    pending.append(source)
+    return sorted(seen)
+
+
+def fingerprint(target: Target) -> Optional[str]:
+    """Hash of everything `target` is built from, or None when an input is missing."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps(target.params, sort_keys=True, default=str).encode())
+    digest.update(__version__.encode())
+    for source in module_sources(target.modules):
+        digest.update(f"{source.name}:{_file_digest(source)}".encode())
+    for name in target.inputs:
+        path = Path(name)
+        if not path.exists():
+            return None
+        digest.update(f"{name}:{_file_digest(path)}".encode())
+    if target.logs is not None:
+        logs = log_paths(target.logs)
+        if not logs:
+            return None
+        from .analysis import SummaryIndex
+
+        for log in logs:
+            size, mtime_ns = SummaryIndex.fingerprint(log)
+            digest.update(f"{log}:{size}:{mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def _run_tables(pattern: str, results_dir: Path, prefix: str) -> Target:
+    from . import analysis
+
+    outputs = {
+        "out_csv": results_dir / f"{prefix}_full.csv",
+        "out_md": results_dir / f"{prefix}_full.md",
+        "out_aggregate_csv": results_dir / f"{prefix}_aggregate.csv",
+        "out_aggregate_md": results_dir / f"{prefix}_aggregate.md",
+    }
+
+    def build() -> None:
+        runs = analysis.load_runs(pattern, index_path=analysis.DEFAULT_INDEX_PATH)
+        analysis._write_outputs(
+            runs_df=runs,
+            aggregate_df=analysis.aggregate_runs(runs),
+            pattern=pattern,
+            **{key: str(path) for key, path in outputs.items()},
+        )
+
+    return Target(
+        name=f"{prefix}_tables",
+        inputs=[],
+        outputs=list(outputs.values()),
+        build=build,
+        modules=[analysis],
+        params={"pattern": pattern},
+        logs=pattern,
+    )
+
+
+def results_targets(
+    results_dir: Path = Path("results"),
+    *,
+    showcase_n: int = 8,
+    showcase_rounds_cap: int = 8,
+    showcase_model: str = "gpt-5-mini",
+) -> List[Target]:
+    """The `make results-all` / `figures-core` / `results-pages` artifacts, in build order."""
+    # pandas and matplotlib are only paid for by commands that build results.
+    import pandas as pd
+
+    from . import reporting, results_pages, scaling, sweep
+
+    figures = results_dir / "figures"
+    paper = results_dir / "paper"
+    core_aggregate = results_dir / "runs_core_aggregate.csv"
+    all_full = results_dir / "all_runs_full.csv"
+    all_aggregate = results_dir / "all_runs_aggregate.csv"
+    fits_csv = results_dir / "scaling_fits.csv"
+    fits_md = results_dir / "scaling_fits.md"
+    run_sets = results_dir / "run_sets.json"
+    showcase: Dict[str, Any] = {
+        "n_agents": showcase_n,
+        "rounds_cap": showcase_rounds_cap,
+        "model": showcase_model,
+    }
+
+    def figure_pair(name: str) -> List[Path]:
+        return [figures / f"{name}.png", figures / f"{name}.pdf"]
+
+    def core_df() -> pd.DataFrame:
+        return pd.read_csv(core_aggregate)
+
+    def build_scaling() -> None:
+        scaling.write_fits(
+            scaling.fit_scaling(pd.read_csv(all_full)), fits_csv, fits_md, str(all_full)
+        )
+
+    def build_core_figure() -> None:
+        reporting.generate_core_sweep_overview(core_df(), figures)
+
+    def build_core_table() -> None:
+        reporting.write_core_sweep_latex_table(core_df(), paper / "core_sweep_table.tex")
+
+    def build_clearing() -> None:
+        df = core_df()
+        if "clearing_auc_mean" in df.columns and df["clearing_auc_mean"].notna().any():
+            reporting.generate_clearing_overview(df, figures)
+
+    def build_scaling_figure() -> None:
+        reporting.generate_scaling_overview(pd.read_csv(fits_csv), figures)
+
+    def build_showcase_figure() -> None:
+        reporting.generate_showcase_overview(
+            pd.read_csv(all_aggregate), figures, run_sets_path=run_sets, **showcase
+        )
+
+    def build_pages() -> None:
+        results_pages.write_all_results_page(
+            all_full, all_aggregate, results_dir / "all_results.md"
+        )
+        results_pages.write_showcase_page(
+            all_aggregate,
+            results_dir / "showcase.md",
+            latex_out_path=paper / "showcase_table.tex",
+            run_sets_path=run_sets,
+            **showcase,
+        )
+
+    return [
+        _run_tables("runs_core/*.json", results_dir, "runs_core"),
+        _run_tables("runs*/*.json", results_dir, "all_runs"),
+        Target(
+            name="scaling_fits",
+            inputs=[str(all_full)],
+            outputs=[fits_csv, fits_md],
+            build=build_scaling,
+            modules=[scaling],
+        ),
+        Target(
+            name="core_sweep_overview",
+            inputs=[str(core_aggregate)],
+            outputs=figure_pair("core_sweep_overview"),
+            build=build_core_figure,
+            modules=[reporting],
+        ),
+        Target(
+            name="core_sweep_table",
+            inputs=[str(core_aggregate)],
+            outputs=[paper / "core_sweep_table.tex"],
+            build=build_core_table,
+            modules=[reporting],
+        ),
+        Target(
+            name="clearing_overview",
+            inputs=[str(core_aggregate)],
+            # Only drawn when the aggregate has clearing columns, so its outputs are optional.
+            outputs=[],
+            build=build_clearing,
+            modules=[reporting],
+        ),
+        Target(
+            name="scaling_overview",
+            inputs=[str(fits_csv)],
+            outputs=figure_pair("scaling_overview"),
+            build=build_scaling_figure,
+            modules=[reporting],
+        ),
+        Target(
+            name="showcase_overview",
+            inputs=[str(all_aggregate), str(run_sets)],
+            outputs=figure_pair("showcase_overview"),
+            build=build_showcase_figure,
+            modules=[reporting, sweep],
+            params=showcase,
+        ),
+        Target(
+            name="results_pages",
+            inputs=[str(all_full), str(all_aggregate), str(run_sets)],
+            outputs=[
+                results_dir / "all_results.md",
+                results_dir / "showcase.md",
+                paper / "showcase_table.tex",
+            ],
+            build=build_pages,
+            modules=[results_pages, sweep],
+            params=showcase,
+        ),
+    ]
+
+
+def build_targets(
+    targets: Sequence[Target],
+    state_path: Path = Path(DEFAULT_STATE_PATH),
+    *,
+    force: bool = False,
+    dry_run: bool = False,
+    only: Optional[Sequence[str]] = None,
+) -> Dict[str, str]:
+    """Build stale targets in order; returns each target's status.
+
+    Statuses are "built", "stale" (dry run), "unchanged" or "missing_inputs". Fingerprints
+    are taken just before each target runs, so outputs of earlier targets count as inputs; a
+    dry run therefore judges targets downstream of a stale one on the current files.
+    """
+    state: Dict[str, str] = json.loads(state_path.read_text()) if state_path.exists() else {}
+    statuses: Dict[str, str] = {}
+    for target in targets:
+        if only is not None and target.name not in only:
+            continue
+        digest = fingerprint(target)
+        if digest is None:
+            status = "missing_inputs"
+        elif (
+            not force
+            and state.get(target.name) == digest
+            and all(path.exists() for path in target.outputs)
+        ):
+            status = "unchanged"
+        elif dry_run:
+            status = "stale"
+        else:
+            target.build()
+            state[target.name] = digest
+            state_path.parent.mkdir(parents=True, exist_ok=True)
+            state_path.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n")
+            status = "built"
+        statuses[target.name] = status
+        logger.info(
+            json.dumps(
+                {
+                    "event": "results_target",
+                    "target": target.name,
+                    "status": status,
+                    "outputs": [str(path) for path in target.outputs],
+                }
+            )
+        )
+    return statuses
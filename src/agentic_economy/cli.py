@@ -5,111 +5,178 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from dotenv import load_dotenv
-
+from .build import DEFAULT_STATE_PATH, build_targets, results_targets
 from .llm_client import LLMClient
+from .logstream import LOG_FORMATS
+from .monitor import DEFAULT_STATUS_INTERVAL, SweepMonitor, decision_budget
+from .planner import (
+    DEFAULT_CALIBRATION_PATTERN,
+    calibrate,
+    check_cost_budget,
+    estimate_sweep,
+    has_cost_budget,
+)
+from .profiling import PROFILERS, SpanRecorder, flame_summary, profiled, timed
 from .simulation import (
-    BarterChatCreditSimulation,
-    BarterChatSimulation,
-    BarterSimulation,
-    BarterWithCreditSimulation,
+    CONDITIONS,
     BaseSimulation,
-    CentralPlannerSimulation,
-    MoneyExchangeSimulation,
+    SimulationResult,
+    SimulationSpec,
+    condition_option_types,
+    condition_options,
 )
+from .sweep import (
+    DEFAULT_RUN_SETS_PATH,
+    SweepConfig,
+    SweepJob,
+    check_budget,
+    load_sweep,
+    plan_sweep,
+    register_run_set,
+    sweep_specs,
+    write_manifest,
+)
+from .tracing import TraceExporter
 
 DEFAULT_N_VALUES = [3, 5, 7]
 DEFAULT_MODEL = "gpt-5-mini"
 
 
+# Attributes every LogRecord has; anything else on a record came from `extra=`.
+_LOG_RECORD_FIELDS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class ExtraFieldsFormatter(logging.Formatter):
+    """`%(message)s`, or a JSON event line when the record carries `extra=` fields.
+
+    Plain `%(message)s` dropped them, so e.g. `llm_retry` lost its attempt, error and delay.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        extra = {key: value for key, value in vars(record).items() if key not in _LOG_RECORD_FIELDS}
+        if not extra:
+            return message
+        return json.dumps({"event": message, **extra}, default=str)
+
+
 def configure_logging(verbose: bool = False) -> None:
     level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format="%(message)s",
-    )
+    handler = logging.StreamHandler()
+    handler.setFormatter(ExtraFieldsFormatter("%(message)s"))
+    logging.basicConfig(level=level, handlers=[handler])
 
 
-def run_experiment(
-    condition: str,
-    n: int,
-    seed: int,
-    rounds: int,
-    history_limit: int,
-    model: str,
-    output_dir: Path,
-) -> Path:
-    llm_client = LLMClient(model=model)
-    simulation: BaseSimulation
-    if condition == "barter":
-        simulation = BarterSimulation(
-            n_agents=n,
-            rounds=rounds,
-            seed=seed,
-            history_limit=history_limit,
-            llm_client=llm_client,
-            model_name=model,
-        )
-    elif condition == "barter_chat":
-        simulation = BarterChatSimulation(
-            n_agents=n,
-            rounds=rounds,
-            seed=seed,
-            history_limit=history_limit,
-            llm_client=llm_client,
-            model_name=model,
-        )
-    elif condition == "barter_credit":
-        simulation = BarterWithCreditSimulation(
-            n_agents=n,
-            rounds=rounds,
-            seed=seed,
-            history_limit=history_limit,
-            llm_client=llm_client,
-            model_name=model,
-        )
-    elif condition == "barter_chat_credit":
-        simulation = BarterChatCreditSimulation(
-            n_agents=n,
-            rounds=rounds,
-            seed=seed,
-            history_limit=history_limit,
-            llm_client=llm_client,
-            model_name=model,
-        )
-    elif condition == "money_exchange":
-        simulation = MoneyExchangeSimulation(
-            n_agents=n,
-            rounds=rounds,
-            seed=seed,
-            history_limit=history_limit,
-            llm_client=llm_client,
-            model_name=model,
-        )
-    elif condition == "central_planner":
-        simulation = CentralPlannerSimulation(
-            n_agents=n,
-            rounds=rounds,
-            seed=seed,
-            history_limit=history_limit,
-            llm_client=llm_client,
-            model_name=model,
+def _parse_bool(value: str) -> bool:
+    if value.lower() in ("1", "true", "yes", "on"):
+        return True
+    if value.lower() in ("0", "false", "no", "off"):
+        return False
+    raise argparse.ArgumentTypeError(f"expected true or false, not {value!r}")
+
+
+def add_condition_options(parser: argparse.ArgumentParser) -> None:
+    """One `--option-name` per per-condition constructor keyword in the registry."""
+    conditions_by_option: Dict[str, List[str]] = {}
+    defaults: Dict[str, Any] = {}
+    types: Dict[str, Any] = {}
+    helps: Dict[str, str] = {}
+    for condition in CONDITIONS:
+        option_types = condition_option_types(condition)
+        for name, default in condition_options(condition).items():
+            conditions_by_option.setdefault(name, []).append(condition)
+            defaults[name] = default
+            types[name] = option_types[name]
+            helps[name] = CONDITIONS[condition].option_help[name]
+    for name, conditions in conditions_by_option.items():
+        # bool("False") is True, so flags of bool options parse the words themselves.
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            type=_parse_bool if types[name] is bool else types[name],
+            default=None,
+            help=f"{helps[name]} {', '.join(conditions)} only; default {defaults[name]}.",
         )
-    else:
-        raise ValueError(f"Unknown condition {condition}")
 
-    result = simulation.run()
-    path = output_dir / f"{condition}_N{n}_seed{seed}.json"
-    result.write_json(path)
+
+def _option_values(args: argparse.Namespace) -> Dict[str, Any]:
+    return {
+        name: getattr(args, name)
+        for condition in CONDITIONS
+        for name in condition_options(condition)
+    }
+
+
+@dataclass
+class Instrumentation:
+    """Observers attached to every run of a sweep; each one is optional."""
+
+    span_recorders: Optional[List[SpanRecorder]] = None
+    monitor: Optional[SweepMonitor] = None
+    traces: Optional[TraceExporter] = None
+
+    def attach(self, simulation: BaseSimulation) -> BaseSimulation:
+        if self.span_recorders is not None:
+            simulation.span_recorder = SpanRecorder()
+            self.span_recorders.append(simulation.span_recorder)
+        if self.monitor is not None:
+            self.monitor.track(simulation)
+        if self.traces is not None:
+            simulation.tracer = self.traces.trace(
+                {
+                    "condition": simulation.condition,
+                    "n_agents": simulation.n_agents,
+                    "seed": simulation._seed,
+                    "model": simulation.model_name,
+                    "rounds_cap": simulation.rounds,
+                }
+            )
+        return simulation
+
+    def finish(self, simulation: BaseSimulation, result: SimulationResult) -> None:
+        if self.monitor is not None:
+            self.monitor.finish(simulation)
+        if self.traces is not None and simulation.tracer is not None:
+            self.traces.finish(
+                simulation.tracer,
+                {
+                    "condition": result.condition,
+                    "rounds_run": result.rounds_run,
+                    "successful_agents": result.successful_agents,
+                    **(result.usage or {}),
+                },
+            )
+
+    def close(self) -> None:
+        """Log the sweep's span summary and export traces of runs that never finished."""
+        if self.span_recorders:
+            logging.info(
+                json.dumps({"event": "span_summary", **flame_summary(self.span_recorders)})
+            )
+        if self.traces is not None:
+            self.traces.close()
+
+
+def write_result(
+    result: SimulationResult,
+    output_dir: Path,
+    log_format: str = "json",
+    span_recorder: Optional[SpanRecorder] = None,
+) -> Path:
+    stem = f"{result.condition}_N{result.n_agents}_seed{result.seed}"
+    path = output_dir / f"{stem}.{log_format}"
+    with timed(span_recorder, "write_json", result.rounds_run):
+        result.write_json(path)
     logging.info(
         json.dumps(
             {
                 "event": "run_complete",
-                "condition": condition,
-                "N": n,
-                "seed": seed,
+                "condition": result.condition,
+                "N": result.n_agents,
+                "seed": result.seed,
                 "rounds_run": result.rounds_run,
                 "successful_agents": result.successful_agents,
                 "output": str(path),
@@ -119,6 +186,106 @@ def run_experiment(
     return path
 
 
+def run_experiment(
+    spec: SimulationSpec,
+    output_dir: Path,
+    async_rounds: bool = False,
+    concurrency: int = 1,
+    log_format: str = "json",
+    profile: Optional[str] = None,
+    instrumentation: Optional[Instrumentation] = None,
+    llm_client: Optional[LLMClient] = None,
+) -> Path:
+    instrumentation = instrumentation or Instrumentation()
+    simulation = instrumentation.attach(spec.build(llm_client or LLMClient(model=spec.model)))
+    suffix = "_async" if async_rounds else ""
+    stem = f"{spec.condition}{suffix}_N{spec.n_agents}_seed{spec.seed}"
+    with profiled(profile, output_dir / stem):
+        if async_rounds:
+            # By default every agent keeps exactly one decision in flight.
+            result = simulation.run_async(
+                max_workers=concurrency if concurrency > 1 else spec.n_agents
+            )
+        else:
+            result = simulation.run()
+        path = write_result(result, output_dir, log_format, simulation.span_recorder)
+    instrumentation.finish(simulation, result)
+    return path
+
+
+def _model_clients(specs: Sequence[SimulationSpec]) -> Dict[str, LLMClient]:
+    """One LLM client per model of a sweep, shared by its runs."""
+    clients: Dict[str, LLMClient] = {}
+    for spec in specs:
+        if spec.model not in clients:
+            clients[spec.model] = LLMClient(model=spec.model)
+    return clients
+
+
+def _build_all(
+    specs: Sequence[SimulationSpec], instrumentation: Instrumentation
+) -> List[BaseSimulation]:
+    """Simulations of a sweep; runs of the same model share one client."""
+    clients = _model_clients(specs)
+    return [instrumentation.attach(spec.build(clients[spec.model])) for spec in specs]
+
+
+def run_concurrent_sweep(
+    specs: Sequence[SimulationSpec],
+    output_dir: Path,
+    concurrency: int,
+    log_format: str = "json",
+    profile: Optional[str] = None,
+    instrumentation: Optional[Instrumentation] = None,
+) -> List[Path]:
+    """Interleave all runs of a sweep on one shared pool of `concurrency` LLM calls."""
+    from .scheduler import run_interleaved
+
+    instrumentation = instrumentation or Instrumentation()
+    simulations = _build_all(specs, instrumentation)
+    paths: List[Path] = []
+
+    def on_complete(index: int, result: SimulationResult) -> None:
+        recorder = simulations[index].span_recorder
+        paths.append(write_result(result, output_dir, log_format, recorder))
+        instrumentation.finish(simulations[index], result)
+
+    # Runs interleave, so the sweep is profiled as a whole.
+    with profiled(profile, output_dir / "sweep"):
+        run_interleaved(simulations, max_workers=concurrency, on_complete=on_complete)
+    return paths
+
+
+def run_batch_sweep(
+    specs: Sequence[SimulationSpec],
+    output_dir: Path,
+    batch_dir: Path,
+    poll_interval: float,
+    log_format: str = "json",
+    profile: Optional[str] = None,
+    instrumentation: Optional[Instrumentation] = None,
+) -> List[Path]:
+    """Run a whole sweep in lockstep, one provider batch job per decision phase."""
+    from .batch import OpenAIBatchBackend, run_batch
+
+    instrumentation = instrumentation or Instrumentation()
+    simulations = _build_all(specs, instrumentation)
+    with profiled(profile, output_dir / "sweep"):
+        results = run_batch(
+            simulations,
+            OpenAIBatchBackend(),
+            batch_dir,
+            poll_interval=poll_interval,
+        )
+        paths = [
+            write_result(result, output_dir, log_format, simulation.span_recorder)
+            for simulation, result in zip(simulations, results)
+        ]
+    for simulation, result in zip(simulations, results):
+        instrumentation.finish(simulation, result)
+    return paths
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run agentic economy experiments.")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -127,14 +294,7 @@ def parse_args() -> argparse.Namespace:
     run_parser.add_argument(
         "--conditions",
         nargs="+",
-        choices=[
-            "barter",
-            "barter_chat",
-            "barter_credit",
-            "barter_chat_credit",
-            "money_exchange",
-            "central_planner",
-        ],
+        choices=list(CONDITIONS),
         default=["barter", "money_exchange"],
         help="Which conditions to run.",
     )
@@ -164,6 +324,7 @@ def parse_args() -> argparse.Namespace:
         default=10,
         help="How many prior messages each agent sees.",
     )
+    add_condition_options(run_parser)
     run_parser.add_argument(
         "--model",
         type=str,
@@ -176,6 +337,75 @@ def parse_args() -> argparse.Namespace:
         default=Path("runs"),
         help="Directory to store run JSON logs.",
     )
+    run_parser.add_argument(
+        "--log-format",
+        choices=LOG_FORMATS,
+        default="json",
+        help="Run log format; json.gz / json.zst write compact compressed JSON.",
+    )
+    run_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Concurrent LLM calls shared across all runs of the sweep (1 = serial).",
+    )
+    run_parser.add_argument(
+        "--async-rounds",
+        action="store_true",
+        help="Let each agent act as soon as its previous decision returns (no round barrier).",
+    )
+    run_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit each decision phase of all runs as one offline provider batch job.",
+    )
+    run_parser.add_argument(
+        "--batch-dir",
+        type=Path,
+        default=None,
+        help="Directory for batch request/response JSONL files (default: <output-dir>/batch).",
+    )
+    run_parser.add_argument(
+        "--batch-poll-interval",
+        type=float,
+        default=30.0,
+        help="Seconds between batch job status polls.",
+    )
+    run_parser.add_argument(
+        "--spans",
+        action="store_true",
+        help="Time prompts, LLM calls, JSON parsing, actions and writes per round.",
+    )
+    run_parser.add_argument(
+        "--profile",
+        choices=PROFILERS,
+        default=None,
+        help="Profile each run (the whole sweep when runs interleave) next to its log.",
+    )
+    run_parser.add_argument(
+        "--trace-file",
+        type=Path,
+        default=None,
+        help="Append OTLP/JSON traces (run, round, decision, HTTP attempt spans) to this file.",
+    )
+    run_parser.add_argument(
+        "--status-file",
+        type=Path,
+        default=None,
+        help="Rewrite live sweep metrics (runs, rounds, rates, latency, ETA) to this JSON file.",
+    )
+    run_parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve live sweep metrics on localhost: Prometheus /metrics and JSON /status.",
+    )
+    run_parser.add_argument(
+        "--status-interval",
+        type=float,
+        default=DEFAULT_STATUS_INTERVAL,
+        help="Seconds between status file rewrites.",
+    )
     run_parser.add_argument(
         "--verbose",
         action="store_true",
@@ -185,7 +415,7 @@ def parse_args() -> argparse.Namespace:
     llm_parser = subparsers.add_parser("llm-live", help="Tiny live sanity check run.")
     llm_parser.add_argument(
         "--condition",
-        choices=["barter", "barter_chat", "barter_chat_credit", "money_exchange"],
+        choices=list(CONDITIONS),
         default="barter",
         help="Condition to run for the smoke test.",
     )
@@ -198,6 +428,7 @@ def parse_args() -> argparse.Namespace:
         default=6,
         help="Messages to show each agent.",
     )
+    add_condition_options(llm_parser)
     llm_parser.add_argument(
         "--model",
         type=str,
@@ -211,6 +442,187 @@ def parse_args() -> argparse.Namespace:
         help="Directory to store run JSON logs.",
     )
     llm_parser.add_argument(
+        "--log-format",
+        choices=LOG_FORMATS,
+        default="json",
+        help="Run log format; json.gz / json.zst write compact compressed JSON.",
+    )
+    llm_parser.add_argument(
+        "--async-rounds",
+        action="store_true",
+        help="Let each agent act as soon as its previous decision returns (no round barrier).",
+    )
+    llm_parser.add_argument(
+        "--spans",
+        action="store_true",
+        help="Time prompts, LLM calls, JSON parsing, actions and writes per round.",
+    )
+    llm_parser.add_argument(
+        "--profile",
+        choices=PROFILERS,
+        default=None,
+        help="Profile each run (the whole sweep when runs interleave) next to its log.",
+    )
+    llm_parser.add_argument(
+        "--trace-file",
+        type=Path,
+        default=None,
+        help="Append OTLP/JSON traces (run, round, decision, HTTP attempt spans) to this file.",
+    )
+    llm_parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable debug logging.",
+    )
+
+    sweep_parser = subparsers.add_parser(
+        "sweep", help="Run the missing runs of a YAML/TOML sweep file, largest N first."
+    )
+    sweep_parser.add_argument("spec", type=Path, help="Sweep file (.toml, .yaml or .yml).")
+    sweep_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the job plan without running it or writing the manifest.",
+    )
+    sweep_parser.add_argument(
+        "--run-sets",
+        type=Path,
+        default=Path(DEFAULT_RUN_SETS_PATH),
+        help="Run set index the sweep registers in (read by the results pages).",
+    )
+    sweep_parser.add_argument(
+        "--spans",
+        action="store_true",
+        help="Time prompts, LLM calls, JSON parsing, actions and writes per round.",
+    )
+    sweep_parser.add_argument(
+        "--profile",
+        choices=PROFILERS,
+        default=None,
+        help="Profile each run (the whole sweep when runs interleave) next to its log.",
+    )
+    sweep_parser.add_argument(
+        "--trace-file",
+        type=Path,
+        default=None,
+        help="Append OTLP/JSON traces (run, round, decision, HTTP attempt spans) to this file.",
+    )
+    sweep_parser.add_argument(
+        "--status-file",
+        type=Path,
+        default=None,
+        help="Rewrite live sweep metrics (runs, rounds, rates, latency, ETA) to this JSON file.",
+    )
+    sweep_parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve live sweep metrics on localhost: Prometheus /metrics and JSON /status.",
+    )
+    sweep_parser.add_argument(
+        "--status-interval",
+        type=float,
+        default=DEFAULT_STATUS_INTERVAL,
+        help="Seconds between status file rewrites.",
+    )
+    sweep_parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable debug logging.",
+    )
+
+    plan_parser = subparsers.add_parser(
+        "plan", help="Estimate a sweep's calls, tokens, dollars and wall time from past runs."
+    )
+    plan_parser.add_argument("spec", type=Path, help="Sweep file (.toml, .yaml or .yml).")
+    plan_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Concurrent LLM calls to project wall time at (default: the sweep's own).",
+    )
+    plan_parser.add_argument(
+        "--calibrate",
+        type=str,
+        default=DEFAULT_CALIBRATION_PATTERN,
+        help="Glob of run logs whose token usage and latency calibrate the estimate.",
+    )
+    for budget in ("tokens", "usd", "hours"):
+        plan_parser.add_argument(
+            f"--budget-{budget}",
+            type=float,
+            default=None,
+            help=f"Refuse plans projected over this many {budget} (overrides the sweep's).",
+        )
+    plan_parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable debug logging.",
+    )
+
+    export_parser = subparsers.add_parser(
+        "export", help="Flatten run logs into partitioned Parquet tables (needs pyarrow)."
+    )
+    export_parser.add_argument(
+        "--pattern",
+        type=str,
+        default="runs*/*.json",
+        help="Glob pattern for run JSON logs.",
+    )
+    export_parser.add_argument(
+        "--out-dir",
+        type=Path,
+        default=Path("results/parquet"),
+        help="Directory for the messages/events/exchange_* tables (replaced on export).",
+    )
+    export_parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable debug logging.",
+    )
+
+    results_parser = subparsers.add_parser("results", help="Regenerate committed results.")
+    results_commands = results_parser.add_subparsers(dest="results_command", required=True)
+    build_parser = results_commands.add_parser(
+        "build",
+        help="Rebuild results/ tables, pages and figures whose inputs changed.",
+    )
+    build_parser.add_argument(
+        "--results-dir",
+        type=Path,
+        default=Path("results"),
+        help="Directory holding the committed results artifacts.",
+    )
+    build_parser.add_argument(
+        "--state",
+        type=Path,
+        default=Path(DEFAULT_STATE_PATH),
+        help="JSON file recording each target's input fingerprint from its last build.",
+    )
+    build_parser.add_argument(
+        "--only",
+        nargs="+",
+        default=None,
+        help="Only consider these targets (e.g. showcase_overview results_pages).",
+    )
+    build_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild every target whose inputs exist, even if unchanged.",
+    )
+    build_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report stale targets without building them.",
+    )
+    build_parser.add_argument("--showcase-n", type=int, default=8, help="N for the showcase.")
+    build_parser.add_argument(
+        "--showcase-rounds-cap", type=int, default=8, help="Round cap R for the showcase."
+    )
+    build_parser.add_argument(
+        "--showcase-model", type=str, default=DEFAULT_MODEL, help="Model for the showcase."
+    )
+    build_parser.add_argument(
         "--verbose",
         action="store_true",
         help="Enable debug logging.",
@@ -219,35 +631,223 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def run_command(args: argparse.Namespace, instrumentation: Instrumentation) -> None:
+    """Dispatch `run`, `sweep` and `llm-live` to the serial, interleaved or batch drivers."""
+    if args.command == "llm-live":
+        (spec,) = sweep_specs(
+            [args.condition],
+            [args.n],
+            [args.seed],
+            args.rounds,
+            args.history_limit,
+            args.model,
+            _option_values(args),
+        )
+        run_experiment(
+            spec,
+            output_dir=args.output_dir,
+            async_rounds=args.async_rounds,
+            log_format=args.log_format,
+            profile=args.profile,
+            instrumentation=instrumentation,
+        )
+        return
+
+    sweep: Optional[Tuple[SweepConfig, List[SweepJob]]] = None
+    if args.command == "sweep":
+        sweep = plan_sweep_command(args)
+        if sweep is None:
+            return
+        specs = [job.spec for job in sweep[1] if not job.exists]
+    else:
+        if args.async_rounds and args.batch:
+            raise ValueError("--async-rounds cannot be combined with --batch")
+        if args.async_rounds and "central_planner" in args.conditions:
+            raise ValueError("--async-rounds needs LLM agents; central_planner has none")
+        specs = sweep_specs(
+            args.conditions,
+            args.n_values,
+            range(args.seeds),
+            args.rounds,
+            args.history_limit,
+            args.model,
+            _option_values(args),
+        )
+
+    def execute() -> None:
+        if specs:
+            run_sweep(specs, args, instrumentation)
+        if sweep is not None and sweep[0].adaptive:
+            run_adaptive_sweep(*sweep, args, instrumentation)
+
+    if args.status_file is None and args.metrics_port is None:
+        execute()
+        return
+    # Adaptive seeds are not known up front, so the ETA only covers the planned runs.
+    instrumentation.monitor = SweepMonitor(
+        planned_runs=len(specs),
+        planned_decisions=sum(decision_budget(spec.n_agents, spec.rounds) for spec in specs),
+    )
+    with instrumentation.monitor.serve(args.status_file, args.metrics_port, args.status_interval):
+        execute()
+
+
+def plan_sweep_command(args: argparse.Namespace) -> Optional[Tuple[SweepConfig, List[SweepJob]]]:
+    """Plan `sweep` and record its manifest; None on `--dry-run`.
+
+    Sets the `run` options the sweep file chooses (backend, concurrency, output) on `args`.
+    """
+    config = load_sweep(args.spec)
+    jobs = plan_sweep(config)
+    check_budget(config, jobs)
+    if has_cost_budget(config):
+        estimate_command(config, jobs)
+    pending = [job for job in jobs if not job.exists]
+    logging.info(
+        json.dumps(
+            {
+                "event": "sweep_plan",
+                "run_set": config.run_set,
+                "jobs": len(jobs),
+                "existing": len(jobs) - len(pending),
+                "pending": [job.log_stem for job in pending],
+                "estimated_decisions": sum(job.estimated_decisions for job in pending),
+                "adaptive": config.adaptive or None,
+            }
+        )
+    )
+    if args.dry_run:
+        return None
+    manifest = write_manifest(config, jobs)
+    register_run_set(config, args.run_sets)
+    logging.info(json.dumps({"event": "sweep_manifest", "manifest": str(manifest)}))
+    args.output_dir = config.output_dir
+    args.log_format = config.log_format
+    args.concurrency = config.concurrency if config.backend in ("concurrent", "async") else 1
+    args.async_rounds = config.backend == "async"
+    args.batch = config.backend == "batch"
+    args.batch_dir = None
+    args.batch_poll_interval = config.batch_poll_interval
+    return config, jobs
+
+
+def estimate_command(
+    config: SweepConfig,
+    jobs: Sequence[SweepJob],
+    concurrency: Optional[int] = None,
+    calibration_pattern: str = DEFAULT_CALIBRATION_PATTERN,
+) -> None:
+    """Log the sweep's projected cost, then refuse it if that is over its budget."""
+    estimate = estimate_sweep(config, jobs, calibrate(config, calibration_pattern), concurrency)
+    logging.info(
+        json.dumps({"event": "sweep_estimate", "run_set": config.run_set, **estimate.to_dict()})
+    )
+    check_cost_budget(config, estimate)
+
+
+def plan_command(args: argparse.Namespace) -> None:
+    """Estimate a sweep file without running it; `--budget-*` override its `[budget]`."""
+    config = load_sweep(args.spec)
+    for budget in ("tokens", "usd", "hours"):
+        limit = getattr(args, f"budget_{budget}")
+        if limit is not None:
+            config.budget[budget] = limit
+    jobs = plan_sweep(config)
+    check_budget(config, jobs)
+    estimate_command(config, jobs, args.concurrency, args.calibrate)
+
+
+def run_adaptive_sweep(
+    config: SweepConfig,
+    jobs: List[SweepJob],
+    args: argparse.Namespace,
+    instrumentation: Instrumentation,
+) -> None:
+    """Add seeds where the success-rate CI is widest, within what the grid left of the budget."""
+    from .adaptive import run_adaptive
+
+    limit = config.budget.get("decisions")
+    budget_left = None
+    if limit is not None:
+        budget_left = limit - sum(job.estimated_decisions for job in jobs if not job.exists)
+    rounds = run_adaptive(
+        config, lambda specs: run_sweep(specs, args, instrumentation), budget_left=budget_left
+    )
+    write_manifest(config, jobs, adaptive_rounds=rounds)
+
+
+def run_sweep(
+    specs: Sequence[SimulationSpec], args: argparse.Namespace, instrumentation: Instrumentation
+) -> None:
+    """Run every spec of `run` on the driver its options select."""
+    if args.batch:
+        run_batch_sweep(
+            specs,
+            output_dir=args.output_dir,
+            batch_dir=args.batch_dir or args.output_dir / "batch",
+            poll_interval=args.batch_poll_interval,
+            log_format=args.log_format,
+            profile=args.profile,
+            instrumentation=instrumentation,
+        )
+        return
+    if args.concurrency > 1 and not args.async_rounds:
+        run_concurrent_sweep(
+            specs,
+            output_dir=args.output_dir,
+            concurrency=args.concurrency,
+            log_format=args.log_format,
+            profile=args.profile,
+            instrumentation=instrumentation,
+        )
+        return
+    clients = _model_clients(specs)
+    for spec in specs:
+        run_experiment(
+            spec,
+            output_dir=args.output_dir,
+            async_rounds=args.async_rounds,
+            concurrency=args.concurrency,
+            log_format=args.log_format,
+            profile=args.profile,
+            instrumentation=instrumentation,
+            llm_client=clients[spec.model],
+        )
+
+
 def main() -> None:
+    # Subcommand modules with heavy dependencies (pandas, matplotlib, openai) are imported
+    # at dispatch, so `--help` and offline commands start without them.
     args = parse_args()
-    load_dotenv()
     configure_logging(args.verbose)
 
-    if args.command == "run":
-        seeds = list(range(args.seeds))
-        for condition in args.conditions:
-            for n in args.n_values:
-                for seed in seeds:
-                    run_experiment(
-                        condition=condition,
-                        n=n,
-                        seed=seed,
-                        rounds=args.rounds,
-                        history_limit=args.history_limit,
-                        model=args.model,
-                        output_dir=args.output_dir,
-                    )
-    elif args.command == "llm-live":
-        run_experiment(
-            condition=args.condition,
-            n=args.n,
-            seed=args.seed,
-            rounds=args.rounds,
-            history_limit=args.history_limit,
-            model=args.model,
-            output_dir=args.output_dir,
+    if args.command in ("run", "llm-live", "sweep"):
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        instrumentation = Instrumentation(
+            span_recorders=[] if args.spans else None,
+            traces=TraceExporter(args.trace_file) if args.trace_file else None,
+        )
+        try:
+            run_command(args, instrumentation)
+        finally:
+            # Summaries and traces also cover sweeps that stop early.
+            instrumentation.close()
+    elif args.command == "plan":
+        plan_command(args)
+    elif args.command == "export":
+        from .export import export_runs
+
+        export_runs(args.pattern, args.out_dir)
+    elif args.command == "results":
+        targets = results_targets(
+            args.results_dir,
+            showcase_n=args.showcase_n,
+            showcase_rounds_cap=args.showcase_rounds_cap,
+            showcase_model=args.showcase_model,
         )
+        build_targets(targets, args.state, force=args.force, dry_run=args.dry_run, only=args.only)
     else:
         raise ValueError(f"Unknown command {args.command}")
 
@@ -0,0 +1,304 @@
+"""Flatten run logs into partitioned Parquet tables for columnar queries.
+
+Four tables are written under the output directory, each partitioned Hive-style by
+`condition` and `N` (e.g. `messages/condition=barter/N=5/part-0.parquet`):
+
+- `messages`: one row per protocol message, with the common payload fields as columns.
+- `events`: one row per simulation event.
+- `exchange_price_history`: one row per (step, good) posted price.
+- `exchange_round_metrics`: one row per Exchange round.
+
+Agent, good and action ids are dictionary-encoded. Fields without a dedicated column are kept
+as compact JSON in `payload_json` / `detail_json`. Requires the optional `pyarrow` dependency.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .logstream import log_paths, log_stem, open_log
+
+logger = logging.getLogger(__name__)
+
+TABLES = ("messages", "events", "exchange_price_history", "exchange_round_metrics")
+PARTITION_COLUMNS = ["condition", "N"]
+
+# (column, type) pairs; "id" columns are dictionary-encoded strings.
+_RUN_COLUMNS: List[Tuple[str, str]] = [
+    ("run_id", "id"),
+    ("run_set", "id"),
+    ("condition", "str"),
+    ("N", "int"),
+    ("seed", "int"),
+]
+_SCHEMAS: Dict[str, List[Tuple[str, str]]] = {
+    "messages": _RUN_COLUMNS
+    + [
+        ("round", "int"),
+        ("message_id", "str"),
+        ("sender", "id"),
+        ("receiver", "id"),
+        ("action", "id"),
+        ("to", "id"),
+        ("give", "id"),
+        ("receive", "id"),
+        ("good", "id"),
+        ("quantity", "int"),
+        ("price", "float"),
+        ("side", "id"),
+        ("of_message_id", "str"),
+        ("payload_json", "str"),
+    ],
+    "events": _RUN_COLUMNS
+    + [
+        ("round", "int"),
+        ("clock", "float"),
+        ("event", "id"),
+        ("agent", "id"),
+        ("sender", "id"),
+        ("receiver", "id"),
+        ("action", "id"),
+        ("give", "id"),
+        ("receive", "id"),
+        ("message_id", "str"),
+        ("proposal_id", "str"),
+        ("reason", "str"),
+        ("detail_json", "str"),
+    ],
+    "exchange_price_history": _RUN_COLUMNS
+    + [
+        ("step", "int"),
+        ("good", "id"),
+        ("price", "float"),
+    ],
+    "exchange_round_metrics": _RUN_COLUMNS
+    + [
+        ("round", "int"),
+        ("inbox_total", "int"),
+        ("outbox_total", "int"),
+        ("price_update_count", "int"),
+        ("price_total_abs_change", "float"),
+        ("inbox_by_action_json", "str"),
+        ("outbox_by_action_json", "str"),
+    ],
+}
+_MESSAGE_FIELDS = ("to", "give", "receive", "good", "quantity", "price", "side", "of_message_id")
+_EVENT_FIELDS = ("agent", "sender", "receiver", "give", "receive", "message_id", "proposal_id")
+
+
+def table_columns(name: str) -> List[str]:
+    return [column for column, _ in _SCHEMAS[name]]
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise RuntimeError(
+            "Parquet export needs pyarrow: pip install 'agentic-economy[parquet]'"
+        ) from exc
+    return pyarrow
+
+
+def _compact(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=True, separators=(",", ":"), sort_keys=True)
+
+
+def as_scalar(value: Any) -> Any:
+    # Free-form LLM output can put lists or dicts where a scalar is expected.
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return _compact(value)
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _as_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_str(value: Any) -> Optional[str]:
+    scalar = as_scalar(value)
+    return None if scalar is None else str(scalar)
+
+
+# Values taken from free-form payloads are converted to their column's type as they are
+# flattened (`"quantity": "1"`, `"to": 3`); a value that does not convert becomes null.
+_CONVERTERS = {"id": _as_str, "str": _as_str, "int": _as_int, "float": _as_float}
+
+
+def _typed(table: str) -> Dict[str, Any]:
+    """Column -> converter to its schema type."""
+    return {column: _CONVERTERS[kind] for column, kind in _SCHEMAS[table]}
+
+
+Columns = Dict[str, List[Any]]
+
+
+def flatten_run(
+    data: Dict[str, Any], run_id: str, run_set: str, include_json: bool = True
+) -> Dict[str, Columns]:
+    """Return each export table for one decoded run log as a mapping of column lists.
+
+    `include_json=False` skips the `*_json` catch-all columns, which only the export needs.
+    """
+    tables: Dict[str, Columns] = {
+        name: {
+            column: []
+            for column in table_columns(name)
+            if include_json or not column.endswith("_json")
+        }
+        for name in TABLES
+    }
+
+    messages = tables["messages"]
+    as_message = _typed("messages")
+    for message in data.get("messages") or []:
+        if not isinstance(message, dict):
+            continue
+        payload = message.get("payload") or {}
+        if not isinstance(payload, dict):
+            payload = {"value": payload}
+        messages["round"].append(_as_int(message.get("round")))
+        for key in ("message_id", "sender", "receiver"):
+            messages[key].append(as_message[key](message.get(key)))
+        messages["action"].append(_as_str(payload.get("action")))
+        for key in _MESSAGE_FIELDS:
+            messages[key].append(as_message[key](payload.get(key)))
+        if include_json:
+            messages["payload_json"].append(_compact(payload))
+
+    events = tables["events"]
+    as_event = _typed("events")
+    for event in data.get("events") or []:
+        if not isinstance(event, dict):
+            continue
+        action = event.get("action")
+        events["round"].append(_as_int(event.get("round")))
+        events["clock"].append(_as_float(event.get("clock")))
+        events["event"].append(_as_str(event.get("event")))
+        events["action"].append(
+            _as_str(action.get("action") if isinstance(action, dict) else action)
+        )
+        events["reason"].append(_as_str(event.get("reason")))
+        for key in _EVENT_FIELDS:
+            events[key].append(as_event[key](event.get(key)))
+        if include_json:
+            events["detail_json"].append(_compact(event))
+
+    prices = tables["exchange_price_history"]
+    for step, posted in enumerate(data.get("exchange_price_history") or []):
+        if not isinstance(posted, dict):
+            continue
+        for good, price in posted.items():
+            prices["step"].append(step)
+            prices["good"].append(str(good))
+            prices["price"].append(_as_float(price))
+
+    metrics = tables["exchange_round_metrics"]
+    for metric in data.get("exchange_round_metrics") or []:
+        if not isinstance(metric, dict):
+            continue
+        metrics["round"].append(_as_int(metric.get("round")))
+        for key in ("inbox_total", "outbox_total", "price_update_count"):
+            metrics[key].append(_as_int(metric.get(key, 0)))
+        metrics["price_total_abs_change"].append(
+            _as_float(metric.get("price_total_abs_change", 0.0))
+        )
+        if include_json:
+            metrics["inbox_by_action_json"].append(_compact(metric.get("inbox_by_action") or {}))
+            metrics["outbox_by_action_json"].append(_compact(metric.get("outbox_by_action") or {}))
+
+    run = {
+        "run_id": run_id,
+        "run_set": run_set,
+        "condition": str(data.get("condition", "unknown")),
+        "N": int(data.get("N", 0)),
+        "seed": int(data.get("seed", 0)),
+    }
+    for columns in tables.values():
+        length = max(len(values) for values in columns.values())
+        for name, value in run.items():
+            columns[name] = [value] * length
+    return tables
+
+
+def _arrow_schema(pa: Any, columns: Sequence[Tuple[str, str]]) -> Any:
+    types = {
+        "id": pa.dictionary(pa.int32(), pa.string()),
+        "str": pa.string(),
+        "int": pa.int64(),
+        "float": pa.float64(),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in columns])
+
+
+def export_runs(pattern: str, out_dir: Path) -> Dict[str, int]:
+    """Export every run log matching `pattern`; returns the row count of each table.
+
+    Existing tables under `out_dir` are replaced.
+    """
+    pa = _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    merged: Dict[str, Columns] = {
+        name: {column: [] for column in table_columns(name)} for name in TABLES
+    }
+    paths = log_paths(pattern)
+    for path in paths:
+        log_path = Path(path)
+        with open_log(log_path) as handle:
+            data = json.load(handle)
+        run_set = log_path.parent.name
+        flattened = flatten_run(data, f"{run_set}/{log_stem(log_path)}", run_set)
+        for name in TABLES:
+            for column, values in flattened[name].items():
+                merged[name][column].extend(values)
+
+    counts: Dict[str, int] = {}
+    for name in TABLES:
+        table = pa.Table.from_pydict(merged[name], schema=_arrow_schema(pa, _SCHEMAS[name]))
+        table_dir = out_dir / name
+        if table_dir.exists():
+            shutil.rmtree(table_dir)
+        table_dir.mkdir(parents=True)
+        if table.num_rows:
+            pq.write_to_dataset(
+                table,
+                root_path=str(table_dir),
+                partition_cols=PARTITION_COLUMNS,
+                basename_template="part-{i}.parquet",
+            )
+        counts[name] = table.num_rows
+
+    logger.info(
+        json.dumps({"event": "export_complete", "runs": len(paths), "out_dir": str(out_dir)})
+    )
+    return counts
+
+
+def load_table(
+    out_dir: Path, name: str, filters: Optional[List[Tuple[str, str, Any]]] = None
+) -> pd.DataFrame:
+    """Read an exported table, pushing `filters` (pyarrow DNF tuples) down to the files."""
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    table_dir = out_dir / name
+    if not any(table_dir.rglob("*.parquet")):
+        return pd.DataFrame(columns=table_columns(name))
+    return pq.read_table(str(table_dir), filters=filters).to_pandas()
@@ -4,13 +4,23 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import time
 from typing import Any, Dict, List, Optional, Sequence, cast
 
-from openai import APIError, APITimeoutError, OpenAI, RateLimitError
-
 logger = logging.getLogger(__name__)
 
+USAGE_FIELDS = ("input_tokens", "output_tokens")
+
+
+def usage_counts(usage: Any) -> Dict[str, int]:
+    """Token counts from a responses API `usage` object or its JSON form (missing -> 0)."""
+    if usage is None:
+        return {}
+    if isinstance(usage, dict):
+        return {key: int(usage.get(key) or 0) for key in USAGE_FIELDS}
+    return {key: int(getattr(usage, key, 0) or 0) for key in USAGE_FIELDS}
+
 
 class LLMClient:
     def __init__(
@@ -20,15 +30,48 @@ class LLMClient:
         retry_delay: float = 1.0,
         client: Optional[Any] = None,
     ):
-        self._client = client or OpenAI()
+        if client is None:
+            # openai takes most of a second to import; only live runs construct a real client.
+            from openai import OpenAI
+
+            client = OpenAI()
+        self._client = client
         self.model = model
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        # Usage is per thread: a shared client serves concurrent runs from a thread pool.
+        self._local = threading.local()
+
+    @property
+    def last_usage(self) -> Dict[str, int]:
+        """Token usage of the last successful call made from the current thread."""
+        usage: Dict[str, int] = getattr(self._local, "usage", {})
+        return usage
+
+    @property
+    def last_parse_seconds(self) -> float:
+        """Time `_extract_json` took in the last successful call from the current thread."""
+        seconds: float = getattr(self._local, "parse_seconds", 0.0)
+        return seconds
+
+    @property
+    def last_attempts(self) -> List[Dict[str, Any]]:
+        """HTTP attempts of the last call from the current thread.
+
+        Each has its wall-clock start (`started_ns`), `seconds` and `error` (None on success).
+        """
+        attempts: List[Dict[str, Any]] = getattr(self._local, "attempts", [])
+        return attempts
 
     def complete_json(self, messages: Sequence[Dict[str, str]]) -> Dict[str, Any]:
         """Call the responses API and parse a JSON object."""
+        from openai import APIError, APITimeoutError, RateLimitError
+
         attempt = 0
+        attempts: List[Dict[str, Any]] = []
+        self._local.attempts = attempts
         while True:
+            started_ns, started = time.time_ns(), time.perf_counter()
             try:
                 input_messages: List[Dict[str, str]] = list(messages)
                 response = self._client.responses.create(
@@ -36,8 +79,26 @@ class LLMClient:
                     input=cast(Any, input_messages),
                     text={"format": {"type": "json_object"}},
                 )
-                return self._extract_json(response)
+                attempts.append(
+                    {
+                        "started_ns": started_ns,
+                        "seconds": time.perf_counter() - started,
+                        "error": None,
+                    }
+                )
+                self._local.usage = usage_counts(getattr(response, "usage", None))
+                parse_started = time.perf_counter()
+                parsed = self._extract_json(response)
+                self._local.parse_seconds = time.perf_counter() - parse_started
+                return parsed
             except (RateLimitError, APITimeoutError) as error:
+                attempts.append(
+                    {
+                        "started_ns": started_ns,
+                        "seconds": time.perf_counter() - started,
+                        "error": type(error).__name__,
+                    }
+                )
                 if attempt >= self.max_retries:
                     raise
                 logger.warning(
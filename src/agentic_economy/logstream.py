@@ -0,0 +1,166 @@
+"""Reading and writing run log files, including large and compressed ones.
+
+`open_log` opens `.json`, `.json.gz` and `.json.zst` logs as text streams, (de)compressing on
+the fly; zstd needs the optional `zstandard` package.
+
+`scan_log` walks the top-level JSON object of a run log and decodes selected arrays one item
+at a time, so memory stays bounded by the largest single item rather than the whole file.
+Only the standard library decoder is used: values are decoded with `raw_decode` from a
+sliding text buffer that grows when a value straddles a chunk boundary.
+"""
+
+from __future__ import annotations
+
+import glob
+import gzip
+import io
+import json
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, List, Mapping
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+_WHITESPACE = " \t\n\r"
+
+LOG_FORMATS = ("json", "json.gz", "json.zst")
+COMPRESSED_SUFFIXES = (".gz", ".zst")
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def _require_zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise RuntimeError(
+            "zstd run logs need zstandard: pip install 'agentic-economy[zstd]'"
+        ) from exc
+    return zstandard
+
+
+def open_log(path: Path, mode: str = "r") -> IO[str]:
+    """Open a run log for text reading ("r") or writing ("w"), compressed by suffix."""
+    if mode not in ("r", "w"):
+        raise ValueError(f"Unsupported mode {mode!r}")
+    if path.suffix == ".gz":
+        if mode == "r":
+            return gzip.open(path, "rt", encoding="utf-8")
+        return gzip.open(path, "wt", encoding="utf-8", compresslevel=GZIP_LEVEL)
+    if path.suffix == ".zst":
+        zstandard = _require_zstandard()
+        raw = path.open(mode + "b")
+        if mode == "r":
+            stream = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        else:
+            stream = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(raw, closefd=True)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return path.open(mode, encoding="utf-8")
+
+
+def log_stem(path: Path) -> str:
+    """File name without the `.json[.gz|.zst]` suffix."""
+    name = path.name
+    for suffix in COMPRESSED_SUFFIXES:
+        name = name.removesuffix(suffix)
+    return name.removesuffix(".json")
+
+
+def log_paths(pattern: str) -> List[str]:
+    """Glob run logs; a pattern ending in `.json` also matches compressed logs."""
+    paths = set(glob.glob(pattern))
+    if pattern.endswith(".json"):
+        for suffix in COMPRESSED_SUFFIXES:
+            paths.update(glob.glob(pattern + suffix))
+    return sorted(paths)
+
+
+class _Reader:
+    def __init__(self, handle: IO[str], chunk_size: int):
+        self.handle = handle
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self, minimum: int) -> bool:
+        if self.eof:
+            return False
+        if self.pos > self.chunk_size:
+            self.buffer = self.buffer[self.pos :]
+            self.pos = 0
+        chunk = self.handle.read(max(minimum, self.chunk_size))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer += chunk
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ("" at EOF)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill(self.chunk_size):
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}, found {found!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Grow geometrically so one large value is not re-decoded quadratically.
+                if not self._fill(len(self.buffer) - self.pos):
+                    raise
+                continue
+            # A number that ends exactly at the buffer edge may continue in the next chunk.
+            if end == len(self.buffer) and self._fill(self.chunk_size):
+                continue
+            self.pos = end
+            return value
+
+
+def scan_log(
+    path: Path,
+    item_handlers: Mapping[str, Callable[[Any], None]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """Stream a run log: items of arrays named in `item_handlers` go to their handler.
+
+    Returns every other top-level field, fully decoded. A handled key whose value is not an
+    array is returned like any other field.
+    """
+    fields: Dict[str, Any] = {}
+    with open_log(path) as handle:
+        reader = _Reader(handle, chunk_size)
+        reader.expect("{")
+        if reader.peek() == "}":
+            return fields
+        while True:
+            key = reader.value()
+            reader.expect(":")
+            handler = item_handlers.get(key)
+            if handler is not None and reader.peek() == "[":
+                reader.expect("[")
+                if reader.peek() != "]":
+                    while True:
+                        handler(reader.value())
+                        if reader.peek() != ",":
+                            break
+                        reader.expect(",")
+                reader.expect("]")
+            else:
+                fields[key] = reader.value()
+            if reader.peek() != ",":
+                break
+            reader.expect(",")
+        reader.expect("}")
+    return fields
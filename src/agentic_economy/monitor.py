@@ -0,0 +1,296 @@
+"""Live progress and capacity metrics for long sweeps.
+
+A `SweepMonitor` is attached to every simulation of a sweep. Simulations report each answered
+decision (latency, tokens and HTTP attempts) through `record_usage`; run progress (in flight,
+current round, finished) is read off the simulations when a snapshot is taken, so the hot
+path only pays for one locked counter update per LLM call.
+
+`serve` rewrites the snapshot to a JSON status file every few seconds (atomically, so
+`watch cat` or `jq` never see a partial file) and can also serve it on localhost, as
+Prometheus text at `/metrics` and JSON at `/status`.
+
+The ETA assumes every remaining run uses its full round cap, so it is an upper bound that
+tightens as runs clear early.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from .llm_client import USAGE_FIELDS
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+    from .simulation import BaseSimulation
+
+logger = logging.getLogger(__name__)
+
+# Latency percentiles and the recent decision rate are taken over the last calls only.
+LATENCY_WINDOW = 2048
+LATENCY_QUANTILES = (0.5, 0.9, 0.99)
+DEFAULT_STATUS_INTERVAL = 10.0
+METRIC_PREFIX = "agentic_economy"
+
+
+def decision_budget(n_agents: int, rounds: int) -> int:
+    """Agent decisions a run makes at most: one per agent per round."""
+    return n_agents * rounds
+
+
+class SweepMonitor:
+    def __init__(self, planned_runs: int, planned_decisions: int) -> None:
+        self.planned_runs = planned_runs
+        self.planned_decisions = planned_decisions
+        self.decisions = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.tokens: Counter[str] = Counter({key: 0 for key in USAGE_FIELDS})
+        self._runs: List[BaseSimulation] = []
+        self._finished: Set[int] = set()
+        # (completed at, latency seconds) of recent decisions.
+        self._latencies: Deque[Tuple[float, float]] = deque(maxlen=LATENCY_WINDOW)
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def track(self, simulation: BaseSimulation) -> BaseSimulation:
+        simulation.monitor = self
+        with self._lock:
+            self._runs.append(simulation)
+        return simulation
+
+    def finish(self, simulation: BaseSimulation) -> None:
+        with self._lock:
+            self._finished.add(id(simulation))
+
+    def record_call(
+        self, seconds: float, tokens: Mapping[str, int], attempts: Sequence[Mapping[str, Any]]
+    ) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            self.decisions += 1
+            for key in USAGE_FIELDS:
+                self.tokens[key] += int(tokens.get(key, 0))
+            self.retries += max(len(attempts) - 1, 0)
+            self.rate_limited += sum(
+                attempt.get("error") == "RateLimitError" for attempt in attempts
+            )
+            self._latencies.append((now, seconds))
+
+    def snapshot(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self._started
+        with self._lock:
+            latencies = list(self._latencies)
+            in_flight = [
+                simulation
+                for simulation in self._runs
+                if id(simulation) not in self._finished and simulation.current_round > 0
+            ]
+            consumed = sum(
+                decision_budget(simulation.n_agents, simulation.rounds)
+                for simulation in self._runs
+                if id(simulation) in self._finished
+            ) + sum(
+                decision_budget(simulation.n_agents, simulation.current_round - 1)
+                for simulation in in_flight
+            )
+            decisions, retries, rate_limited = self.decisions, self.retries, self.rate_limited
+            tokens = dict(self.tokens)
+            finished = len(self._finished)
+
+        recent_rate = None
+        if len(latencies) >= 2 and latencies[-1][0] > latencies[0][0]:
+            recent_rate = (len(latencies) - 1) / (latencies[-1][0] - latencies[0][0])
+        remaining = max(self.planned_decisions - consumed, 0)
+        return {
+            "elapsed_seconds": round(elapsed, 3),
+            "runs_planned": self.planned_runs,
+            "runs_finished": finished,
+            "runs_in_flight": len(in_flight),
+            "runs": [
+                {
+                    "condition": simulation.condition,
+                    "n_agents": simulation.n_agents,
+                    "seed": simulation._seed,
+                    "round": simulation.current_round,
+                    "rounds": simulation.rounds,
+                }
+                for simulation in in_flight
+            ],
+            "decisions": decisions,
+            "decisions_per_second": _rate(decisions, elapsed),
+            "decisions_per_second_recent": None if recent_rate is None else round(recent_rate, 3),
+            "llm_latency_seconds": _quantiles(sorted(seconds for _, seconds in latencies)),
+            "llm_retries": retries,
+            "llm_rate_limited": rate_limited,
+            "tokens": tokens,
+            "tokens_per_second": {key: _rate(value, elapsed) for key, value in tokens.items()},
+            "eta_seconds": round(elapsed * remaining / consumed, 1) if consumed else None,
+        }
+
+    @contextmanager
+    def serve(
+        self,
+        status_path: Optional[Path] = None,
+        port: Optional[int] = None,
+        interval: float = DEFAULT_STATUS_INTERVAL,
+    ) -> Iterator[Optional[int]]:
+        """Publish snapshots while the block runs; the status file ends on a final snapshot.
+
+        Yields the port metrics are served on (`port=0` picks a free one), or None.
+        """
+        stop = threading.Event()
+        threads: List[threading.Thread] = []
+        server: Optional[ThreadingHTTPServer] = None
+        bound_port: Optional[int] = None
+        if status_path is not None:
+
+            def rewrite() -> None:
+                while not stop.wait(interval):
+                    write_status(self.snapshot(), status_path)
+
+            threads.append(threading.Thread(target=rewrite, name="sweep-status", daemon=True))
+        if port is not None:
+            from http.server import ThreadingHTTPServer
+
+            server = ThreadingHTTPServer(("127.0.0.1", port), _handler(self))
+            bound_port = server.server_address[1]
+            threads.append(
+                threading.Thread(target=server.serve_forever, name="sweep-metrics", daemon=True)
+            )
+            logger.info(
+                json.dumps(
+                    {"event": "metrics_serving", "url": f"http://127.0.0.1:{bound_port}/metrics"}
+                )
+            )
+        for thread in threads:
+            thread.start()
+        try:
+            yield bound_port
+        finally:
+            stop.set()
+            if server is not None:
+                server.shutdown()
+                server.server_close()
+            for thread in threads:
+                thread.join()
+            if status_path is not None:
+                write_status(self.snapshot(), status_path)
+
+
+def _rate(count: float, elapsed: float) -> float:
+    return round(count / elapsed, 3) if elapsed > 0 else 0.0
+
+
+def _quantiles(latencies: Sequence[float]) -> Dict[str, Optional[float]]:
+    """Nearest-rank percentiles of sorted latencies (None before the first call)."""
+    return {
+        f"p{round(q * 100)}": (
+            round(latencies[min(int(q * len(latencies)), len(latencies) - 1)], 3)
+            if latencies
+            else None
+        )
+        for q in LATENCY_QUANTILES
+    }
+
+
+def write_status(snapshot: Mapping[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    scratch = path.with_name(path.name + ".tmp")
+    scratch.write_text(json.dumps(snapshot, indent=2) + "\n", encoding="utf-8")
+    os.replace(scratch, path)
+
+
+def prometheus_text(snapshot: Mapping[str, Any]) -> str:
+    """A snapshot in the Prometheus text exposition format."""
+    lines: List[str] = []
+
+    def metric(name: str, kind: str, samples: Sequence[Tuple[str, Any]]) -> None:
+        lines.append(f"# TYPE {METRIC_PREFIX}_{name} {kind}")
+        for labels, value in samples:
+            if value is not None:
+                lines.append(f"{METRIC_PREFIX}_{name}{labels} {value}")
+
+    metric("elapsed_seconds", "gauge", [("", snapshot["elapsed_seconds"])])
+    metric("runs_planned", "gauge", [("", snapshot["runs_planned"])])
+    metric("runs_finished", "gauge", [("", snapshot["runs_finished"])])
+    metric("runs_in_flight", "gauge", [("", snapshot["runs_in_flight"])])
+    metric(
+        "run_round",
+        "gauge",
+        [
+            (
+                f'{{condition="{run["condition"]}",n_agents="{run["n_agents"]}",'
+                f'seed="{run["seed"]}"}}',
+                run["round"],
+            )
+            for run in snapshot["runs"]
+        ],
+    )
+    metric("decisions_total", "counter", [("", snapshot["decisions"])])
+    metric("decisions_per_second", "gauge", [("", snapshot["decisions_per_second_recent"])])
+    metric(
+        "llm_latency_seconds",
+        "summary",
+        [
+            (f'{{quantile="{int(key[1:]) / 100}"}}', value)
+            for key, value in snapshot["llm_latency_seconds"].items()
+        ],
+    )
+    metric("llm_retries_total", "counter", [("", snapshot["llm_retries"])])
+    metric("llm_rate_limited_total", "counter", [("", snapshot["llm_rate_limited"])])
+    metric(
+        "tokens_total",
+        "counter",
+        [(f'{{kind="{key}"}}', value) for key, value in snapshot["tokens"].items()],
+    )
+    metric("eta_seconds", "gauge", [("", snapshot["eta_seconds"])])
+    return "\n".join(lines) + "\n"
+
+
+def _handler(monitor: SweepMonitor) -> type:
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming
+            if self.path == "/metrics":
+                body = prometheus_text(monitor.snapshot())
+                content_type = "text/plain; version=0.0.4"
+            elif self.path == "/status":
+                body = json.dumps(monitor.snapshot(), indent=2)
+                content_type = "application/json"
+            else:
+                self.send_error(404)
+                return
+            payload = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            # Scrapes every few seconds would drown the sweep's own log lines.
+            pass
+
+    return MetricsHandler
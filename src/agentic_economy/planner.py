@@ -0,0 +1,217 @@
+"""Sweep cost estimates: LLM calls, tokens, dollars and wall time before anything runs.
+
+Calls per run follow each condition's call pattern (`calls_per_round`: one per agent per
+round, plus one hub call for money_exchange) over the full round cap, so they are upper
+bounds: runs stop early once every agent holds its target. Tokens and latency per call are
+calibrated from the `usage` and `timing` recorded in existing run logs of the sweep's model,
+per condition where there are any, then from the model's other conditions, then from
+`DEFAULT_CALL_COST`. Wall time follows the backend the sweep runs on:
+
+- one call at a time (serial, concurrency 1): the sum of all call latencies;
+- a shared pool of `concurrency` workers: the summed latency over the workers, but never
+  less than the longest run's critical path (rounds x sequential phases x latency);
+- async rounds: runs one after another, each on its own workers;
+- batch: not estimated, as it depends on the provider's batch turnaround.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from .simulation import CONDITIONS
+from .sweep import SweepConfig, SweepJob
+
+DEFAULT_CALIBRATION_PATTERN = "runs*/*.json"
+# USD per million input / output tokens; a sweep's `prices` table overrides these.
+MODEL_PRICES: Dict[str, Dict[str, float]] = {
+    "gpt-5": {"input": 1.25, "output": 10.0},
+    "gpt-5-mini": {"input": 0.25, "output": 2.0},
+    "gpt-5-nano": {"input": 0.05, "output": 0.4},
+}
+# The batch API bills half the synchronous price.
+BATCH_DISCOUNT = 0.5
+
+
+@dataclass
+class CallCost:
+    input_tokens: float
+    output_tokens: float
+    seconds: float
+    # Calls the averages come from (0 for the built-in default) and which logs they were.
+    calls: int = 0
+    source: str = "default"
+
+
+DEFAULT_CALL_COST = CallCost(input_tokens=1500.0, output_tokens=400.0, seconds=5.0)
+
+
+def _average(rows: Any, source: str) -> CallCost:
+    calls = float(rows["llm_calls"].sum())
+    return CallCost(
+        input_tokens=float(rows["input_tokens"].sum()) / calls,
+        output_tokens=float(rows["output_tokens"].sum()) / calls,
+        seconds=float(rows["llm_seconds"].sum()) / calls,
+        calls=int(calls),
+        source=source,
+    )
+
+
+def calibrate(
+    config: SweepConfig,
+    pattern: str = DEFAULT_CALIBRATION_PATTERN,
+    index_path: Optional[str] = None,
+) -> Dict[str, CallCost]:
+    """Mean tokens and latency per call of each condition of the sweep, from past run logs.
+
+    `index_path` defaults to the summary index `make results-*` use.
+    """
+    from . import analysis
+
+    runs = analysis.load_runs(pattern, index_path=index_path or analysis.DEFAULT_INDEX_PATH)
+    usage_columns = ["llm_calls", "input_tokens", "output_tokens", "llm_seconds"]
+    costs = {condition: DEFAULT_CALL_COST for condition in config.conditions}
+    if runs.empty or any(column not in runs.columns for column in usage_columns):
+        return costs
+    measured = runs.dropna(subset=usage_columns)
+    measured = measured[(measured["model"] == config.model) & (measured["llm_calls"] > 0)]
+    if measured.empty:
+        return costs
+
+    suffix = "_async" if config.backend == "async" else ""
+    for condition in config.conditions:
+        # Asynchronous logs first when the sweep is asynchronous, then synchronous ones.
+        for logged in dict.fromkeys([condition + suffix, condition]):
+            rows = measured[measured["condition"] == logged]
+            if len(rows):
+                costs[condition] = _average(rows, logged)
+                break
+        else:
+            costs[condition] = _average(measured, f"{config.model} (all conditions)")
+    return costs
+
+
+@dataclass
+class SweepEstimate:
+    runs: int
+    calls: int
+    input_tokens: float
+    output_tokens: float
+    # None when the model has no known price.
+    usd: Optional[float]
+    # None for batch sweeps.
+    wall_seconds: Optional[float]
+    concurrency: int
+    costs: Dict[str, CallCost]
+
+    @property
+    def tokens(self) -> float:
+        return self.input_tokens + self.output_tokens
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "calls": self.calls,
+            "input_tokens": round(self.input_tokens),
+            "output_tokens": round(self.output_tokens),
+            "tokens": round(self.tokens),
+            "usd": None if self.usd is None else round(self.usd, 2),
+            "wall_hours": None if self.wall_seconds is None else round(self.wall_seconds / 3600, 2),
+            "concurrency": self.concurrency,
+            "per_call": {condition: asdict(cost) for condition, cost in self.costs.items()},
+        }
+
+
+def model_prices(config: SweepConfig) -> Optional[Mapping[str, float]]:
+    """USD per million input / output tokens of the sweep's model; None when unknown."""
+    return config.prices or MODEL_PRICES.get(config.model)
+
+
+def estimate_sweep(
+    config: SweepConfig,
+    jobs: Sequence[SweepJob],
+    costs: Mapping[str, CallCost],
+    concurrency: Optional[int] = None,
+) -> SweepEstimate:
+    """Project the pending jobs of a sweep; `concurrency` defaults to the one it runs with."""
+    if concurrency is None:
+        concurrency = config.concurrency if config.backend in ("concurrent", "async") else 1
+    calls = 0
+    input_tokens = output_tokens = 0.0
+    run_seconds: List[float] = []
+    critical_paths: List[float] = []
+    workers: List[int] = []
+    for job in jobs:
+        if job.exists:
+            continue
+        spec = job.spec
+        simulation = CONDITIONS[spec.condition]
+        cost = costs.get(spec.condition, DEFAULT_CALL_COST)
+        run_calls = simulation.calls_per_round(spec.n_agents) * spec.rounds
+        calls += run_calls
+        input_tokens += run_calls * cost.input_tokens
+        output_tokens += run_calls * cost.output_tokens
+        run_seconds.append(run_calls * cost.seconds)
+        critical_paths.append(
+            simulation.phases_per_round(spec.n_agents) * spec.rounds * cost.seconds
+        )
+        # Async runs use `concurrency` workers each, or one per agent when it is 1.
+        workers.append(concurrency if concurrency > 1 else spec.n_agents)
+
+    wall_seconds: Optional[float]
+    if config.backend == "batch":
+        wall_seconds = None
+    elif config.backend == "async":
+        wall_seconds = sum(
+            max(seconds / worker_count, critical)
+            for seconds, critical, worker_count in zip(run_seconds, critical_paths, workers)
+        )
+    elif concurrency > 1:
+        wall_seconds = max(sum(run_seconds) / concurrency, max(critical_paths, default=0.0))
+    else:
+        wall_seconds = sum(run_seconds)
+
+    prices = model_prices(config)
+    usd: Optional[float] = None
+    if prices is not None:
+        usd = (input_tokens * prices["input"] + output_tokens * prices["output"]) / 1e6
+        if config.backend == "batch":
+            usd *= BATCH_DISCOUNT
+    return SweepEstimate(
+        runs=len(run_seconds),
+        calls=calls,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        usd=usd,
+        wall_seconds=wall_seconds,
+        concurrency=concurrency,
+        costs=dict(costs),
+    )
+
+
+def check_cost_budget(config: SweepConfig, estimate: SweepEstimate) -> None:
+    """Refuse a sweep projected past its `[budget]` of tokens, dollars or hours."""
+    over: List[str] = []
+    tokens = config.budget.get("tokens")
+    if tokens is not None and estimate.tokens > tokens:
+        over.append(f"{estimate.tokens:,.0f} tokens (budget {tokens:,.0f})")
+    usd = config.budget.get("usd")
+    if usd is not None:
+        if estimate.usd is None:
+            raise ValueError(
+                f"No price known for model {config.model}; add a `prices` table to the sweep"
+            )
+        if estimate.usd > usd:
+            over.append(f"${estimate.usd:,.2f} (budget ${usd:,.2f})")
+    hours = config.budget.get("hours")
+    # Batch sweeps have no wall-time estimate to hold against an hours budget.
+    if hours is not None and estimate.wall_seconds is not None:
+        if estimate.wall_seconds > hours * 3600:
+            over.append(f"{estimate.wall_seconds / 3600:,.1f} hours (budget {hours:g})")
+    if over:
+        raise ValueError(f"Sweep {config.run_set} is projected at up to {', '.join(over)}")
+
+
+def has_cost_budget(config: SweepConfig) -> bool:
+    """Whether the sweep's budget needs an estimate, not just its decision count."""
+    return any(key in config.budget for key in ("tokens", "usd", "hours"))
@@ -0,0 +1,157 @@
+"""Opt-in timing spans for the phases of a round, and whole-run profiles.
+
+A simulation with a `SpanRecorder` attached times, per round, prompt rendering (`prompts`),
+LLM calls split into the API round trip (`llm_request`) and JSON parsing (`parse_json`, from
+`LLMClient.last_parse_seconds`), and action application (`actions`); the CLI adds run log
+serialization (`write_json`). Without a recorder every span is one shared no-op context
+manager, so the instrumented hot paths cost a None check.
+
+Span seconds are summed over calls, so LLM calls in flight together can add up to more than
+the wall time of the run.
+
+`profiled` wraps a block in cProfile or pyinstrument (optional: `agentic-economy[profile]`)
+and writes the profile to a file.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import threading
+import time
+from collections import Counter
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+PHASES = ("prompts", "llm_request", "parse_json", "actions", "write_json")
+PROFILERS = ("cprofile", "pyinstrument")
+PROFILE_SUFFIXES = {"cprofile": ".prof", "pyinstrument": ".html"}
+
+_NO_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+class SpanRecorder:
+    """Seconds and call counts per phase, with seconds broken down by round."""
+
+    def __init__(self) -> None:
+        self.seconds: Dict[str, List[float]] = {}
+        self.calls: Counter[str] = Counter()
+        # Decisions of one run can complete on several pool threads.
+        self._lock = threading.Lock()
+
+    def add(self, phase: str, round_number: int, seconds: float) -> None:
+        slot = max(round_number, 1) - 1
+        with self._lock:
+            by_round = self.seconds.setdefault(phase, [])
+            if len(by_round) <= slot:
+                by_round.extend([0.0] * (slot + 1 - len(by_round)))
+            by_round[slot] += seconds
+            self.calls[phase] += 1
+
+    @contextmanager
+    def span(self, phase: str, round_number: int) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, round_number, time.perf_counter() - started)
+
+    def by_round(self) -> Dict[str, List[float]]:
+        """Seconds per round for each phase, in `PHASES` order (microsecond precision)."""
+        with self._lock:
+            return {
+                phase: [round(seconds, 6) for seconds in self.seconds[phase]]
+                for phase in sorted(self.seconds, key=_phase_order)
+            }
+
+    def totals(self) -> Dict[str, float]:
+        with self._lock:
+            return {phase: sum(by_round) for phase, by_round in self.seconds.items()}
+
+
+def _phase_order(phase: str) -> int:
+    return PHASES.index(phase) if phase in PHASES else len(PHASES)
+
+
+def timed(
+    recorder: Optional[SpanRecorder], phase: str, round_number: int
+) -> AbstractContextManager[None]:
+    """A span of `phase` in `round_number` on `recorder`; a shared no-op without one."""
+    if recorder is None:
+        return _NO_SPAN
+    return recorder.span(phase, round_number)
+
+
+def flame_summary(recorders: Iterable[SpanRecorder]) -> Dict[str, Any]:
+    """Phase totals over many runs, largest first, with each phase's share of the spans.
+
+    This is the one-level text form of a flame graph for a sweep.
+    """
+    seconds: Counter[str] = Counter()
+    calls: Counter[str] = Counter()
+    runs = 0
+    for recorder in recorders:
+        runs += 1
+        seconds.update(recorder.totals())
+        calls.update(recorder.calls)
+    total = sum(seconds.values())
+    return {
+        "runs": runs,
+        "span_seconds": round(total, 3),
+        "phases": [
+            {
+                "phase": phase,
+                "seconds": round(phase_seconds, 3),
+                "calls": calls[phase],
+                "share": round(phase_seconds / total, 3) if total > 0 else 0.0,
+            }
+            for phase, phase_seconds in seconds.most_common()
+        ],
+    }
+
+
+def _require_pyinstrument() -> Any:
+    try:
+        import pyinstrument
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise RuntimeError(
+            "--profile=pyinstrument needs pyinstrument: pip install 'agentic-economy[profile]'"
+        ) from exc
+    return pyinstrument
+
+
+def profile_path(kind: str, stem: Path) -> Path:
+    return stem.with_name(stem.name + PROFILE_SUFFIXES[kind])
+
+
+@contextmanager
+def profiled(kind: Optional[str], stem: Path) -> Iterator[Optional[Path]]:
+    """Profile the block with `kind` ("cprofile" or "pyinstrument"); None profiles nothing.
+
+    Yields the profile path, `stem` plus `.prof` (pstats, e.g. for snakeviz) or `.html`.
+    Both profilers sample the calling thread only; time spent waiting on pool threads shows
+    up as waits in the driver.
+    """
+    if kind is None:
+        yield None
+        return
+    if kind not in PROFILERS:
+        raise ValueError(f"Unknown profiler {kind}")
+    path = profile_path(kind, stem)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if kind == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield path
+        finally:
+            profiler.disable()
+            profiler.dump_stats(str(path))
+        return
+    sampler = _require_pyinstrument().Profiler()
+    sampler.start()
+    try:
+        yield path
+    finally:
+        sampler.stop()
+        path.write_text(sampler.output_html(), encoding="utf-8")
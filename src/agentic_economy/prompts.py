@@ -3,13 +3,55 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+# Recent messages may arrive pre-serialized (see `AgentState.recent_history_json`).
+RecentMessages = Union[List[Dict[str, Any]], str]
 
 
 def _format_json(data: Any) -> str:
     return json.dumps(data, ensure_ascii=True, separators=(",", ":"))
 
 
+def _format_messages(recent_messages: RecentMessages) -> str:
+    if isinstance(recent_messages, str):
+        return recent_messages
+    return _format_json(recent_messages)
+
+
+def format_history_entry(entry: Dict[str, Any]) -> str:
+    """Encode one history entry exactly as it appears inside a prompt's message array."""
+    return _format_json(entry)
+
+
+def round_header(round_number: int) -> str:
+    return f"Round: {round_number}\n\n"
+
+
+class PromptCache:
+    """Per-agent memo of rendered prompts, keyed on the agent's state version counters.
+
+    User prompts all start with `round_header`; only the body after it is cached, so an agent
+    whose inventory, money and history are unchanged reuses its previous bytes every round.
+    """
+
+    def __init__(self) -> None:
+        self._system: Optional[Tuple[Hashable, str]] = None
+        self._user_body: Optional[Tuple[Hashable, str]] = None
+
+    def system(self, key: Hashable, build: Callable[[], str]) -> str:
+        if self._system is None or self._system[0] != key:
+            self._system = (key, build())
+        return self._system[1]
+
+    def user(self, round_number: int, key: Hashable, build: Callable[[int], str]) -> str:
+        header = round_header(round_number)
+        if self._user_body is None or self._user_body[0] != key:
+            rendered = build(round_number)
+            self._user_body = (key, rendered[len(header) :])
+        return header + self._user_body[1]
+
+
 def barter_system_prompt(agent_name: str, inventory: Dict[str, int], target_good: str) -> str:
     return (
         "You are an autonomous trading agent in a toy barter economy.\n\n"
@@ -93,14 +135,14 @@ def barter_credit_system_prompt(
 
 def barter_user_prompt(
     round_number: int,
-    recent_messages: List[Dict[str, Any]],
+    recent_messages: RecentMessages,
     inventory: Dict[str, int],
     target_good: str,
 ) -> str:
     return (
-        f"Round: {round_number}\n\n"
+        f"{round_header(round_number)}"
         "Your recent messages (up to last 10), as a JSON array of objects:\n"
-        f"{_format_json(recent_messages)}\n\n"
+        f"{_format_messages(recent_messages)}\n\n"
         "Each message object looks like:\n"
         '{"direction":"incoming|outgoing","from":"<agent_name>","to":"<agent_name>",'
         '"message_id":"<id>","round":<int>,"payload":{...}}\n\n'
@@ -115,14 +157,14 @@ def barter_user_prompt(
 
 def barter_credit_user_prompt(
     round_number: int,
-    recent_messages: List[Dict[str, Any]],
+    recent_messages: RecentMessages,
     inventory: Dict[str, int],
     target_good: str,
 ) -> str:
     return (
-        f"Round: {round_number}\n\n"
+        f"{round_header(round_number)}"
         "Your recent messages (up to last 10), as a JSON array of objects:\n"
-        f"{_format_json(recent_messages)}\n\n"
+        f"{_format_messages(recent_messages)}\n\n"
         "Each message object looks like:\n"
         '{"direction":"incoming|outgoing","from":"<agent_name>","to":"<agent_name>",'
         '"message_id":"<id>","round":<int>,"payload":{...}}\n\n'
@@ -176,14 +218,14 @@ def barter_chat_system_prompt(agent_name: str, inventory: Dict[str, int], target
 
 def barter_chat_user_prompt(
     round_number: int,
-    recent_messages: List[Dict[str, Any]],
+    recent_messages: RecentMessages,
     inventory: Dict[str, int],
     target_good: str,
 ) -> str:
     return (
-        f"Round: {round_number}\n\n"
+        f"{round_header(round_number)}"
         "Your recent messages (up to last 10), as a JSON array of objects:\n"
-        f"{_format_json(recent_messages)}\n\n"
+        f"{_format_messages(recent_messages)}\n\n"
         "Each message object looks like:\n"
         '{"direction":"incoming|outgoing","from":"<agent_name>","to":"<agent_name>",'
         '"message_id":"<id>","round":<int>,"payload":{...}}\n\n'
@@ -243,14 +285,14 @@ def barter_chat_credit_system_prompt(
 
 def barter_chat_credit_user_prompt(
     round_number: int,
-    recent_messages: List[Dict[str, Any]],
+    recent_messages: RecentMessages,
     inventory: Dict[str, int],
     target_good: str,
 ) -> str:
     return (
-        f"Round: {round_number}\n\n"
+        f"{round_header(round_number)}"
         "Your recent messages (up to last 10), as a JSON array of objects:\n"
-        f"{_format_json(recent_messages)}\n\n"
+        f"{_format_messages(recent_messages)}\n\n"
         "Each message object looks like:\n"
         '{"direction":"incoming|outgoing","from":"<agent_name>","to":"<agent_name>",'
         '"message_id":"<id>","round":<int>,"payload":{...}}\n\n'
@@ -301,15 +343,15 @@ def money_agent_system_prompt(
 
 def money_agent_user_prompt(
     round_number: int,
-    recent_messages: List[Dict[str, Any]],
+    recent_messages: RecentMessages,
     inventory: Dict[str, int],
     money_balance: float,
     target_good: str,
 ) -> str:
     return (
-        f"Round: {round_number}\n\n"
+        f"{round_header(round_number)}"
         "Messages you have received from Exchange recently:\n"
-        f"{_format_json(recent_messages)}\n\n"
+        f"{_format_messages(recent_messages)}\n\n"
         "Each message looks like:\n"
         '{"from":"Exchange","to":"<your_name>","round":<int>,"payload":{...}}\n\n'
         "Your current inventory:\n"
@@ -361,7 +403,7 @@ def exchange_user_prompt(
     inbox: List[Dict[str, Any]],
 ) -> str:
     return (
-        f"Round: {round_number}\n\n"
+        f"{round_header(round_number)}"
         "Current prices P[g] in M:\n"
         f"{_format_json(prices)}\n\n"
         "Snapshot of current aggregate state:\n"
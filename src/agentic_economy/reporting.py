@@ -10,12 +10,23 @@ import argparse
 import json
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping
 
-import matplotlib
+from .sweep import DEFAULT_RUN_SETS_PATH, load_run_sets, showcase_priorities
 
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-import pandas as pd
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+
+def _pyplot() -> Any:
+    """matplotlib.pyplot on the headless Agg backend, imported by the first figure drawn."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
 
 
 def _configure_logging() -> None:
@@ -74,7 +85,7 @@ def _select_showcase_row(
     n_agents: int,
     rounds_cap: int,
     model: str,
-    preferred_run_sets: list[str],
+    run_set_priority: Mapping[str, int],
 ) -> pd.Series:
     filtered = df[
         (df["condition"] == condition)
@@ -94,15 +105,15 @@ def _select_showcase_row(
             },
         )
 
-    for run_set in preferred_run_sets:
-        match = filtered[filtered["run_set"] == run_set]
-        if not match.empty:
-            return match.sort_values("runs", ascending=False).iloc[0]
-
-    return filtered.sort_values("runs", ascending=False).iloc[0]
+    # The highest-ranked run set in the index wins; unranked ones fall back to most runs.
+    filtered["priority"] = filtered["run_set"].map(run_set_priority).fillna(0)
+    ranked = filtered.sort_values(["priority", "runs"], ascending=False, kind="stable")
+    return ranked.drop(columns="priority").iloc[0]
 
 
 def generate_core_sweep_overview(core_df: pd.DataFrame, out_dir: Path) -> list[Path]:
+    plt = _pyplot()
+
     required = [
         "condition",
         "n_agents",
@@ -220,7 +231,14 @@ def generate_showcase_overview(
     n_agents: int,
     rounds_cap: int,
     model: str,
+    run_sets_path: Path = Path(DEFAULT_RUN_SETS_PATH),
 ) -> list[Path]:
+    import pandas as pd
+
+    from .results_pages import SHOWCASE_CONDITIONS
+
+    plt = _pyplot()
+
     required = [
         "run_set",
         "condition",
@@ -236,21 +254,16 @@ def generate_showcase_overview(
     _required_columns(all_aggregate_df, required, "all_aggregate_df")
 
     df = all_aggregate_df.copy()
-    selections: list[tuple[str, list[str]]] = [
-        ("barter", ["runs_core", "runs_5mini_emergent", "runs_5mini_full"]),
-        ("money_exchange", ["runs_core", "runs_5mini_full", "runs_5mini_smoke"]),
-        ("central_planner", ["runs_5mini_full", "runs_5mini_smoke"]),
-        ("barter_credit", ["runs_5mini_emergent", "runs_chat_credit_retest"]),
-    ]
+    priorities = showcase_priorities(load_run_sets(run_sets_path))
     rows = []
-    for condition, preferred_run_sets in selections:
+    for condition in SHOWCASE_CONDITIONS:
         row = _select_showcase_row(
             df,
             condition=condition,
             n_agents=n_agents,
             rounds_cap=rounds_cap,
             model=model,
-            preferred_run_sets=preferred_run_sets,
+            run_set_priority=priorities,
         )
         rows.append(row)
 
@@ -316,6 +329,183 @@ def generate_showcase_overview(
     return [png_path, pdf_path]
 
 
+def generate_clearing_overview(aggregate_df: pd.DataFrame, out_dir: Path) -> list[Path]:
+    """Plot clearing-curve metrics vs N for every condition that has them."""
+    plt = _pyplot()
+
+    panels = [
+        ("rounds_to_clear_50", "Rounds to 50% cleared", "Rounds"),
+        ("rounds_to_clear_90", "Rounds to 90% cleared", "Rounds"),
+        ("clearing_auc", "Area under clearing curve", "Mean cleared fraction"),
+        ("messages_per_success", "Messages per successful agent", "Messages"),
+    ]
+    required = ["condition", "n_agents"] + [f"{column}_mean" for column, _, _ in panels]
+    _required_columns(aggregate_df, required, "aggregate_df")
+
+    df = aggregate_df.dropna(subset=[f"{column}_mean" for column, _, _ in panels], how="all")
+    if df.empty:
+        raise ValueError("aggregate_df has no clearing metrics (logs predate round_metrics)")
+
+    # Several run sets can cover the same (condition, N); pool them for the curves.
+    df = df.groupby(["condition", "n_agents"], as_index=False).mean(numeric_only=True)
+    n_values = sorted(df["n_agents"].unique().tolist())
+
+    try:
+        plt.style.use("seaborn-v0_8-colorblind")
+    except (OSError, ValueError):
+        plt.style.use("tableau-colorblind10")
+    fig, axes = plt.subplots(2, 2, figsize=(10, 7), constrained_layout=True)
+
+    markers = ["o", "s", "^", "D", "v", "P", "X"]
+    conditions = sorted(df["condition"].unique().tolist())
+    for ax, (column, title, ylabel) in zip(axes.flat, panels):
+        for idx, condition in enumerate(conditions):
+            _plot_line(
+                ax,
+                df,
+                condition,
+                f"{column}_mean",
+                f"{column}_std",
+                color=f"C{idx % 10}",
+                marker=markers[idx % len(markers)],
+            )
+        ax.set_title(f"{title} (mean ± std)")
+        ax.set_xlabel("N agents")
+        ax.set_ylabel(ylabel)
+        ax.set_xticks(n_values)
+        ax.grid(True, alpha=0.25)
+
+    handles, labels = axes.flat[0].get_legend_handles_labels()
+    fig.legend(handles, labels, loc="upper center", ncol=min(len(labels), 4), frameon=False)
+    fig.suptitle("Clearing dynamics vs N", y=1.04)
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    png_path = out_dir / "clearing_overview.png"
+    pdf_path = out_dir / "clearing_overview.pdf"
+    fig.savefig(png_path, dpi=200, bbox_inches="tight")
+    fig.savefig(pdf_path, bbox_inches="tight")
+    plt.close(fig)
+
+    return [png_path, pdf_path]
+
+
+def generate_scaling_overview(fits_df: pd.DataFrame, out_dir: Path) -> list[Path]:
+    """Plot power-law fits vs N per metric, extrapolated to the fit's target N with its CI.
+
+    One line per (condition, model, rounds_cap) group of the fit table.
+    """
+    import numpy as np
+    import pandas as pd
+
+    plt = _pyplot()
+
+    required = [
+        "condition",
+        "model",
+        "rounds_cap",
+        "metric",
+        "law",
+        "n_min",
+        "n_max",
+        "a",
+        "b",
+        "target_n",
+    ]
+    required += ["predicted", "predicted_ci_low", "predicted_ci_high"]
+    _required_columns(fits_df, required, "fits_df")
+
+    df = fits_df[fits_df["law"] == "power_law"]
+    if df.empty:
+        raise ValueError("fits_df contains no power_law fits")
+    titles = {
+        "total_messages": "Messages",
+        "unique_pairs": "Unique agent pairs",
+        "total_tokens": "LLM tokens",
+        "wall_clock_seconds": "Wall-clock seconds",
+    }
+    metrics = list(dict.fromkeys(df["metric"]))
+
+    try:
+        plt.style.use("seaborn-v0_8-colorblind")
+    except (OSError, ValueError):
+        plt.style.use("tableau-colorblind10")
+    cols = min(len(metrics), 2)
+    rows = (len(metrics) + cols - 1) // cols
+    fig, axes = plt.subplots(
+        rows, cols, figsize=(5 * cols, 3.8 * rows), constrained_layout=True, squeeze=False
+    )
+
+    groups = sorted(df.groupby(["condition", "model", "rounds_cap"]).groups)
+    for ax, metric in zip(axes.flat, metrics):
+        for idx, (condition, model, rounds_cap) in enumerate(groups):
+            match = df[
+                (df["metric"] == metric)
+                & (df["condition"] == condition)
+                & (df["model"] == model)
+                & (df["rounds_cap"] == rounds_cap)
+            ]
+            if match.empty:
+                continue
+            fit = match.iloc[0]
+            # The style cycle has too few colors for every (condition, model, cap) group.
+            color = plt.get_cmap("tab20")(idx % 20)
+            label = f"{_condition_label(condition)}, {model}, R={rounds_cap}"
+            observed = np.geomspace(fit["n_min"], fit["n_max"], 50)
+            extrapolated = np.geomspace(fit["n_max"], fit["target_n"], 50)
+            ax.plot(
+                observed,
+                fit["a"] * observed ** fit["b"],
+                color=color,
+                linewidth=2.0,
+                label=f"{label} (b={fit['b']:.2f})",
+            )
+            ax.plot(extrapolated, fit["a"] * extrapolated ** fit["b"], color=color, linestyle="--")
+            # NaN intervals (an N with a single run) are drawn as a bare point.
+            has_ci = pd.notna(fit["predicted_ci_low"]) and pd.notna(fit["predicted_ci_high"])
+            ax.errorbar(
+                [fit["target_n"]],
+                [fit["predicted"]],
+                # Clipped: identical resamples can sit a rounding error off the point estimate.
+                yerr=(
+                    [
+                        [max(fit["predicted"] - fit["predicted_ci_low"], 0.0)],
+                        [max(fit["predicted_ci_high"] - fit["predicted"], 0.0)],
+                    ]
+                    if has_ci
+                    else None
+                ),
+                color=color,
+                marker="o",
+                capsize=3,
+            )
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.set_title(f"{titles.get(metric, metric)} vs N")
+        ax.set_xlabel("N agents")
+        ax.grid(True, which="both", alpha=0.25)
+        ax.legend(fontsize=7, frameon=False)
+    for ax in list(axes.flat)[len(metrics) :]:
+        ax.set_visible(False)
+    fig.suptitle("Power-law fits (dashed: extrapolation, bars: 95% bootstrap CI)", y=1.03)
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    png_path = out_dir / "scaling_overview.png"
+    pdf_path = out_dir / "scaling_overview.pdf"
+    fig.savefig(png_path, dpi=200, bbox_inches="tight")
+    fig.savefig(pdf_path, bbox_inches="tight")
+    plt.close(fig)
+
+    return [png_path, pdf_path]
+
+
+def _format_ci(low: float, high: float, decimals: int) -> str:
+    import pandas as pd
+
+    if pd.isna(low) or pd.isna(high):
+        return "--"
+    return f"[{float(low):.{decimals}f}, {float(high):.{decimals}f}]"
+
+
 def write_core_sweep_latex_table(core_df: pd.DataFrame, out_path: Path) -> Path:
     required = [
         "condition",
@@ -343,10 +533,11 @@ def write_core_sweep_latex_table(core_df: pd.DataFrame, out_path: Path) -> Path:
     lines.append("% Generated by agentic_economy.reporting")
     lines.append("\\begin{table}[t]")
     lines.append("\\centering")
-    lines.append("\\begin{tabular}{llrrrr}")
+    lines.append("\\begin{tabular}{llrrrrrr}")
     lines.append("\\hline")
     lines.append(
-        "Condition & N & runs & R & success (mean $\\pm$ std) & rounds (mean $\\pm$ std)\\\\"
+        "Condition & N & runs & R & success (mean $\\pm$ std) & 95\\% CI "
+        "& rounds (mean $\\pm$ std) & 95\\% CI\\\\"
     )
     lines.append("\\hline")
     for _, row in df.iterrows():
@@ -357,17 +548,19 @@ def write_core_sweep_latex_table(core_df: pd.DataFrame, out_path: Path) -> Path:
         success_std = float(row.get("success_rate_std", 0.0) or 0.0)
         rounds_mean = float(row["rounds_run_mean"])
         rounds_std = float(row.get("rounds_run_std", 0.0) or 0.0)
+        success_ci = _format_ci(row.get("success_rate_ci_low"), row.get("success_rate_ci_high"), 3)
+        rounds_ci = _format_ci(row.get("rounds_run_ci_low"), row.get("rounds_run_ci_high"), 2)
         lines.append(
             f"{condition} & {n_agents} & {runs} & {rounds_cap} & "
-            f"{success_mean:.3f} $\\pm$ {success_std:.3f} & "
-            f"{rounds_mean:.2f} $\\pm$ {rounds_std:.2f}\\\\"
+            f"{success_mean:.3f} $\\pm$ {success_std:.3f} & {success_ci} & "
+            f"{rounds_mean:.2f} $\\pm$ {rounds_std:.2f} & {rounds_ci}\\\\"
         )
     lines.append("\\hline")
     lines.append("\\end{tabular}")
     caption = (
         "Core sweep results for barter vs Money/Exchange "
         f"(model={model}, round cap R={rounds_cap}). "
-        "Error bars are std across seeds."
+        "Error bars are std across seeds; CIs are 95\\% bootstrap intervals of the mean."
     )
     lines.append(f"\\caption{{{caption}}}")
     lines.append("\\label{tab:core-sweep}")
@@ -404,6 +597,12 @@ def parse_args() -> argparse.Namespace:
         default=Path("results/paper"),
         help="Directory to write paper artifacts (e.g., LaTeX tables).",
     )
+    parser.add_argument(
+        "--scaling-fits",
+        type=Path,
+        default=Path("results/scaling_fits.csv"),
+        help="Path to scaling fits CSV (from `python -m agentic_economy.scaling`).",
+    )
     parser.add_argument("--showcase-n", type=int, default=8, help="N for the showcase figure.")
     parser.add_argument(
         "--showcase-rounds-cap",
@@ -417,12 +616,20 @@ def parse_args() -> argparse.Namespace:
         default="gpt-5-mini",
         help="Model name for the showcase figure.",
     )
+    parser.add_argument(
+        "--run-sets",
+        type=Path,
+        default=Path(DEFAULT_RUN_SETS_PATH),
+        help="Run set index whose showcase priorities pick each showcase bar.",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     _configure_logging()
     args = parse_args()
+    import pandas as pd
+
     core_path: Path = args.core_aggregate
     if not core_path.exists():
         raise FileNotFoundError(
@@ -433,6 +640,10 @@ def main() -> None:
     created: list[Path] = []
     created.extend(generate_core_sweep_overview(core_df, args.out_dir))
     created.append(write_core_sweep_latex_table(core_df, args.paper_dir / "core_sweep_table.tex"))
+    if "clearing_auc_mean" in core_df.columns and core_df["clearing_auc_mean"].notna().any():
+        created.extend(generate_clearing_overview(core_df, args.out_dir))
+    if args.scaling_fits.exists():
+        created.extend(generate_scaling_overview(pd.read_csv(args.scaling_fits), args.out_dir))
     if args.all_aggregate.exists():
         all_df = pd.read_csv(args.all_aggregate)
         created.extend(
@@ -442,6 +653,7 @@ def main() -> None:
                 n_agents=int(args.showcase_n),
                 rounds_cap=int(args.showcase_rounds_cap),
                 model=str(args.showcase_model),
+                run_sets_path=args.run_sets,
             )
         )
 
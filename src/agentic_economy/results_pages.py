@@ -10,10 +10,15 @@ import argparse
 import json
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
 
 import pandas as pd
 
+from .sweep import DEFAULT_RUN_SETS_PATH, load_run_sets, showcase_priorities
+
+# The institutions of the showcase table, in row order.
+SHOWCASE_CONDITIONS = ("barter", "money_exchange", "central_planner", "barter_credit")
+
 
 def _configure_logging() -> None:
     logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -87,12 +92,20 @@ def write_all_results_page(
         "runs",
         "success_rate_mean",
         "success_rate_std",
+        "success_rate_ci_low",
+        "success_rate_ci_high",
         "rounds_run_mean",
         "rounds_run_std",
+        "rounds_run_ci_low",
+        "rounds_run_ci_high",
         "total_messages_mean",
         "total_messages_std",
+        "total_messages_ci_low",
+        "total_messages_ci_high",
         "unique_pairs_mean",
         "unique_pairs_std",
+        "unique_pairs_ci_low",
+        "unique_pairs_ci_high",
         "exchange_inbox_messages_mean",
         "exchange_outbox_messages_mean",
         "exchange_price_update_count_mean",
@@ -137,6 +150,12 @@ def _format_mean_std(mean: Any, std: Any, decimals: int) -> str:
     return f"{mean_f:.{decimals}f} ± {std_f:.{decimals}f}"
 
 
+def _format_ci(low: Any, high: Any, decimals: int) -> str:
+    if pd.isna(low) or pd.isna(high):
+        return ""
+    return f"[{float(low):.{decimals}f}, {float(high):.{decimals}f}]"
+
+
 def _select_showcase_row(
     df: pd.DataFrame,
     *,
@@ -144,7 +163,7 @@ def _select_showcase_row(
     n_agents: int,
     rounds_cap: int,
     model: str,
-    preferred_run_sets: list[str],
+    run_set_priority: Mapping[str, int],
 ) -> pd.Series:
     filtered = df[
         (df["condition"] == condition)
@@ -164,12 +183,10 @@ def _select_showcase_row(
             },
         )
 
-    for run_set in preferred_run_sets:
-        match = filtered[filtered["run_set"] == run_set]
-        if not match.empty:
-            return match.sort_values("runs", ascending=False).iloc[0]
-
-    return filtered.sort_values("runs", ascending=False).iloc[0]
+    # The highest-ranked run set in the index wins; unranked ones fall back to most runs.
+    filtered["priority"] = filtered["run_set"].map(run_set_priority).fillna(0)
+    ranked = filtered.sort_values(["priority", "runs"], ascending=False, kind="stable")
+    return ranked.drop(columns="priority").iloc[0]
 
 
 def write_showcase_page(
@@ -180,16 +197,11 @@ def write_showcase_page(
     rounds_cap: int,
     model: str,
     latex_out_path: Path,
+    run_sets_path: Path = Path(DEFAULT_RUN_SETS_PATH),
 ) -> tuple[Path, Path]:
     agg_df = pd.read_csv(all_runs_aggregate_csv)
     agg_df = _round_float_columns(agg_df, decimals=3)
-
-    selections = [
-        ("barter", ["runs_core", "runs_5mini_emergent", "runs_5mini_full"]),
-        ("money_exchange", ["runs_core", "runs_5mini_full", "runs_5mini_smoke"]),
-        ("central_planner", ["runs_5mini_full", "runs_5mini_smoke"]),
-        ("barter_credit", ["runs_5mini_emergent", "runs_chat_credit_retest"]),
-    ]
+    priorities = showcase_priorities(load_run_sets(run_sets_path))
 
     rows: list[dict[str, Any]] = []
     latex_rows: list[dict[str, Any]] = []
@@ -199,14 +211,14 @@ def write_showcase_page(
         "barter_credit": "Barter + credits",
         "barter": "Barter",
     }
-    for condition, preferred in selections:
+    for condition in SHOWCASE_CONDITIONS:
         row = _select_showcase_row(
             agg_df,
             condition=condition,
             n_agents=n_agents,
             rounds_cap=rounds_cap,
             model=model,
-            preferred_run_sets=preferred,
+            run_set_priority=priorities,
         )
 
         rows.append(
@@ -217,12 +229,21 @@ def write_showcase_page(
                 "success_rate": _format_mean_std(
                     row.get("success_rate_mean"), row.get("success_rate_std"), 3
                 ),
+                "success_rate_ci": _format_ci(
+                    row.get("success_rate_ci_low"), row.get("success_rate_ci_high"), 3
+                ),
                 "rounds_run": _format_mean_std(
                     row.get("rounds_run_mean"), row.get("rounds_run_std"), 2
                 ),
+                "rounds_run_ci": _format_ci(
+                    row.get("rounds_run_ci_low"), row.get("rounds_run_ci_high"), 2
+                ),
                 "total_messages": _format_mean_std(
                     row.get("total_messages_mean"), row.get("total_messages_std"), 1
                 ),
+                "total_messages_ci": _format_ci(
+                    row.get("total_messages_ci_low"), row.get("total_messages_ci_high"), 1
+                ),
                 "unique_pairs": _format_mean_std(
                     row.get("unique_pairs_mean"), row.get("unique_pairs_std"), 2
                 ),
@@ -236,12 +257,11 @@ def write_showcase_page(
             {
                 "condition": condition,
                 "runs": int(row["runs"]),
-                "success_rate_mean": row.get("success_rate_mean"),
-                "success_rate_std": row.get("success_rate_std"),
-                "rounds_run_mean": row.get("rounds_run_mean"),
-                "rounds_run_std": row.get("rounds_run_std"),
-                "total_messages_mean": row.get("total_messages_mean"),
-                "total_messages_std": row.get("total_messages_std"),
+                **{
+                    f"{metric}_{stat}": row.get(f"{metric}_{stat}")
+                    for metric in ("success_rate", "rounds_run", "total_messages")
+                    for stat in ("mean", "std", "ci_low", "ci_high")
+                },
             }
         )
 
@@ -251,8 +271,11 @@ def write_showcase_page(
         "run_set",
         "runs",
         "success_rate",
+        "success_rate_ci",
         "rounds_run",
+        "rounds_run_ci",
         "total_messages",
+        "total_messages_ci",
         "unique_pairs",
         "credit_accepts",
     ]
@@ -268,6 +291,7 @@ def write_showcase_page(
     lines.append("")
     lines.append(f"- Source: `{all_runs_aggregate_csv.as_posix()}`")
     lines.append(f"- N = {n_agents}, R = {rounds_cap}, model = `{model}`")
+    lines.append("- `*_ci` columns: 95% bootstrap confidence interval of the mean across runs")
     lines.append(f"- LaTeX version: `{latex_out_path.as_posix()}`")
     lines.append("")
     lines.extend(_write_markdown_table(showcase_df, columns))
@@ -283,10 +307,11 @@ def write_showcase_page(
     latex_lines.append("% Generated by agentic_economy.results_pages")
     latex_lines.append("\\begin{table}[t]")
     latex_lines.append("\\centering")
-    latex_lines.append("\\begin{tabular}{lrrrr}")
+    latex_lines.append("\\begin{tabular}{lrrrrrrr}")
     latex_lines.append("\\hline")
     latex_lines.append(
-        "Condition & runs & success (mean $\\pm$ std) & rounds (mean $\\pm$ std) & messages (mean $\\pm$ std)\\\\"
+        "Condition & runs & success (mean $\\pm$ std) & 95\\% CI & rounds (mean $\\pm$ std) "
+        "& 95\\% CI & messages (mean $\\pm$ std) & 95\\% CI\\\\"
     )
     latex_lines.append("\\hline")
     for entry in latex_rows:
@@ -307,11 +332,22 @@ def write_showcase_page(
         msgs = _format_mean_std(
             entry["total_messages_mean"], entry["total_messages_std"], 1
         ).replace("±", "$\\pm$")
-        latex_lines.append(f"{label} & {entry['runs']} & {success} & {rounds} & {msgs}\\\\")
+        success_ci = (
+            _format_ci(entry["success_rate_ci_low"], entry["success_rate_ci_high"], 3) or "--"
+        )
+        rounds_ci = _format_ci(entry["rounds_run_ci_low"], entry["rounds_run_ci_high"], 2) or "--"
+        msgs_ci = (
+            _format_ci(entry["total_messages_ci_low"], entry["total_messages_ci_high"], 1) or "--"
+        )
+        latex_lines.append(
+            f"{label} & {entry['runs']} & {success} & {success_ci} & {rounds} & {rounds_ci} "
+            f"& {msgs} & {msgs_ci}\\\\"
+        )
     latex_lines.append("\\hline")
     latex_lines.append("\\end{tabular}")
     latex_lines.append(
-        f"\\caption{{Showcase results at N={n_agents}, round cap R={rounds_cap} (model={model}).}}"
+        f"\\caption{{Showcase results at N={n_agents}, round cap R={rounds_cap} (model={model}); "
+        "CIs are 95\\% bootstrap intervals of the mean across runs.}"
     )
     latex_lines.append("\\label{tab:showcase}")
     latex_lines.append("\\end{table}")
@@ -362,6 +398,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--model", type=str, default="gpt-5-mini", help="Model name for the showcase table."
     )
+    parser.add_argument(
+        "--run-sets",
+        type=Path,
+        default=Path(DEFAULT_RUN_SETS_PATH),
+        help="Run set index whose showcase priorities pick each showcase row.",
+    )
     return parser.parse_args()
 
 
@@ -387,6 +429,7 @@ def main() -> None:
         rounds_cap=args.rounds_cap,
         model=args.model,
         latex_out_path=args.out_showcase_tex,
+        run_sets_path=args.run_sets,
     )
     created.extend([showcase_md, showcase_tex])
 
@@ -0,0 +1,280 @@
+"""Fit scaling laws of run cost vs N for each condition.
+
+Runs are grouped by condition, LLM model and round cap, since message counts depend on all
+three; `run_sets` narrows the input further. Two laws are fitted by least squares for every
+group and metric:
+
+- `power_law`: y = a * N^b, fitted as log y on log N. `b` is the scaling exponent, about 2
+  when traffic grows with the number of agent pairs and about 1 through a hub.
+- `log_linear`: y = a + b * ln N.
+
+Confidence intervals come from a bootstrap over runs, resampled within each N so every
+resample keeps the sweep's design. All resamples of a fit are drawn as one index matrix and
+solved together in closed form, so thousands of resamples cost a few array operations. An N
+with a single run has no spread to resample, so such fits get NaN intervals. Each fit is
+extrapolated to `target_n` (N=1000 by default).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .analysis import DEFAULT_INDEX_PATH, _write_markdown_table, load_runs
+
+logger = logging.getLogger(__name__)
+
+SCALING_METRICS = ["total_messages", "unique_pairs", "total_tokens", "wall_clock_seconds"]
+GROUP_COLUMNS = ["condition", "model", "rounds_cap"]
+LAWS = ("power_law", "log_linear")
+FORMULAS = {"power_law": "a * N^b", "log_linear": "a + b * ln N"}
+DEFAULT_TARGET_N = 1000
+DEFAULT_RESAMPLES = 2000
+CI_PERCENTILES = (2.5, 97.5)
+FIT_COLUMNS = GROUP_COLUMNS + [
+    "metric",
+    "law",
+    "formula",
+    "runs",
+    "n_min",
+    "n_max",
+    "a",
+    "b",
+    "b_ci_low",
+    "b_ci_high",
+    "r2",
+    "target_n",
+    "predicted",
+    "predicted_ci_low",
+    "predicted_ci_high",
+]
+
+
+def _least_squares(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Intercept and slope of y on x along the last axis (one fit per row)."""
+    x_mean = x.mean(axis=-1, keepdims=True)
+    y_mean = y.mean(axis=-1, keepdims=True)
+    dx = x - x_mean
+    slope = (dx * (y - y_mean)).sum(axis=-1) / (dx * dx).sum(axis=-1)
+    intercept = y_mean[..., 0] - slope * x_mean[..., 0]
+    return intercept, slope
+
+
+def _transform(law: str, n: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    if law == "power_law":
+        return np.log(n), np.log(y)
+    return np.log(n), y
+
+
+def _predict(law: str, intercept: np.ndarray, slope: np.ndarray, n: float) -> np.ndarray:
+    fitted = intercept + slope * np.log(n)
+    return np.exp(fitted) if law == "power_law" else fitted
+
+
+def _stratified_resamples(n: np.ndarray, resamples: int, rng: np.random.Generator) -> np.ndarray:
+    """(resamples x runs) row indices, drawn with replacement within each N."""
+    columns = []
+    for value in np.unique(n):
+        positions = np.flatnonzero(n == value)
+        columns.append(positions[rng.integers(0, positions.size, (resamples, positions.size))])
+    return np.hstack(columns)
+
+
+def _fit(
+    law: str,
+    n: np.ndarray,
+    y: np.ndarray,
+    target_n: int,
+    resamples: int,
+    rng: np.random.Generator,
+) -> Dict[str, float]:
+    x, t = _transform(law, n, y)
+    intercept, slope = _least_squares(x, t)
+    residual = t - (intercept + slope * x)
+    total = ((t - t.mean()) ** 2).sum()
+    r2 = 1.0 - (residual**2).sum() / total if total > 0 else float("nan")
+
+    b_low = b_high = p_low = p_high = float("nan")
+    _, runs_per_n = np.unique(n, return_counts=True)
+    if runs_per_n.min() >= 2:
+        rows = _stratified_resamples(n, resamples, rng)
+        boot_intercept, boot_slope = _least_squares(x[rows], t[rows])
+        boot_predicted = _predict(law, boot_intercept, boot_slope, target_n)
+        b_low, b_high = np.percentile(boot_slope, CI_PERCENTILES)
+        p_low, p_high = np.percentile(boot_predicted, CI_PERCENTILES)
+    return {
+        "a": float(np.exp(intercept) if law == "power_law" else intercept),
+        "b": float(slope),
+        "b_ci_low": float(b_low),
+        "b_ci_high": float(b_high),
+        "r2": float(r2),
+        "predicted": float(_predict(law, intercept, slope, target_n)),
+        "predicted_ci_low": float(p_low),
+        "predicted_ci_high": float(p_high),
+    }
+
+
+def fit_scaling(
+    runs_df: pd.DataFrame,
+    metrics: Sequence[str] = SCALING_METRICS,
+    target_n: int = DEFAULT_TARGET_N,
+    resamples: int = DEFAULT_RESAMPLES,
+    seed: int = 0,
+    run_sets: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """Fit every law to every metric vs N per (condition, model, rounds_cap); one row per fit.
+
+    Runs missing a metric (e.g. logs without token usage) are left out of that fit, as are
+    non-positive values for the power law. Fits need at least two distinct N.
+    """
+    if run_sets is not None:
+        runs_df = runs_df[runs_df["run_set"].isin(run_sets)]
+    rows: List[Dict[str, object]] = []
+    rng = np.random.default_rng(seed)
+    for key, group in runs_df.groupby(GROUP_COLUMNS, sort=True):
+        for metric in metrics:
+            if metric not in group.columns:
+                continue
+            values = group[["n_agents", metric]].dropna().astype(float)
+            for law in LAWS:
+                usable = values[values[metric] > 0] if law == "power_law" else values
+                n = usable["n_agents"].to_numpy()
+                if np.unique(n).size < 2:
+                    continue
+                fit = _fit(law, n, usable[metric].to_numpy(), target_n, resamples, rng)
+                rows.append(
+                    {
+                        **dict(zip(GROUP_COLUMNS, key)),
+                        "metric": metric,
+                        "law": law,
+                        "formula": FORMULAS[law],
+                        "runs": len(usable),
+                        "n_min": int(n.min()),
+                        "n_max": int(n.max()),
+                        "target_n": target_n,
+                        **fit,
+                    }
+                )
+    return pd.DataFrame(rows, columns=FIT_COLUMNS)
+
+
+def write_fits(fits: pd.DataFrame, out_csv: Path, out_md: Path, source: str) -> None:
+    out_csv.parent.mkdir(parents=True, exist_ok=True)
+    fits.to_csv(out_csv, index=False)
+
+    markdown_df = fits.copy()
+    for column in ("a", "b", "b_ci_low", "b_ci_high", "r2"):
+        markdown_df[column] = markdown_df[column].round(3)
+    for column in ("predicted", "predicted_ci_low", "predicted_ci_high"):
+        markdown_df[column] = markdown_df[column].round(1)
+    target = int(fits["target_n"].iloc[0]) if not fits.empty else DEFAULT_TARGET_N
+    _write_markdown_table(
+        markdown_df,
+        out_md,
+        [column for column in FIT_COLUMNS if column != "target_n"],
+        title="Scaling fits",
+        subtitle=(
+            f"Least-squares fits vs N from `{source}` per condition, model and round cap; "
+            "[b_ci_low, b_ci_high] and the predicted_ci bounds are 95% bootstrap intervals "
+            f"(empty when some N has a single run); predicted is at N={target}."
+        ),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fit scaling laws of run cost vs N.")
+    parser.add_argument(
+        "--pattern",
+        type=str,
+        default="runs*/*.json",
+        help="Glob pattern for run JSON logs.",
+    )
+    parser.add_argument(
+        "--runs-csv",
+        type=Path,
+        default=None,
+        help="Fit a per-run CSV from `analysis --out-csv` instead of parsing run logs.",
+    )
+    parser.add_argument(
+        "--run-sets",
+        nargs="+",
+        default=None,
+        help="Only fit runs from these run sets (log folder names).",
+    )
+    parser.add_argument(
+        "--out-csv",
+        type=Path,
+        default=Path("results/scaling_fits.csv"),
+        help="Write the fit table to this CSV.",
+    )
+    parser.add_argument(
+        "--out-md",
+        type=Path,
+        default=Path("results/scaling_fits.md"),
+        help="Write the fit table to this Markdown file.",
+    )
+    parser.add_argument(
+        "--metrics",
+        nargs="+",
+        default=SCALING_METRICS,
+        help="Per-run columns to fit against N.",
+    )
+    parser.add_argument(
+        "--target-n",
+        type=int,
+        default=DEFAULT_TARGET_N,
+        help="N to extrapolate each fit to.",
+    )
+    parser.add_argument(
+        "--resamples",
+        type=int,
+        default=DEFAULT_RESAMPLES,
+        help="Bootstrap resamples per fit.",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Bootstrap random seed.")
+    parser.add_argument(
+        "--index",
+        type=str,
+        default=DEFAULT_INDEX_PATH,
+        help="SQLite summary index; unchanged logs are not re-parsed.",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    source = str(args.runs_csv) if args.runs_csv else args.pattern
+    if args.runs_csv:
+        runs = pd.read_csv(args.runs_csv)
+    else:
+        runs = load_runs(args.pattern, index_path=args.index)
+    if runs.empty:
+        print(f"No runs found in {source}")
+        return
+    fits = fit_scaling(
+        runs,
+        metrics=args.metrics,
+        target_n=args.target_n,
+        resamples=args.resamples,
+        seed=args.seed,
+        run_sets=args.run_sets,
+    )
+    write_fits(fits, args.out_csv, args.out_md, source)
+    logger.info(
+        json.dumps(
+            {
+                "event": "scaling_fits_written",
+                "fits": len(fits),
+                "csv": str(args.out_csv),
+                "markdown": str(args.out_md),
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
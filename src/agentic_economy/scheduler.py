@@ -0,0 +1,116 @@
+"""Interleave many simulations on one shared pool of concurrent LLM calls.
+
+A single simulation is bounded by its slowest agent per round. The scheduler submits every
+pending decision of every active run into one thread pool and resumes each run as soon as
+its own round barrier is satisfied, so the pool stays saturated for the whole sweep.
+Responses are handed back keyed by decision maker, which keeps seeded outcomes identical to
+the serial path regardless of completion order.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Generator, List, Optional, Sequence, Tuple
+
+from .simulation import BaseSimulation, SimulationResult
+
+logger = logging.getLogger(__name__)
+
+# Answers one decision: (decision maker, chat messages) -> parsed JSON response.
+Decide = Callable[[str, List[Dict[str, str]]], Dict[str, Any]]
+Stepper = Generator[Dict[str, List[Dict[str, str]]], Dict[str, Dict[str, Any]], Any]
+
+
+def drive_concurrently(
+    steppers: Sequence[Tuple[Stepper, Decide]],
+    max_workers: int,
+    on_complete: Optional[Callable[[int, Any], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> List[Any]:
+    """Drive step generators on a shared pool; returns each generator's final value.
+
+    `on_complete` fires as soon as an individual generator finishes. `should_stop` is checked
+    after every response; once it returns True, unfinished generators are closed and their
+    final value is None.
+    """
+    results: Dict[int, Any] = {}
+    # Each in-flight call maps to (submission sequence, generator index, decision key).
+    pending: Dict[Future[Dict[str, Any]], Tuple[int, int, str]] = {}
+    sequence = itertools.count()
+    remaining: Dict[int, int] = {}
+    collected: Dict[int, Dict[str, Dict[str, Any]]] = {}
+    decisions = 0
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+
+        def resume(index: int, responses: Optional[Dict[str, Dict[str, Any]]]) -> None:
+            stepper, decide = steppers[index]
+            while True:
+                try:
+                    batch = next(stepper) if responses is None else stepper.send(responses)
+                except StopIteration as stop:
+                    results[index] = stop.value
+                    if on_complete is not None:
+                        on_complete(index, stop.value)
+                    return
+                if batch:
+                    break
+                responses = {}
+            remaining[index] = len(batch)
+            collected[index] = {}
+            for key, messages in batch.items():
+                pending[pool.submit(decide, key, messages)] = (next(sequence), index, key)
+
+        try:
+            for index in range(len(steppers)):
+                resume(index, None)
+
+            stopped = False
+            while pending and not stopped:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                # Handle completions in submission order so a single worker is deterministic.
+                for future in sorted(done, key=lambda future: pending[future][0]):
+                    _, index, key = pending.pop(future)
+                    collected[index][key] = future.result()
+                    decisions += 1
+                    remaining[index] -= 1
+                    if remaining[index] == 0:
+                        resume(index, collected.pop(index))
+                    stopped = should_stop is not None and should_stop()
+                    if stopped:
+                        break
+        finally:
+            for future in pending:
+                future.cancel()
+            for stepper, _ in steppers:
+                stepper.close()
+
+    elapsed = time.perf_counter() - started
+    logger.info(
+        json.dumps(
+            {
+                "event": "scheduler_complete",
+                "generators": len(steppers),
+                "decisions": decisions,
+                "elapsed_seconds": round(elapsed, 3),
+                "decisions_per_second": round(decisions / elapsed, 3) if elapsed > 0 else None,
+                "max_workers": max_workers,
+            }
+        )
+    )
+    return [results.get(index) for index in range(len(steppers))]
+
+
+def run_interleaved(
+    simulations: Sequence[BaseSimulation],
+    max_workers: int,
+    on_complete: Optional[Callable[[int, SimulationResult], None]] = None,
+) -> List[SimulationResult]:
+    """Run simulations together, advancing each one as soon as its round completes."""
+    steppers = [(simulation.steps(), simulation.decide) for simulation in simulations]
+    return drive_concurrently(steppers, max_workers, on_complete=on_complete)
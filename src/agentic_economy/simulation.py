@@ -2,19 +2,55 @@
 
 from __future__ import annotations
 
+import inspect
 import json
 import logging
 import random
-from collections import Counter
-from dataclasses import dataclass, field
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import asdict, dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_type_hints,
+)
 
 from . import prompts
-from .llm_client import LLMClient
+from .llm_client import USAGE_FIELDS, LLMClient
+from .logstream import COMPRESSED_SUFFIXES, open_log
+from .profiling import SpanRecorder, timed
+
+if TYPE_CHECKING:
+    from .monitor import SweepMonitor
+    from .tracing import RunTrace
 
 logger = logging.getLogger(__name__)
 
+EXCHANGE_NAME = "Exchange"
+
+# One decision phase: chat messages keyed by decision maker (agent name or the hub).
+DecisionBatch = Dict[str, List[Dict[str, str]]]
+DecisionResponses = Dict[str, Dict[str, Any]]
+SimulationSteps = Generator[DecisionBatch, DecisionResponses, "SimulationResult"]
+
 
 @dataclass
 class MessageLogEntry:
@@ -34,16 +70,89 @@ class MessageLogEntry:
         }
 
 
+class Inventory(Dict[str, int]):
+    """Inventory map that bumps `version` on every mutation, for prompt cache keys."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key: str, value: int) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def pop(self, *args: Any) -> Any:
+        self.version += 1
+        return super().pop(*args)
+
+    def setdefault(self, key: str, default: int = 0) -> int:
+        self.version += 1
+        return super().setdefault(key, default)
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+
 @dataclass
 class AgentState:
     name: str
     inventory: Dict[str, int]
     target_good: str
     money: float = 0.0
-    history: List[Dict[str, Any]] = field(default_factory=list)
+    history_limit: Optional[int] = None
+    history: Deque[Dict[str, Any]] = field(default_factory=deque)
+    # Compact JSON of each history entry, encoded once on append and reused by every prompt.
+    history_json: Deque[str] = field(default_factory=deque, repr=False)
+    history_version: int = 0
+    prompt_cache: prompts.PromptCache = field(
+        default_factory=prompts.PromptCache, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.inventory, Inventory):
+            self.inventory = Inventory(self.inventory)
+        # A bounded deque drops the oldest entry in O(1) instead of reslicing the list.
+        maxlen = self.history_limit or None
+        self.history = deque(self.history, maxlen=maxlen)
+        self.history_json = deque(
+            (prompts.format_history_entry(entry) for entry in self.history), maxlen=maxlen
+        )
+
+    def record_history(self, entry: Dict[str, Any]) -> None:
+        self.history.append(entry)
+        self.history_json.append(prompts.format_history_entry(entry))
+        self.history_version += 1
+
+    def system_prompt_key(self) -> Tuple[int, float]:
+        return (self.inventory_version, self.money)
+
+    def user_prompt_key(self) -> Tuple[int, int, float]:
+        return (self.inventory_version, self.history_version, self.money)
+
+    @property
+    def inventory_version(self) -> int:
+        return self.inventory.version if isinstance(self.inventory, Inventory) else -1
 
     def recent_history(self, history_limit: int) -> List[Dict[str, Any]]:
-        return self.history[-history_limit:]
+        if not history_limit or history_limit >= len(self.history):
+            return list(self.history)
+        return list(islice(self.history, len(self.history) - history_limit, None))
+
+    def recent_history_json(self, history_limit: int) -> str:
+        """`recent_history(...)` as the exact JSON array text the prompts embed."""
+        entries: Iterable[str] = self.history_json
+        if history_limit and history_limit < len(self.history_json):
+            entries = islice(self.history_json, len(self.history_json) - history_limit, None)
+        return "[" + ",".join(entries) + "]"
 
 
 @dataclass
@@ -63,6 +172,12 @@ class SimulationResult:
     exchange_round_metrics: Optional[List[Dict[str, Any]]] = None
     events: Optional[List[Dict[str, Any]]] = None
     behavior_summary: Optional[Dict[str, Any]] = None
+    round_metrics: Optional[Dict[str, List[int]]] = None
+    usage: Optional[Dict[str, int]] = None
+    timing: Optional[Dict[str, float]] = None
+    phase_seconds: Optional[Dict[str, List[float]]] = None
+    # Stall detection (barter conditions with `stall_rounds`): rounds and calls not paid for.
+    stall: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -81,15 +196,137 @@ class SimulationResult:
             "exchange_round_metrics": self.exchange_round_metrics,
             "events": self.events,
             "behavior_summary": self.behavior_summary,
+            "round_metrics": self.round_metrics,
+            "usage": self.usage,
+            "timing": self.timing,
+            "phase_seconds": self.phase_seconds,
+            "stall": self.stall,
         }
 
     def write_json(self, path: Path) -> None:
+        """Write the run log; `.json.gz` / `.json.zst` paths get compact, compressed JSON."""
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(self.to_dict(), handle, indent=2, ensure_ascii=True)
+        # json.dump encodes incrementally, so the document is never built as one string.
+        with open_log(path, "w") as handle:
+            if path.suffix in COMPRESSED_SUFFIXES:
+                json.dump(self.to_dict(), handle, ensure_ascii=True, separators=(",", ":"))
+            else:
+                json.dump(self.to_dict(), handle, indent=2, ensure_ascii=True)
+
+
+def resume_steps(
+    steps: SimulationSteps, responses: Optional[DecisionResponses]
+) -> Union[DecisionBatch, SimulationResult]:
+    """Advance a step generator; returns its next decision batch or its final result."""
+    try:
+        return next(steps) if responses is None else steps.send(responses)
+    except StopIteration as stop:
+        return stop.value
+
+
+def drive_steps(
+    steps: SimulationSteps, decide: Callable[[str, List[Dict[str, str]]], Dict[str, Any]]
+) -> SimulationResult:
+    """Run a simulation's decision phases serially, one LLM call at a time."""
+    try:
+        batch = next(steps)
+        while True:
+            responses = {key: decide(key, messages) for key, messages in batch.items()}
+            batch = steps.send(responses)
+    except StopIteration as stop:
+        return stop.value
+
+
+# Condition name -> simulation class, filled by `register_condition`. The CLI takes its
+# condition choices and per-condition options from here, so new engines plug in unchanged.
+CONDITIONS: Dict[str, Type[BaseSimulation]] = {}
+# Constructor arguments every condition shares; any other keyword is a per-condition option.
+SHARED_PARAMETERS = ("n_agents", "rounds", "seed", "history_limit", "llm_client", "model_name")
+SimulationClass = TypeVar("SimulationClass", bound="Type[BaseSimulation]")
+
+
+def register_condition(cls: SimulationClass) -> SimulationClass:
+    existing = CONDITIONS.get(cls.condition)
+    if existing is not None and existing is not cls:
+        raise ValueError(f"Condition {cls.condition} is already registered to {existing.__name__}")
+    CONDITIONS[cls.condition] = cls
+    undocumented = set(condition_options(cls.condition)) - set(cls.option_help)
+    if undocumented:
+        del CONDITIONS[cls.condition]
+        raise ValueError(
+            f"{cls.__name__} option(s) {', '.join(sorted(undocumented))} need `option_help` text"
+        )
+    return cls
+
+
+def condition_options(condition: str) -> Dict[str, Any]:
+    """Per-condition constructor keywords of `condition` and their defaults."""
+    signature = inspect.signature(CONDITIONS[condition].__init__)
+    return {
+        name: parameter.default
+        for name, parameter in signature.parameters.items()
+        if name != "self"
+        and name not in SHARED_PARAMETERS
+        and parameter.default is not inspect.Parameter.empty
+    }
+
+
+def condition_option_types(condition: str) -> Dict[str, Any]:
+    """Value type of each per-condition option, from the constructor's annotations."""
+    hints = get_type_hints(CONDITIONS[condition].__init__)
+    types: Dict[str, Any] = {}
+    for name in condition_options(condition):
+        hint = hints.get(name, str)
+        # Optional[X] options take an X when given.
+        given = [arg for arg in get_args(hint) if arg is not type(None)]
+        types[name] = given[0] if given else hint
+    return types
+
+
+@dataclass
+class SimulationSpec:
+    """One run as plain JSON values, so pool workers or a sweep manifest can rebuild it."""
+
+    condition: str
+    n_agents: int
+    seed: int
+    rounds: int
+    history_limit: int
+    model: str
+    options: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> SimulationSpec:
+        return cls(**data)
+
+    def build(self, llm_client: LLMClient) -> BaseSimulation:
+        simulation_class = CONDITIONS.get(self.condition)
+        if simulation_class is None:
+            raise ValueError(f"Unknown condition {self.condition}")
+        unknown = set(self.options) - set(condition_options(self.condition))
+        if unknown:
+            raise ValueError(f"{self.condition} has no option(s) {', '.join(sorted(unknown))}")
+        return simulation_class(
+            n_agents=self.n_agents,
+            rounds=self.rounds,
+            seed=self.seed,
+            history_limit=self.history_limit,
+            llm_client=llm_client,
+            model_name=self.model,
+            **self.options,
+        )
 
 
 class BaseSimulation:
+    condition = "base"
+    # LLM calls a hub makes after the agents in each round (see `calls_per_round`).
+    hub_calls_per_round = 0
+    # What each per-condition constructor option does; the CLI shows it as the option's help.
+    option_help: Dict[str, str] = {}
+
     def __init__(
         self,
         n_agents: int,
@@ -113,6 +350,191 @@ class BaseSimulation:
         self._message_counter = 0
         self._seed = seed
         self.events: List[Dict[str, Any]] = []
+        self.current_round = 0
+        # Logical clock for asynchronous rounds; None keeps the synchronous event format.
+        self.clock: Optional[int] = None
+        # Clearing curve: successful agents and executed trades at the end of each round.
+        self.success_by_round: List[int] = []
+        self.trades_by_round: List[int] = []
+        # Cost accounting; LLM calls of one run can complete on several pool threads.
+        self.usage: Dict[str, int] = {"llm_calls": 0, **{key: 0 for key in USAGE_FIELDS}}
+        self.llm_seconds = 0.0
+        self._usage_lock = threading.Lock()
+        self._started_at: Optional[float] = None
+        # Per-round phase timings; None (the default) leaves every span a no-op.
+        self.span_recorder: Optional[SpanRecorder] = None
+        # Live sweep metrics (see `SweepMonitor.track`); None when nothing is watching.
+        self.monitor: Optional[SweepMonitor] = None
+        # OTLP trace of this run (see `TraceExporter.trace`); None when not tracing.
+        self.tracer: Optional[RunTrace] = None
+
+    @classmethod
+    def calls_per_round(cls, n_agents: int) -> int:
+        """Most LLM calls one synchronous round makes: one per agent plus the hub's."""
+        return n_agents + cls.hub_calls_per_round
+
+    @classmethod
+    def phases_per_round(cls, n_agents: int) -> int:
+        """Sequential LLM phases of a round (agents, then the hub); its latency critical path."""
+        if not cls.calls_per_round(n_agents):
+            return 0
+        return 2 if cls.hub_calls_per_round else 1
+
+    def steps(self) -> SimulationSteps:
+        """Yield each decision phase as prompts keyed by decision maker.
+
+        The driver sends back parsed JSON responses under the same keys. Every yield is a
+        barrier: no action is applied until all decisions of the phase have been answered.
+        """
+        raise NotImplementedError
+
+    def run(self) -> SimulationResult:
+        return drive_steps(self.steps(), self.decide)
+
+    def decide(self, key: str, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        """Answer the decision of `key` (an agent or the hub), traced when a tracer is set."""
+        if self.tracer is None:
+            return self.complete_json(messages)
+        round_number = self.current_round
+        started_ns = time.time_ns()
+        error: Optional[str] = None
+        try:
+            return self.complete_json(messages)
+        except Exception as exc:
+            error = type(exc).__name__
+            raise
+        finally:
+            self.tracer.decision(
+                key,
+                round_number,
+                started_ns,
+                time.time_ns(),
+                {} if error else getattr(self.llm_client, "last_usage", None) or {},
+                getattr(self.llm_client, "last_attempts", ()),
+                error,
+            )
+
+    def complete_json(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        """Ask the LLM for one decision, charging its tokens and latency to this run."""
+        started = time.perf_counter()
+        response = self.llm_client.complete_json(messages)
+        seconds = time.perf_counter() - started
+        self.record_usage(
+            getattr(self.llm_client, "last_usage", None) or {},
+            seconds,
+            getattr(self.llm_client, "last_attempts", ()),
+        )
+        if self.span_recorder is not None:
+            parse_seconds = getattr(self.llm_client, "last_parse_seconds", 0.0)
+            self.span_recorder.add("llm_request", self.current_round, seconds - parse_seconds)
+            self.span_recorder.add("parse_json", self.current_round, parse_seconds)
+        return response
+
+    def record_usage(
+        self,
+        tokens: Mapping[str, int],
+        seconds: float = 0.0,
+        attempts: Sequence[Mapping[str, Any]] = (),
+    ) -> None:
+        with self._usage_lock:
+            self.usage["llm_calls"] += 1
+            for key in USAGE_FIELDS:
+                self.usage[key] += int(tokens.get(key, 0))
+            self.llm_seconds += seconds
+        if self.monitor is not None:
+            self.monitor.record_call(seconds, tokens, attempts)
+
+    def agent_steps(self, agent_name: str) -> SimulationSteps:
+        """Yield one agent's decisions for asynchronous rounds, applying each on return.
+
+        Unlike `steps()` there is no barrier: each decision is applied against the world state
+        current at the moment it comes back. Agents count their own rounds.
+        """
+        raise ValueError(f"{self.condition} has no per-agent LLM decisions to run asynchronously")
+
+    def run_async(self, max_workers: int) -> SimulationResult:
+        """Run with asynchronous rounds: every agent acts as soon as its last decision returns.
+
+        Raises ValueError for conditions without per-agent LLM decisions.
+        """
+        from .scheduler import drive_concurrently
+
+        steppers = [(self.agent_steps(agent_name), self.decide) for agent_name in self.agents]
+        self.clock = 0
+        drive_concurrently(
+            steppers,
+            max_workers,
+            should_stop=lambda: self._success_count() == self.n_agents,
+        )
+        return self._result(self.current_round)
+
+    def _start_clock(self) -> None:
+        if self._started_at is None:
+            self._started_at = time.perf_counter()
+            if self.tracer is not None:
+                self.tracer.start()
+
+    def _tick(self, round_number: int) -> None:
+        if self.clock is not None:
+            self.clock += 1
+        self.current_round = max(self.current_round, round_number)
+
+    def _round_slot(self) -> int:
+        while len(self.trades_by_round) < self.current_round:
+            self.trades_by_round.append(0)
+            self.success_by_round.append(self.success_by_round[-1] if self.success_by_round else 0)
+        return self.current_round - 1
+
+    def _count_trade(self) -> None:
+        self.trades_by_round[self._round_slot()] += 1
+
+    def _record_round(self) -> None:
+        slot = self._round_slot()
+        self.success_by_round[slot] = self._success_count()
+        if self.tracer is not None:
+            self.tracer.end_round(
+                self.current_round, self.trades_by_round[slot], self.success_by_round[slot]
+            )
+
+    def _parameters(self) -> Dict[str, Any]:
+        parameters: Dict[str, Any] = {
+            "rounds": self.rounds,
+            "history_limit": self.history_limit,
+            "model": self.model_name,
+        }
+        if self.clock is not None:
+            parameters["schedule"] = "async"
+        return parameters
+
+    def _result(self, rounds_run: int, **extra: Any) -> SimulationResult:
+        # Asynchronous runs are a different institution timing, so they aggregate separately.
+        condition = self.condition if self.clock is None else f"{self.condition}_async"
+        started = self._started_at
+        wall_clock = 0.0 if started is None else time.perf_counter() - started
+        return SimulationResult(
+            condition=condition,
+            n_agents=self.n_agents,
+            seed=self._seed,
+            rounds_run=rounds_run,
+            messages=self.messages,
+            agents=self._agent_metadata(),
+            inventory_final=self._inventory_snapshot(),
+            successful_agents=self._success_count(),
+            parameters=self._parameters(),
+            events=self.events,
+            behavior_summary=self._behavior_summary(),
+            round_metrics={
+                "successful_agents": list(self.success_by_round),
+                "trades": list(self.trades_by_round),
+            },
+            usage=dict(self.usage),
+            timing={
+                "wall_clock_seconds": round(wall_clock, 3),
+                "llm_seconds": round(self.llm_seconds, 3),
+            },
+            phase_seconds=None if self.span_recorder is None else self.span_recorder.by_round(),
+            **extra,
+        )
 
     def _next_message_id(self) -> str:
         message_id = f"m{self._message_counter}"
@@ -121,6 +543,8 @@ class BaseSimulation:
 
     def _log_event(self, event: str, **fields: Any) -> None:
         record = {"event": event, **fields}
+        if self.clock is not None:
+            record["clock"] = self.clock
         self.events.append(record)
 
     def _log_agent_action(
@@ -137,39 +561,32 @@ class BaseSimulation:
         )
 
     def _behavior_summary(self) -> Dict[str, Any]:
-        summary: Dict[str, Any] = {}
-        for agent_name in self.agents:
-            proposals = [
-                msg
-                for msg in self.messages
-                if msg.sender == agent_name and msg.payload.get("action") == "propose_trade"
-            ]
-            proposal_terms = [
-                (
-                    msg.payload.get("to"),
-                    msg.payload.get("give"),
-                    msg.payload.get("receive"),
+        # One pass over messages and events; scanning them per agent is quadratic in N.
+        proposal_terms: Dict[str, List[Tuple[Any, Any, Any]]] = {name: [] for name in self.agents}
+        messages_sent = dict.fromkeys(self.agents, 0)
+        invalid_actions = dict.fromkeys(self.agents, 0)
+        for msg in self.messages:
+            if msg.sender not in proposal_terms:
+                continue
+            action = msg.payload.get("action")
+            if action == "propose_trade":
+                proposal_terms[msg.sender].append(
+                    (msg.payload.get("to"), msg.payload.get("give"), msg.payload.get("receive"))
                 )
-                for msg in proposals
-            ]
-            unique_partners = len({term[0] for term in proposal_terms if term[0]})
-            repeated_identical = len(proposal_terms) - len(set(proposal_terms))
-            send_messages = [
-                msg
-                for msg in self.messages
-                if msg.sender == agent_name and msg.payload.get("action") == "send_message"
-            ]
-            invalid_actions = [
-                ev
-                for ev in self.events
-                if ev.get("event") == "invalid_action" and ev.get("agent") == agent_name
-            ]
+            elif action == "send_message":
+                messages_sent[msg.sender] += 1
+        for ev in self.events:
+            if ev.get("event") == "invalid_action" and ev.get("agent") in invalid_actions:
+                invalid_actions[ev["agent"]] += 1
+
+        summary: Dict[str, Any] = {}
+        for agent_name, terms in proposal_terms.items():
             summary[agent_name] = {
-                "proposals": len(proposals),
-                "unique_partners": unique_partners,
-                "repeated_identical_proposals": repeated_identical,
-                "messages_sent": len(send_messages),
-                "invalid_actions": len(invalid_actions),
+                "proposals": len(terms),
+                "unique_partners": len({term[0] for term in terms if term[0]}),
+                "repeated_identical_proposals": len(terms) - len(set(terms)),
+                "messages_sent": messages_sent[agent_name],
+                "invalid_actions": invalid_actions[agent_name],
             }
         return summary
 
@@ -182,11 +599,8 @@ class BaseSimulation:
             "round": message.round_number,
             "payload": message.payload,
         }
-        state = self.agents[agent_name]
-        state.history.append(entry)
-        # Trim history to keep prompt sizes bounded.
-        if len(state.history) > self.history_limit:
-            state.history = state.history[-self.history_limit :]
+        # The deque is bounded by history_limit, which keeps prompt sizes bounded.
+        self.agents[agent_name].record_history(entry)
 
     def _log_message(self, message: MessageLogEntry) -> None:
         self.messages.append(message)
@@ -221,7 +635,29 @@ class BaseSimulation:
                 return indices
 
 
+@register_condition
 class BarterSimulation(BaseSimulation):
+    """Decentralized barter among LLM agents.
+
+    With `stall_rounds` = k > 0 a run stops once k consecutive rounds had every decision
+    `idle`, no trade and no open proposal, instead of paying for rounds up to the cap; in
+    conditions that set `skips_satisfied_agents` (credit and chat), agents that hold their
+    target and have no new message or open proposal to answer are not asked at all. Both
+    are recorded in the result's `stall` entry; `rounds_run` stays the rounds played. A
+    proposal counts as open only until its receiver has decided once without answering it,
+    and only while its proposer still holds the offered good; it stays acceptable after.
+    """
+
+    condition = "barter"
+    system_prompt = staticmethod(prompts.barter_system_prompt)
+    user_prompt = staticmethod(prompts.barter_user_prompt)
+    skips_satisfied_agents = False
+    option_help = {
+        "stall_rounds": "End a run after this many consecutive rounds in which every agent "
+        "chose idle, nothing traded and no proposal is open; credit and chat conditions also "
+        "skip calls for satisfied agents with nothing to answer (0 turns this off).",
+    }
+
     def __init__(
         self,
         n_agents: int,
@@ -230,60 +666,164 @@ class BarterSimulation(BaseSimulation):
         history_limit: int,
         llm_client: LLMClient,
         model_name: str,
+        stall_rounds: int = 0,
     ):
         super().__init__(n_agents, rounds, seed, history_limit, llm_client, model_name)
+        self.stall_rounds = stall_rounds
+        self.skipped_calls_by_round: List[int] = []
+        self.stalled_at: Optional[int] = None
+        # Agents that received a message since they were last asked for a decision.
+        self._unanswered: Set[str] = set()
+        # The last round each agent was asked for a decision.
+        self._decided_in: Dict[str, int] = {}
         target_indices = self._derangement()
         for idx in range(n_agents):
             agent_name = f"A{idx}"
             endowment = self.goods[idx]
             target = self.goods[target_indices[idx]]
             self.agents[agent_name] = AgentState(
-                name=agent_name, inventory={endowment: 1}, target_good=target
+                name=agent_name,
+                inventory={endowment: 1},
+                target_good=target,
+                history_limit=history_limit,
             )
 
-    def run(self) -> SimulationResult:
-        for round_number in range(1, self.rounds + 1):
-            actions: Dict[str, Dict[str, Any]] = {}
-            for agent in self.agents.values():
-                system_prompt = prompts.barter_system_prompt(
-                    agent.name, agent.inventory, agent.target_good
-                )
-                user_prompt = prompts.barter_user_prompt(
-                    round_number,
-                    agent.recent_history(self.history_limit),
-                    agent.inventory,
-                    agent.target_good,
-                )
-                messages = [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ]
-                action = self.llm_client.complete_json(messages)
-                self._log_agent_action(round_number, agent, action)
-                actions[agent.name] = action
+    def _agent_messages(self, agent: AgentState, round_number: int) -> List[Dict[str, str]]:
+        system_prompt = agent.prompt_cache.system(
+            agent.system_prompt_key(),
+            lambda: self.system_prompt(agent.name, agent.inventory, agent.target_good),
+        )
+        user_prompt = agent.prompt_cache.user(
+            round_number,
+            agent.user_prompt_key(),
+            lambda round_value: self.user_prompt(
+                round_value,
+                agent.recent_history_json(self.history_limit),
+                agent.inventory,
+                agent.target_good,
+            ),
+        )
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
 
-            self._apply_barter_actions(actions, round_number)
+    def steps(self) -> SimulationSteps:
+        self._start_clock()
+        last_round = 0
+        idle_rounds = 0
+        for round_number in range(1, self.rounds + 1):
+            last_round = round_number
+            self.current_round = round_number
+            deciding = [agent for agent in self.agents.values() if not self._can_skip(agent)]
+            with timed(self.span_recorder, "prompts", round_number):
+                batch = {
+                    agent.name: self._agent_messages(agent, round_number) for agent in deciding
+                }
+            self._unanswered.difference_update(batch)
+            responses = yield batch
+            with timed(self.span_recorder, "actions", round_number):
+                actions: Dict[str, Dict[str, Any]] = {}
+                for agent in deciding:
+                    action = responses[agent.name]
+                    self._log_agent_action(round_number, agent, action)
+                    actions[agent.name] = action
+
+                self._apply_barter_actions(actions, round_number)
+            self._record_round()
+            if self.stall_rounds:
+                self.skipped_calls_by_round.append(self.n_agents - len(deciding))
+                self._decided_in.update((name, round_number) for name in batch)
             if self._success_count() == self.n_agents:
                 break
+            idle_rounds = idle_rounds + 1 if self._idle_round(actions) else 0
+            if self.stall_rounds and idle_rounds >= self.stall_rounds:
+                self.stalled_at = round_number
+                self._log_event(
+                    "run_stalled",
+                    round=round_number,
+                    idle_rounds=idle_rounds,
+                    skipped_rounds=self.rounds - round_number,
+                )
+                break
 
-        return SimulationResult(
-            condition="barter",
-            n_agents=self.n_agents,
-            seed=self._seed,
-            rounds_run=round_number,
-            messages=self.messages,
-            agents=self._agent_metadata(),
-            inventory_final=self._inventory_snapshot(),
-            successful_agents=self._success_count(),
-            parameters={
-                "rounds": self.rounds,
-                "history_limit": self.history_limit,
-                "model": self.model_name,
-            },
-            events=self.events,
-            behavior_summary=self._behavior_summary(),
+        return self._result(last_round)
+
+    def _can_skip(self, agent: AgentState) -> bool:
+        """Whether a satisfied agent has nothing to answer this round (stall detection only)."""
+        return (
+            self.stall_rounds > 0
+            and self.skips_satisfied_agents
+            and agent.inventory.get(agent.target_good, 0) >= 1
+            and agent.name not in self._unanswered
+            and all(proposal.receiver != agent.name for proposal in self._open_proposals())
         )
 
+    def _open_proposals(self) -> List[MessageLogEntry]:
+        """Proposals the receiver has not yet passed over and the proposer can still honour.
+
+        A proposal made in round r is first seen in round r + 1; a receiver that decides
+        in a later round without accepting or rejecting it has ignored it. Offers of
+        something other than a good (credit IOUs) never run out.
+        """
+        open_proposals = []
+        for proposal in self._proposals.values():
+            give = proposal.payload.get("give")
+            if self._decided_in.get(proposal.receiver, 0) > proposal.round_number:
+                continue
+            if give in self.goods and self.agents[proposal.sender].inventory.get(give, 0) <= 0:
+                continue
+            open_proposals.append(proposal)
+        return open_proposals
+
+    def _idle_round(self, actions: Mapping[str, Dict[str, Any]]) -> bool:
+        """No trade, no open proposal and only `idle` decisions (skipped agents count as idle)."""
+        return (
+            not self._open_proposals()
+            and self.trades_by_round[-1] == 0
+            and all(action.get("action") == "idle" for action in actions.values())
+        )
+
+    def _log_message(self, message: MessageLogEntry) -> None:
+        super()._log_message(message)
+        if message.receiver in self.agents:
+            self._unanswered.add(message.receiver)
+
+    def _parameters(self) -> Dict[str, Any]:
+        parameters = super()._parameters()
+        # Only runs with stall detection record it, so other logs keep their parameters.
+        if self.stall_rounds:
+            parameters["stall_rounds"] = self.stall_rounds
+        return parameters
+
+    def _result(self, rounds_run: int, **extra: Any) -> SimulationResult:
+        if self.stall_rounds:
+            extra["stall"] = {
+                "stall_rounds": self.stall_rounds,
+                "stalled": self.stalled_at is not None,
+                "skipped_rounds": 0 if self.stalled_at is None else self.rounds - self.stalled_at,
+                "skipped_calls": sum(self.skipped_calls_by_round),
+                "skipped_calls_by_round": list(self.skipped_calls_by_round),
+            }
+        return super()._result(rounds_run, **extra)
+
+    def agent_steps(self, agent_name: str) -> SimulationSteps:
+        if self.stall_rounds:
+            raise ValueError("Stall detection needs synchronous rounds; run without stall_rounds")
+        self._start_clock()
+        agent = self.agents[agent_name]
+        for round_number in range(1, self.rounds + 1):
+            with timed(self.span_recorder, "prompts", round_number):
+                batch = {agent.name: self._agent_messages(agent, round_number)}
+            responses = yield batch
+            self._tick(round_number)
+            with timed(self.span_recorder, "actions", round_number):
+                action = responses[agent.name]
+                self._log_agent_action(round_number, agent, action)
+                self._apply_barter_actions({agent.name: action}, round_number)
+            self._record_round()
+        return self._result(self.current_round)
+
     def _apply_barter_actions(
         self, actions: Mapping[str, Dict[str, Any]], round_number: int
     ) -> None:
@@ -436,6 +976,7 @@ class BarterSimulation(BaseSimulation):
             )
             return
 
+        self._count_trade()
         self._log_event(
             "trade_executed",
             round=round_number,
@@ -529,49 +1070,12 @@ class BarterSimulation(BaseSimulation):
         return True
 
 
+@register_condition
 class BarterWithCreditSimulation(BarterSimulation):
-    def run(self) -> SimulationResult:
-        for round_number in range(1, self.rounds + 1):
-            actions: Dict[str, Dict[str, Any]] = {}
-            for agent in self.agents.values():
-                system_prompt = prompts.barter_credit_system_prompt(
-                    agent.name, agent.inventory, agent.target_good
-                )
-                user_prompt = prompts.barter_credit_user_prompt(
-                    round_number,
-                    agent.recent_history(self.history_limit),
-                    agent.inventory,
-                    agent.target_good,
-                )
-                messages = [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ]
-                action = self.llm_client.complete_json(messages)
-                self._log_agent_action(round_number, agent, action)
-                actions[agent.name] = action
-
-            self._apply_barter_actions(actions, round_number)
-            if self._success_count() == self.n_agents:
-                break
-
-        return SimulationResult(
-            condition="barter_credit",
-            n_agents=self.n_agents,
-            seed=self._seed,
-            rounds_run=round_number,
-            messages=self.messages,
-            agents=self._agent_metadata(),
-            inventory_final=self._inventory_snapshot(),
-            successful_agents=self._success_count(),
-            parameters={
-                "rounds": self.rounds,
-                "history_limit": self.history_limit,
-                "model": self.model_name,
-            },
-            events=self.events,
-            behavior_summary=self._behavior_summary(),
-        )
+    condition = "barter_credit"
+    skips_satisfied_agents = True
+    system_prompt = staticmethod(prompts.barter_credit_system_prompt)
+    user_prompt = staticmethod(prompts.barter_credit_user_prompt)
 
     def _apply_barter_actions(
         self, actions: Mapping[str, Dict[str, Any]], round_number: int
@@ -740,6 +1244,7 @@ class BarterWithCreditSimulation(BarterSimulation):
             )
             return
 
+        self._count_trade()
         self._log_event(
             "trade_executed",
             round=round_number,
@@ -785,97 +1290,29 @@ class BarterWithCreditSimulation(BarterSimulation):
         return True
 
 
+@register_condition
 class BarterChatSimulation(BarterSimulation):
-    def run(self) -> SimulationResult:
-        for round_number in range(1, self.rounds + 1):
-            actions: Dict[str, Dict[str, Any]] = {}
-            for agent in self.agents.values():
-                system_prompt = prompts.barter_chat_system_prompt(
-                    agent.name, agent.inventory, agent.target_good
-                )
-                user_prompt = prompts.barter_chat_user_prompt(
-                    round_number,
-                    agent.recent_history(self.history_limit),
-                    agent.inventory,
-                    agent.target_good,
-                )
-                messages = [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ]
-                action = self.llm_client.complete_json(messages)
-                self._log_agent_action(round_number, agent, action)
-                actions[agent.name] = action
-
-            self._apply_barter_actions(actions, round_number)
-            if self._success_count() == self.n_agents:
-                break
-
-        return SimulationResult(
-            condition="barter_chat",
-            n_agents=self.n_agents,
-            seed=self._seed,
-            rounds_run=round_number,
-            messages=self.messages,
-            agents=self._agent_metadata(),
-            inventory_final=self._inventory_snapshot(),
-            successful_agents=self._success_count(),
-            parameters={
-                "rounds": self.rounds,
-                "history_limit": self.history_limit,
-                "model": self.model_name,
-            },
-            events=self.events,
-            behavior_summary=self._behavior_summary(),
-        )
+    condition = "barter_chat"
+    skips_satisfied_agents = True
+    system_prompt = staticmethod(prompts.barter_chat_system_prompt)
+    user_prompt = staticmethod(prompts.barter_chat_user_prompt)
 
 
+@register_condition
 class BarterChatCreditSimulation(BarterWithCreditSimulation):
-    def run(self) -> SimulationResult:
-        for round_number in range(1, self.rounds + 1):
-            actions: Dict[str, Dict[str, Any]] = {}
-            for agent in self.agents.values():
-                system_prompt = prompts.barter_chat_credit_system_prompt(
-                    agent.name, agent.inventory, agent.target_good
-                )
-                user_prompt = prompts.barter_chat_credit_user_prompt(
-                    round_number,
-                    agent.recent_history(self.history_limit),
-                    agent.inventory,
-                    agent.target_good,
-                )
-                messages = [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ]
-                action = self.llm_client.complete_json(messages)
-                self._log_agent_action(round_number, agent, action)
-                actions[agent.name] = action
+    condition = "barter_chat_credit"
+    system_prompt = staticmethod(prompts.barter_chat_credit_system_prompt)
+    user_prompt = staticmethod(prompts.barter_chat_credit_user_prompt)
 
-            self._apply_barter_actions(actions, round_number)
-            if self._success_count() == self.n_agents:
-                break
 
-        return SimulationResult(
-            condition="barter_chat_credit",
-            n_agents=self.n_agents,
-            seed=self._seed,
-            rounds_run=round_number,
-            messages=self.messages,
-            agents=self._agent_metadata(),
-            inventory_final=self._inventory_snapshot(),
-            successful_agents=self._success_count(),
-            parameters={
-                "rounds": self.rounds,
-                "history_limit": self.history_limit,
-                "model": self.model_name,
-            },
-            events=self.events,
-            behavior_summary=self._behavior_summary(),
-        )
+@register_condition
+class CentralPlannerSimulation(BaseSimulation):
+    condition = "central_planner"
 
+    @classmethod
+    def calls_per_round(cls, n_agents: int) -> int:
+        return 0
 
-class CentralPlannerSimulation(BaseSimulation):
     def __init__(
         self,
         n_agents: int,
@@ -892,15 +1329,22 @@ class CentralPlannerSimulation(BaseSimulation):
             endowment = self.goods[idx]
             target = self.goods[target_indices[idx]]
             self.agents[agent_name] = AgentState(
-                name=agent_name, inventory={endowment: 1}, target_good=target
+                name=agent_name,
+                inventory={endowment: 1},
+                target_good=target,
+                history_limit=history_limit,
             )
 
-    def run(self) -> SimulationResult:
+    def steps(self) -> SimulationSteps:
+        # The planner is rule-based and never asks the LLM for a decision.
+        yield from ()
+        self._start_clock()
         planner_name = "Planner"
         last_round = 0
 
         for round_number in range(1, self.rounds + 1):
             last_round = round_number
+            self.current_round = round_number
             for agent in self.agents.values():
                 report_message = MessageLogEntry(
                     round_number=round_number,
@@ -915,7 +1359,9 @@ class CentralPlannerSimulation(BaseSimulation):
                 )
                 self._log_message(report_message)
 
-            trades = self._planner_pairwise_trades(round_number, planner_name)
+            with timed(self.span_recorder, "actions", round_number):
+                trades = self._planner_pairwise_trades(round_number, planner_name)
+            self._record_round()
             if trades == 0 and self._success_count() == self.n_agents:
                 break
 
@@ -929,23 +1375,7 @@ class CentralPlannerSimulation(BaseSimulation):
             )
             self._log_message(assignment_message)
 
-        return SimulationResult(
-            condition="central_planner",
-            n_agents=self.n_agents,
-            seed=self._seed,
-            rounds_run=last_round,
-            messages=self.messages,
-            agents=self._agent_metadata(),
-            inventory_final=self._inventory_snapshot(),
-            successful_agents=self._success_count(),
-            parameters={
-                "rounds": self.rounds,
-                "history_limit": self.history_limit,
-                "model": self.model_name,
-            },
-            events=self.events,
-            behavior_summary=self._behavior_summary(),
-        )
+        return self._result(last_round)
 
     def _planner_pairwise_trades(self, round_number: int, planner_name: str) -> int:
         trades_done = 0
@@ -970,6 +1400,7 @@ class CentralPlannerSimulation(BaseSimulation):
                 state_b.inventory[good_b] -= 1
                 state_b.inventory[good_a] = state_b.inventory.get(good_a, 0) + 1
                 trades_done += 1
+                self._count_trade()
 
                 payload = {
                     "action": "swap",
@@ -990,7 +1421,16 @@ class CentralPlannerSimulation(BaseSimulation):
         return trades_done
 
 
+@register_condition
 class MoneyExchangeSimulation(BaseSimulation):
+    condition = "money_exchange"
+    hub_calls_per_round = 1
+    option_help = {
+        "starting_money": "Money each agent starts with; the Exchange starts with "
+        "max(3 x N x this, 2 x N).",
+        "exchange_inventory_units": "Units of every good the Exchange holds at the start.",
+    }
+
     def __init__(
         self,
         n_agents: int,
@@ -1013,98 +1453,162 @@ class MoneyExchangeSimulation(BaseSimulation):
                 inventory={endowment: 1},
                 target_good=target,
                 money=starting_money,
+                history_limit=history_limit,
             )
         self.exchange_inventory: Dict[str, int] = {
             good: exchange_inventory_units for good in self.goods
         }
+        self.agent_starting_money = starting_money
+        self.exchange_inventory_units = exchange_inventory_units
         self.exchange_money: float = max(n_agents * starting_money * 3, n_agents * 2.0)
         self.prices: Dict[str, float] = {good: 1.0 for good in self.goods}
         self.price_history: List[Dict[str, float]] = []
         self.exchange_round_metrics: List[Dict[str, Any]] = []
 
-    def run(self) -> SimulationResult:
+    def _agent_messages(self, agent: AgentState, round_number: int) -> List[Dict[str, str]]:
+        system_prompt = agent.prompt_cache.system(
+            agent.system_prompt_key(),
+            lambda: prompts.money_agent_system_prompt(
+                agent.name, agent.inventory, agent.money, agent.target_good
+            ),
+        )
+        user_prompt = agent.prompt_cache.user(
+            round_number,
+            agent.user_prompt_key(),
+            lambda round_value: prompts.money_agent_user_prompt(
+                round_value,
+                agent.recent_history_json(self.history_limit),
+                agent.inventory,
+                agent.money,
+                agent.target_good,
+            ),
+        )
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    def steps(self) -> SimulationSteps:
+        self._start_clock()
         last_round = 0
         for round_number in range(1, self.rounds + 1):
             last_round = round_number
+            self.current_round = round_number
             previous_prices = dict(self.prices)
-            inbox = self._collect_exchange_inbox(round_number)
-            inbox_actions: Counter[str] = Counter()
-            for entry in inbox:
-                action = entry.get("payload", {}).get("action")
-                if action:
-                    inbox_actions[action] += 1
-
-            outbox_actions: Counter[str] = Counter()
-            if inbox:
-                outbox_actions = Counter(self._process_exchange_round(inbox, round_number))
-
-            price_updates: Dict[str, float] = {}
-            total_abs_change = 0.0
-            for good, price in self.prices.items():
-                old_price = previous_prices.get(good, price)
-                if price != old_price:
-                    delta = float(price - old_price)
-                    price_updates[good] = delta
-                    total_abs_change += abs(delta)
-
-            self.exchange_round_metrics.append(
-                {
-                    "round": round_number,
-                    "inbox_total": len(inbox),
-                    "inbox_by_action": dict(inbox_actions),
-                    "outbox_total": sum(outbox_actions.values()),
-                    "outbox_by_action": dict(outbox_actions),
-                    "price_update_count": len(price_updates),
-                    "price_total_abs_change": total_abs_change,
-                    "price_updates": price_updates,
+            with timed(self.span_recorder, "prompts", round_number):
+                batch = {
+                    agent.name: self._agent_messages(agent, round_number)
+                    for agent in self.agents.values()
                 }
-            )
-            self.price_history.append(dict(self.prices))
+            responses = yield batch
+            with timed(self.span_recorder, "actions", round_number):
+                inbox = self._collect_exchange_inbox(round_number, responses)
+            outbox_actions: Dict[str, int] = {}
+            if inbox:
+                with timed(self.span_recorder, "prompts", round_number):
+                    batch = {EXCHANGE_NAME: self._exchange_messages(inbox, round_number)}
+                hub_responses = yield batch
+                with timed(self.span_recorder, "actions", round_number):
+                    outbox_actions = self._process_exchange_round(
+                        inbox, round_number, hub_responses[EXCHANGE_NAME]
+                    )
+            self._record_exchange_round(round_number, previous_prices, inbox, outbox_actions)
+            self._record_round()
 
             if self._success_count() == self.n_agents:
                 break
 
-        return SimulationResult(
-            condition="money_exchange",
-            n_agents=self.n_agents,
-            seed=self._seed,
-            rounds_run=last_round,
-            messages=self.messages,
-            agents=self._agent_metadata(),
-            inventory_final=self._inventory_snapshot(),
-            successful_agents=self._success_count(),
-            parameters={
-                "rounds": self.rounds,
-                "history_limit": self.history_limit,
-                "model": self.model_name,
-                "starting_money": self.exchange_money,
-            },
+        return self._result(last_round)
+
+    def agent_steps(self, agent_name: str) -> SimulationSteps:
+        self._start_clock()
+        agent = self.agents[agent_name]
+        for round_number in range(1, self.rounds + 1):
+            with timed(self.span_recorder, "prompts", round_number):
+                batch = {agent.name: self._agent_messages(agent, round_number)}
+            responses = yield batch
+            self._tick(round_number)
+            with timed(self.span_recorder, "actions", round_number):
+                inbox = self._collect_exchange_inbox(round_number, responses)
+            self._record_round()
+            if not inbox:
+                continue
+            # The hub answers each request on arrival instead of once per global round.
+            previous_prices = dict(self.prices)
+            with timed(self.span_recorder, "prompts", round_number):
+                batch = {EXCHANGE_NAME: self._exchange_messages(inbox, round_number)}
+            hub_responses = yield batch
+            self._tick(round_number)
+            with timed(self.span_recorder, "actions", round_number):
+                outbox_actions = self._process_exchange_round(
+                    inbox, round_number, hub_responses[EXCHANGE_NAME]
+                )
+            self._record_exchange_round(round_number, previous_prices, inbox, outbox_actions)
+            self._record_round()
+        return self._result(self.current_round)
+
+    def _result(self, rounds_run: int, **extra: Any) -> SimulationResult:
+        return super()._result(
+            rounds_run,
             exchange_inventory=dict(self.exchange_inventory),
             exchange_money=self.exchange_money,
             exchange_price_history=self.price_history,
             exchange_round_metrics=self.exchange_round_metrics,
-            events=self.events,
-            behavior_summary=self._behavior_summary(),
+            **extra,
         )
 
-    def _collect_exchange_inbox(self, round_number: int) -> List[Dict[str, Any]]:
+    def _record_exchange_round(
+        self,
+        round_number: int,
+        previous_prices: Dict[str, float],
+        inbox: List[Dict[str, Any]],
+        outbox_actions: Mapping[str, int],
+    ) -> None:
+        inbox_actions: Counter[str] = Counter()
+        for entry in inbox:
+            action = entry.get("payload", {}).get("action")
+            if action:
+                inbox_actions[action] += 1
+
+        price_updates: Dict[str, float] = {}
+        total_abs_change = 0.0
+        for good, price in self.prices.items():
+            old_price = previous_prices.get(good, price)
+            if price != old_price:
+                delta = float(price - old_price)
+                price_updates[good] = delta
+                total_abs_change += abs(delta)
+
+        metrics: Dict[str, Any] = {
+            "round": round_number,
+            "inbox_total": len(inbox),
+            "inbox_by_action": dict(inbox_actions),
+            "outbox_total": sum(outbox_actions.values()),
+            "outbox_by_action": dict(outbox_actions),
+            "price_update_count": len(price_updates),
+            "price_total_abs_change": total_abs_change,
+            "price_updates": price_updates,
+        }
+        if self.clock is not None:
+            metrics["clock"] = self.clock
+        self.exchange_round_metrics.append(metrics)
+        self.price_history.append(dict(self.prices))
+
+    def _parameters(self) -> Dict[str, Any]:
+        parameters = super()._parameters()
+        parameters["starting_money"] = self.exchange_money
+        parameters["agent_starting_money"] = self.agent_starting_money
+        parameters["exchange_inventory_units"] = self.exchange_inventory_units
+        return parameters
+
+    def _collect_exchange_inbox(
+        self, round_number: int, actions: DecisionResponses
+    ) -> List[Dict[str, Any]]:
         inbox: List[Dict[str, Any]] = []
         for agent in self.agents.values():
-            system_prompt = prompts.money_agent_system_prompt(
-                agent.name, agent.inventory, agent.money, agent.target_good
-            )
-            user_prompt = prompts.money_agent_user_prompt(
-                round_number,
-                agent.recent_history(self.history_limit),
-                agent.inventory,
-                agent.money,
-                agent.target_good,
-            )
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ]
-            action = self.llm_client.complete_json(messages)
+            if agent.name not in actions:
+                continue
+            action = actions[agent.name]
             self._log_agent_action(round_number, agent, action)
             if action.get("action") == "idle":
                 continue
@@ -1113,7 +1617,7 @@ class MoneyExchangeSimulation(BaseSimulation):
             message = MessageLogEntry(
                 round_number=round_number,
                 sender=agent.name,
-                receiver="Exchange",
+                receiver=EXCHANGE_NAME,
                 message_id=message_id,
                 payload=action,
             )
@@ -1121,19 +1625,22 @@ class MoneyExchangeSimulation(BaseSimulation):
             self._log_message(message)
         return inbox
 
-    def _process_exchange_round(
+    def _exchange_messages(
         self, inbox: List[Dict[str, Any]], round_number: int
-    ) -> Dict[str, int]:
+    ) -> List[Dict[str, str]]:
         aggregate_state = self._aggregate_state()
         system_prompt = prompts.exchange_system_prompt()
         user_prompt = prompts.exchange_user_prompt(
             round_number, self.prices, aggregate_state, inbox
         )
-        messages = [
+        return [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ]
-        response = self.llm_client.complete_json(messages)
+
+    def _process_exchange_round(
+        self, inbox: List[Dict[str, Any]], round_number: int, response: Dict[str, Any]
+    ) -> Dict[str, int]:
         self._log_event("exchange_action", round=round_number, response=response)
         outbox = response.get("outbox", [])
         if len(outbox) != len(inbox):
@@ -1159,7 +1666,7 @@ class MoneyExchangeSimulation(BaseSimulation):
             agent_name = inbox_entry["from"]
             agent_message = MessageLogEntry(
                 round_number=round_number,
-                sender="Exchange",
+                sender=EXCHANGE_NAME,
                 receiver=agent_name,
                 message_id=self._next_message_id(),
                 payload=response_payload,
@@ -1208,6 +1715,7 @@ class MoneyExchangeSimulation(BaseSimulation):
             self.exchange_inventory[good] = 1
         self.exchange_inventory[good] -= 1
         agent_state.inventory[good] = agent_state.inventory.get(good, 0) + 1
+        self._count_trade()
 
     def _handle_sell(self, agent_state: AgentState, good: str, price: float) -> None:
         if agent_state.inventory.get(good, 0) <= 0:
@@ -1217,6 +1725,7 @@ class MoneyExchangeSimulation(BaseSimulation):
         self.exchange_inventory[good] = self.exchange_inventory.get(good, 0) + 1
         agent_state.money += price
         self.exchange_money -= price
+        self._count_trade()
 
     def _aggregate_state(self) -> Dict[str, Any]:
         inventory_totals: Dict[str, int] = {good: 0 for good in self.goods}
@@ -0,0 +1,328 @@
+"""Declarative sweeps: a YAML or TOML file expanded into an ordered, deduplicated job list.
+
+A sweep file names one run set (its output directory) and the grid to run in it:
+
+    output_dir = "runs_core"
+    conditions = ["barter", "money_exchange"]
+    n = [3, 5, 8, 10, 12]
+    seeds = 2                  # 0..seeds-1, or an explicit list
+    rounds = 8
+    history_limit = 10
+    model = "gpt-5-mini"
+    backend = "concurrent"     # serial, concurrent, async or batch
+    concurrency = 32
+    showcase_priority = 5      # optional: rank of this run set for the showcase table
+
+    [options]                  # per-condition options, e.g. starting_money
+    [sampling]                 # method = "random", samples = 20, seed = 0 draws from the grid
+    [budget]                   # decisions = 50000, tokens, usd, hours refuse larger plans
+    [prices]                   # USD per million input / output tokens, for unlisted models
+    [adaptive]                 # target_ci_width = 0.2 adds seeds where the CI is wide
+
+`plan_sweep` expands the grid (or a seeded random sample of it), drops jobs whose run log
+already exists in the output directory, and orders the rest by estimated cost, largest N
+first, so long runs start early and short ones fill the pool at the end. `write_manifest`
+records the plan next to the logs, and `register_run_set` adds the run set to the committed
+index (`results/run_sets.json`), from which the results pages pick their runs; run
+directories themselves are not committed. With `[adaptive]`, the grid seeds are only a
+starting point; see `agentic_economy.adaptive`.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import tomllib
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+from .logstream import LOG_FORMATS, log_stem
+from .monitor import decision_budget
+from .simulation import CONDITIONS, SimulationSpec, condition_options
+
+BACKENDS = ("serial", "concurrent", "async", "batch")
+SAMPLING_METHODS = ("grid", "random")
+# Hidden, so the `runs*/*.json` globs of analysis and export never read it as a run log.
+MANIFEST_NAME = ".sweep_manifest.json"
+DEFAULT_RUN_SETS_PATH = "results/run_sets.json"
+ADAPTIVE_KEYS = ("target_ci_width", "metric", "batch_size", "max_seeds")
+# Decisions are counted from the plan; tokens, dollars and hours need `planner` estimates.
+BUDGET_KEYS = ("decisions", "tokens", "usd", "hours")
+PRICE_KEYS = ("input", "output")
+
+
+def _require_yaml() -> Any:
+    try:
+        import yaml
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise RuntimeError(
+            "YAML sweep files need PyYAML: pip install 'agentic-economy[sweep]'"
+        ) from exc
+    return yaml
+
+
+def sweep_specs(
+    conditions: Sequence[str],
+    n_values: Sequence[int],
+    seeds: Sequence[int],
+    rounds: int,
+    history_limit: int,
+    model: str,
+    options: Optional[Mapping[str, Any]] = None,
+) -> List[SimulationSpec]:
+    """Specs of every (condition, N, seed), each given the options its condition accepts."""
+    options = {key: value for key, value in (options or {}).items() if value is not None}
+    specs: List[SimulationSpec] = []
+    for condition in conditions:
+        accepted = condition_options(condition)
+        condition_specific = {key: value for key, value in options.items() if key in accepted}
+        for n in n_values:
+            for seed in seeds:
+                specs.append(
+                    SimulationSpec(
+                        condition, n, seed, rounds, history_limit, model, dict(condition_specific)
+                    )
+                )
+    return specs
+
+
+@dataclass
+class SweepConfig:
+    output_dir: Path
+    conditions: List[str]
+    n_values: List[int]
+    seeds: List[int]
+    rounds: int
+    history_limit: int = 10
+    model: str = "gpt-5-mini"
+    backend: str = "serial"
+    concurrency: int = 1
+    log_format: str = "json"
+    options: Dict[str, Any] = field(default_factory=dict)
+    sampling: Dict[str, Any] = field(default_factory=dict)
+    budget: Dict[str, float] = field(default_factory=dict)
+    adaptive: Dict[str, Any] = field(default_factory=dict)
+    prices: Dict[str, float] = field(default_factory=dict)
+    showcase_priority: Optional[int] = None
+    batch_poll_interval: float = 30.0
+
+    @property
+    def run_set(self) -> str:
+        """The name analysis gives these runs (the output directory's name)."""
+        return self.output_dir.name
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["output_dir"] = self.output_dir.as_posix()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], default_output_dir: str = "runs") -> SweepConfig:
+        data = dict(data)
+        seeds = data.pop("seeds", 1)
+        n_values = data.pop("n", data.pop("n_values", None))
+        if isinstance(n_values, int):
+            n_values = [n_values]
+        if not n_values:
+            raise ValueError("Sweep needs at least one N (`n`)")
+        if "conditions" not in data or "rounds" not in data:
+            raise ValueError("Sweep needs `conditions` and `rounds`")
+        unknown = set(data) - {item.name for item in fields(cls)}
+        if unknown:
+            raise ValueError(f"Unknown sweep key(s) {', '.join(sorted(unknown))}")
+        config = cls(
+            output_dir=Path(data.pop("output_dir", default_output_dir)),
+            n_values=[int(n) for n in n_values],
+            seeds=list(range(seeds)) if isinstance(seeds, int) else [int(s) for s in seeds],
+            **data,
+        )
+        config.validate()
+        return config
+
+    def validate(self) -> None:
+        unknown = [condition for condition in self.conditions if condition not in CONDITIONS]
+        if unknown:
+            raise ValueError(f"Unknown condition(s) {', '.join(unknown)}")
+        if self.backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {self.backend!r}; expected one of {BACKENDS}")
+        if self.log_format not in LOG_FORMATS:
+            raise ValueError(f"Unknown log format {self.log_format!r}")
+        if self.backend == "async" and "central_planner" in self.conditions:
+            raise ValueError("The async backend needs LLM agents; central_planner has none")
+        accepted = {name for condition in self.conditions for name in condition_options(condition)}
+        if set(self.options) - accepted:
+            extra = ", ".join(sorted(set(self.options) - accepted))
+            raise ValueError(f"No condition of this sweep takes option(s) {extra}")
+        method = self.sampling.get("method", "grid")
+        if method not in SAMPLING_METHODS:
+            raise ValueError(f"Unknown sampling method {method!r}")
+        if method == "random" and int(self.sampling.get("samples", 0)) < 1:
+            raise ValueError("Random sampling needs `samples` >= 1")
+        if set(self.budget) - set(BUDGET_KEYS):
+            extra = ", ".join(sorted(set(self.budget) - set(BUDGET_KEYS)))
+            raise ValueError(f"Unknown [budget] key(s) {extra}")
+        if self.prices and sorted(self.prices) != sorted(PRICE_KEYS):
+            raise ValueError("[prices] needs exactly `input` and `output` (USD per 1M tokens)")
+        if self.adaptive:
+            if set(self.adaptive) - set(ADAPTIVE_KEYS):
+                extra = ", ".join(sorted(set(self.adaptive) - set(ADAPTIVE_KEYS)))
+                raise ValueError(f"Unknown [adaptive] key(s) {extra}")
+            # Only adaptive sweeps pay for importing analysis (and pandas) here.
+            from .adaptive import DEFAULT_METRIC
+            from .analysis import AGGREGATE_METRICS, CLEARING_COLUMNS
+
+            metric = self.adaptive.get("metric", DEFAULT_METRIC)
+            if metric not in AGGREGATE_METRICS + CLEARING_COLUMNS:
+                raise ValueError(f"Unknown [adaptive] metric {metric!r}")
+            if float(self.adaptive.get("target_ci_width", 0)) <= 0:
+                raise ValueError("[adaptive] needs a positive `target_ci_width`")
+            if int(self.adaptive.get("batch_size", 1)) < 1:
+                raise ValueError("[adaptive] `batch_size` must be at least 1")
+
+
+def load_sweep(path: Path) -> SweepConfig:
+    """Read a `.toml`, `.yaml` or `.yml` sweep file (YAML needs PyYAML)."""
+    if path.suffix == ".toml":
+        with path.open("rb") as handle:
+            data = tomllib.load(handle)
+    elif path.suffix in (".yaml", ".yml"):
+        data = _require_yaml().safe_load(path.read_text(encoding="utf-8")) or {}
+    else:
+        raise ValueError(f"Sweep files are .toml or .yaml, not {path.name}")
+    return SweepConfig.from_dict(data, default_output_dir=f"runs_{path.stem}")
+
+
+@dataclass
+class SweepJob:
+    spec: SimulationSpec
+    log_stem: str
+    estimated_decisions: int
+    exists: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.spec.to_dict(),
+            "log_stem": self.log_stem,
+            "estimated_decisions": self.estimated_decisions,
+            "status": "existing" if self.exists else "planned",
+        }
+
+
+def expand(config: SweepConfig) -> List[SimulationSpec]:
+    """The grid of the sweep, or a seeded random sample of it without replacement."""
+    specs = sweep_specs(
+        config.conditions,
+        config.n_values,
+        config.seeds,
+        config.rounds,
+        config.history_limit,
+        config.model,
+        config.options,
+    )
+    if config.sampling.get("method", "grid") == "random":
+        rng = random.Random(config.sampling.get("seed", 0))  # nosec B311 - job sampling
+        samples = min(int(config.sampling["samples"]), len(specs))
+        specs = [specs[index] for index in sorted(rng.sample(range(len(specs)), samples))]
+    return specs
+
+
+def existing_logs(output_dir: Path) -> set[str]:
+    """Stems of the run logs already in `output_dir`, in any log format."""
+    if not output_dir.is_dir():
+        return set()
+    return {
+        log_stem(path)
+        for path in output_dir.iterdir()
+        if not path.name.startswith(".")
+        and any(path.name.endswith(f".{log_format}") for log_format in LOG_FORMATS)
+    }
+
+
+def plan_sweep(config: SweepConfig) -> List[SweepJob]:
+    """Every job of the sweep, existing ones first, then pending ones largest first."""
+    suffix = "_async" if config.backend == "async" else ""
+    done = existing_logs(config.output_dir)
+    jobs = [
+        SweepJob(
+            spec=spec,
+            log_stem=f"{spec.condition}{suffix}_N{spec.n_agents}_seed{spec.seed}",
+            estimated_decisions=decision_budget(spec.n_agents, spec.rounds),
+        )
+        for spec in expand(config)
+    ]
+    for job in jobs:
+        job.exists = job.log_stem in done
+    # Stable sort: equal-cost jobs keep their grid order.
+    return sorted(jobs, key=lambda job: (not job.exists, -job.estimated_decisions))
+
+
+def check_budget(config: SweepConfig, jobs: Sequence[SweepJob]) -> None:
+    """Refuse a plan whose pending jobs exceed the sweep's decision budget."""
+    limit = config.budget.get("decisions")
+    needed = sum(job.estimated_decisions for job in jobs if not job.exists)
+    if limit is not None and needed > limit:
+        raise ValueError(
+            f"Sweep {config.run_set} needs up to {needed} agent decisions, "
+            f"over its budget of {int(limit)}"
+        )
+
+
+def write_manifest(
+    config: SweepConfig,
+    jobs: Sequence[SweepJob],
+    adaptive_rounds: Optional[Sequence[Mapping[str, Any]]] = None,
+) -> Path:
+    """Record the plan; adaptive sweeps add each allocation round once they have run."""
+    path = config.output_dir / MANIFEST_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    manifest: Dict[str, Any] = {
+        "run_set": config.run_set,
+        "planned_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "sweep": config.to_dict(),
+        "jobs": [job.to_dict() for job in jobs],
+    }
+    if adaptive_rounds is not None:
+        manifest["adaptive_rounds"] = list(adaptive_rounds)
+    path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def load_run_sets(path: Union[str, Path] = DEFAULT_RUN_SETS_PATH) -> Dict[str, Dict[str, Any]]:
+    """The run set index (run set name -> entry); empty when the file does not exist."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    run_sets: Dict[str, Dict[str, Any]] = json.loads(path.read_text(encoding="utf-8"))
+    return run_sets
+
+
+def register_run_set(
+    config: SweepConfig, path: Union[str, Path] = DEFAULT_RUN_SETS_PATH
+) -> Dict[str, Any]:
+    """Add or refresh the sweep's entry in the run set index."""
+    path = Path(path)
+    run_sets = load_run_sets(path)
+    entry: Dict[str, Any] = {
+        "manifest": (config.output_dir / MANIFEST_NAME).as_posix(),
+        "conditions": list(config.conditions),
+        "n_values": list(config.n_values),
+        "rounds": config.rounds,
+        "model": config.model,
+    }
+    if config.showcase_priority is not None:
+        entry["showcase_priority"] = config.showcase_priority
+    run_sets[config.run_set] = entry
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(run_sets, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return entry
+
+
+def showcase_priorities(run_sets: Mapping[str, Mapping[str, Any]]) -> Dict[str, int]:
+    """Run set -> showcase rank (higher wins); unranked run sets are left out (rank 0)."""
+    return {
+        name: int(entry["showcase_priority"])
+        for name, entry in run_sets.items()
+        if entry.get("showcase_priority") is not None
+    }
@@ -0,0 +1,245 @@
+"""OpenTelemetry-compatible traces of runs, written as OTLP/JSON lines.
+
+Each run is one trace: a `run` span, a `round` span per round, a `decision` span per LLM
+decision (agent, tokens, retry count) and a client `http_attempt` span per API attempt, so
+tail latency and retry storms can be inspected call by call offline. Spans are buffered per
+run and appended to the trace file as one OTLP `ExportTraceServiceRequest` JSON object per
+line when the run ends, the format of the OpenTelemetry Collector's file exporter; the
+collector's `otlpjsonfile` receiver or any OTLP/JSON reader can load it. No OpenTelemetry
+package is needed.
+
+Round spans run from the end of the previous round (or the start of the run) to the last
+`_record_round` of the round; with asynchronous rounds they therefore overlap.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from . import __version__
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_ERROR = 2
+SCOPE_NAME = "agentic_economy"
+HTTP_STATUS_BY_ERROR = {"RateLimitError": 429, "APITimeoutError": 408}
+
+
+def _attribute_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # OTLP/JSON encodes 64-bit integers as strings.
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def encode_attributes(attributes: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {"key": key, "value": _attribute_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+class RunTrace:
+    """The spans of one simulation run, finished and exported by `TraceExporter.finish`."""
+
+    def __init__(self, attributes: Mapping[str, Any]) -> None:
+        self.trace_id = os.urandom(16).hex()
+        self.run_span_id = os.urandom(8).hex()
+        self.attributes = dict(attributes)
+        self.started_ns: Optional[int] = None
+        self.spans: List[Dict[str, Any]] = []
+        self._rounds: Dict[int, Dict[str, Any]] = {}
+        self._last_round_end_ns: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        if self.started_ns is None:
+            self.started_ns = time.time_ns()
+
+    def _span(
+        self,
+        name: str,
+        parent_id: str,
+        start_ns: int,
+        end_ns: int,
+        attributes: Mapping[str, Any],
+        kind: int = SPAN_KIND_INTERNAL,
+        error: Optional[str] = None,
+        span_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        span: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": span_id or os.urandom(8).hex(),
+            "parentSpanId": parent_id,
+            "name": name,
+            "kind": kind,
+            "startTimeUnixNano": str(start_ns),
+            "endTimeUnixNano": str(end_ns),
+            "attributes": encode_attributes(attributes),
+        }
+        if error is not None:
+            span["status"] = {"code": STATUS_ERROR, "message": error}
+        return span
+
+    def _round(self, round_number: int) -> Dict[str, Any]:
+        """The open round span record, created on first use (caller holds the lock)."""
+        record = self._rounds.get(round_number)
+        if record is None:
+            start = self._last_round_end_ns or self.started_ns or time.time_ns()
+            record = {"span_id": os.urandom(8).hex(), "start_ns": start, "end_ns": start}
+            self._rounds[round_number] = record
+        return record
+
+    def end_round(self, round_number: int, trades: int, successful_agents: int) -> None:
+        now = time.time_ns()
+        with self._lock:
+            record = self._round(round_number)
+            record["end_ns"] = max(record["end_ns"], now)
+            record["attributes"] = {
+                "round": round_number,
+                "trades": trades,
+                "successful_agents": successful_agents,
+            }
+            self._last_round_end_ns = now
+
+    def decision(
+        self,
+        agent: str,
+        round_number: int,
+        start_ns: int,
+        end_ns: int,
+        tokens: Mapping[str, int],
+        attempts: Sequence[Mapping[str, Any]],
+        error: Optional[str] = None,
+    ) -> None:
+        decision_id = os.urandom(8).hex()
+        spans = [
+            self._span(
+                "http_attempt",
+                decision_id,
+                attempt["started_ns"],
+                attempt["started_ns"] + int(attempt["seconds"] * 1e9),
+                {
+                    "http.attempt": number,
+                    "gen_ai.request.model": self.attributes.get("model"),
+                    "error.type": attempt.get("error"),
+                    "http.response.status_code": (
+                        HTTP_STATUS_BY_ERROR.get(attempt["error"]) if attempt.get("error") else 200
+                    ),
+                },
+                kind=SPAN_KIND_CLIENT,
+                error=attempt.get("error"),
+            )
+            for number, attempt in enumerate(attempts, start=1)
+            if "started_ns" in attempt
+        ]
+        with self._lock:
+            round_id = self._round(round_number)["span_id"]
+            spans.append(
+                self._span(
+                    "decision",
+                    round_id,
+                    start_ns,
+                    end_ns,
+                    {
+                        "agent": agent,
+                        "round": round_number,
+                        "gen_ai.usage.input_tokens": tokens.get("input_tokens"),
+                        "gen_ai.usage.output_tokens": tokens.get("output_tokens"),
+                        "retry_count": max(len(attempts) - 1, 0),
+                    },
+                    error=error,
+                    span_id=decision_id,
+                )
+            )
+            self.spans.extend(spans)
+
+    def close(self, attributes: Mapping[str, Any], error: Optional[str] = None) -> List[Any]:
+        """Every span of the run, ending the run span now."""
+        end_ns = time.time_ns()
+        start_ns = self.started_ns or end_ns
+        with self._lock:
+            spans = list(self.spans)
+            for round_number, record in sorted(self._rounds.items()):
+                spans.append(
+                    self._span(
+                        "round",
+                        self.run_span_id,
+                        record["start_ns"],
+                        record["end_ns"],
+                        record.get("attributes", {"round": round_number}),
+                        span_id=record["span_id"],
+                    )
+                )
+        spans.append(
+            self._span(
+                "run",
+                "",
+                start_ns,
+                end_ns,
+                {**self.attributes, **attributes},
+                error=error,
+                span_id=self.run_span_id,
+            )
+        )
+        return spans
+
+
+class TraceExporter:
+    """Appends each finished run's spans to an OTLP/JSON lines file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._open: Dict[int, RunTrace] = {}
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    def trace(self, attributes: Mapping[str, Any]) -> RunTrace:
+        run = RunTrace(attributes)
+        with self._lock:
+            self._open[id(run)] = run
+        return run
+
+    def finish(
+        self, run: RunTrace, attributes: Mapping[str, Any], error: Optional[str] = None
+    ) -> None:
+        with self._lock:
+            if self._open.pop(id(run), None) is None:
+                return
+        self._write(run.close(attributes, error))
+
+    def close(self) -> None:
+        """Export runs that never finished (e.g. a sweep stopped by an error) as failed."""
+        with self._lock:
+            unfinished = list(self._open.values())
+        for run in unfinished:
+            self.finish(run, {}, error="run did not finish")
+
+    def _write(self, spans: List[Any]) -> None:
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": encode_attributes(
+                            {"service.name": "agentic-economy", "service.version": __version__}
+                        )
+                    },
+                    "scopeSpans": [
+                        {"scope": {"name": SCOPE_NAME, "version": __version__}, "spans": spans}
+                    ],
+                }
+            ]
+        }
+        line = json.dumps(request, separators=(",", ":")) + "\n"
+        with self._lock, self.path.open("a", encoding="utf-8") as handle:
+            handle.write(line)
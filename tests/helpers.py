@@ -0,0 +1,65 @@
+"""Shared test doubles: a stateless LLM responder and run-log comparison helpers."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Dict, List
+
+
+def respond_stateless(messages: List[Dict[str, str]]) -> Dict[str, Any]:
+    """Stateless responder: every driver sees identical decisions whatever the call order."""
+    system_content = messages[0]["content"]
+    user_content = messages[1]["content"]
+    if "central Exchange" in system_content:
+        inbox = json.loads(user_content.split('inbox":\n', 1)[1].split("\n\nEach inbox entry")[0])
+        outbox = []
+        for item in inbox:
+            payload = item["payload"]
+            side = "sell" if payload.get("action") == "sell" else "buy"
+            response = {
+                "action": "confirm",
+                "good": payload.get("good"),
+                "quantity": 1,
+                "price": 1.0,
+                "side": side,
+            }
+            outbox.append({"to_message_id": item["message_id"], "response": response})
+        return {"outbox": outbox}
+
+    agent = system_content.split("Your name:")[1].split("\n")[0].strip()
+    target = re.search(r'Your target good:\n"(g\d+)"', user_content)
+    held = re.findall(r'"(g\d+)":1', user_content.split("Your current inventory:")[1])
+    if "monetary" in system_content:
+        if target and target.group(1) in held:
+            return {"action": "idle"}
+        if held:
+            return {"action": "sell", "good": held[0], "quantity": 1}
+        return {"action": "buy", "good": target.group(1) if target else "g0", "quantity": 1}
+
+    incoming = re.findall(
+        r'"direction":"incoming","from":"A\d+","to":"A\d+","message_id":"(m\d+)"', user_content
+    )
+    if incoming:
+        return {"action": "accept", "of_message_id": incoming[-1]}
+    index = int(agent[1:])
+    if held and target:
+        return {
+            "action": "propose_trade",
+            "to": f"A{index + 1}",
+            "give": held[0],
+            "receive": target.group(1),
+        }
+    return {"action": "idle"}
+
+
+class StatelessLLM:
+    def complete_json(self, messages: Any) -> Dict[str, Any]:
+        return respond_stateless(messages)
+
+
+def run_log(result: Any) -> Dict[str, Any]:
+    """A run log without its wall-clock timings, for comparing runs across drivers."""
+    log: Dict[str, Any] = result.to_dict()
+    log.pop("timing")
+    return log
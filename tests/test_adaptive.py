@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import Any, List
+
+from agentic_economy.adaptive import Cell, allocate, run_adaptive
+from agentic_economy.simulation import SimulationSpec
+from agentic_economy.sweep import SweepConfig, expand
+from tests.helpers import StatelessLLM
+
+
+def _config(output_dir: Path, **adaptive: Any) -> SweepConfig:
+    return SweepConfig.from_dict(
+        {
+            "output_dir": str(output_dir),
+            "conditions": ["barter", "money_exchange"],
+            "n": [4, 6],
+            "seeds": 1,
+            "rounds": 3,
+            "model": "dummy",
+            "adaptive": {"target_ci_width": 0.05, "batch_size": 3, "max_seeds": 4, **adaptive},
+        }
+    )
+
+
+def test_adaptive_seeds_go_to_cells_with_wide_intervals(tmp_path: Path) -> None:
+    config = _config(tmp_path / "runs_adaptive")
+
+    def run_specs(specs: List[SimulationSpec]) -> None:
+        for spec in specs:
+            result = spec.build(StatelessLLM()).run()  # type: ignore[arg-type]
+            stem = f"{spec.condition}_N{spec.n_agents}_seed{spec.seed}"
+            result.write_json(config.output_dir / f"{stem}.json")
+
+    run_specs(expand(config))
+    rounds = run_adaptive(config, run_specs, index_path=str(tmp_path / "index.sqlite"))
+
+    # Every cell starts with one seed and no interval, so the first round fills the batch.
+    assert set(rounds[0]["ci_width"].values()) == {None}
+    assert len(rounds[0]["allocated"]) == 3
+    assert rounds[-1]["allocated"] == []
+    final = rounds[-1]["ci_width"]
+    logs = sorted(path.name for path in config.output_dir.glob("*.json"))
+    for cell, width in final.items():
+        seeds = sum(name.startswith(cell + "_seed") for name in logs)
+        # Stopped because the interval is narrow enough or the cell hit max_seeds.
+        assert (width is not None and width <= 0.05) or seeds == 4
+    # The scripted Exchange clears every run, so two seeds settle those cells.
+    assert sum(name.startswith("money_exchange_N4_") for name in logs) == 2
+
+
+def test_allocation_respects_budget_and_max_seeds(tmp_path: Path) -> None:
+    config = _config(tmp_path / "runs_budget", batch_size=2, max_seeds=3)
+    cells = [
+        Cell("barter", 4, [0, 1], 0.5),
+        Cell("barter", 6, [0, 1, 2], 0.9),
+        Cell("money_exchange", 4, [0, 1], 0.0),
+        Cell("money_exchange", 6, [0], math.inf),
+    ]
+    specs = allocate(config, cells, budget_left=None)
+    assert [(spec.condition, spec.n_agents, spec.seed) for spec in specs] == [
+        ("money_exchange", 6, 1),
+        ("barter", 4, 2),
+    ]
+    # N=6 x 3 rounds = 18 decisions does not fit, the N=4 cell (12) does.
+    assert [spec.n_agents for spec in allocate(config, cells, budget_left=15)] == [4]
+    assert allocate(config, cells, budget_left=5) == []
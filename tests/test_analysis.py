@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from agentic_economy import analysis
+from agentic_economy.simulation import (
+    BarterChatCreditSimulation,
+    BarterSimulation,
+    MoneyExchangeSimulation,
+)
+from tests.helpers import StatelessLLM
+
+
+def _write_runs(root: Path) -> None:
+    llm = StatelessLLM()
+    for run_set, seeds in (("runs_a", range(3)), ("runs_b", range(3, 5))):
+        out_dir = root / run_set
+        for seed in seeds:
+            for cls in (BarterSimulation, BarterChatCreditSimulation, MoneyExchangeSimulation):
+                result = cls(3, 3, seed, 5, llm, "dummy").run()  # type: ignore[arg-type]
+                result.write_json(out_dir / f"{result.condition}_N3_seed{seed}.json")
+
+
+def test_parallel_load_runs_matches_serial(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _write_runs(tmp_path)
+    pattern = str(tmp_path / "runs*" / "*.json")
+    monkeypatch.setattr(analysis, "PARALLEL_MIN_FILES", 1)
+
+    serial = analysis.load_runs(pattern, workers=1)
+    parallel = analysis.load_runs(pattern, workers=3)
+
+    assert len(serial) == 15
+    assert list(serial["path"]) == sorted(serial["path"])
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_summary_index_reparses_only_changed_logs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _write_runs(tmp_path)
+    pattern = str(tmp_path / "runs*" / "*.json")
+    index_path = str(tmp_path / "results" / ".run_index.sqlite")
+    expected = analysis.load_runs(pattern, workers=1)
+
+    parsed: list = []
+    summarize = analysis.summarize_run
+
+    def counting(path: str, streaming: bool = False) -> dict:
+        parsed.append(path)
+        return summarize(path, streaming=streaming)
+
+    monkeypatch.setattr(analysis, "summarize_run", counting)
+    first = analysis.load_runs(pattern, workers=1, index_path=index_path)
+    assert len(parsed) == 15
+    pd.testing.assert_frame_equal(first, expected)
+
+    parsed.clear()
+    changed = tmp_path / "runs_b" / "barter_N3_seed4.json"
+    changed.write_text(changed.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    second = analysis.load_runs(pattern, workers=1, index_path=index_path)
+    assert parsed == [str(changed)]
+    pd.testing.assert_frame_equal(second, expected)
+
+
+def test_export_parquet_tables_round_trip(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    from agentic_economy import export
+
+    _write_runs(tmp_path)
+    out_dir = tmp_path / "parquet"
+    counts = export.export_runs(str(tmp_path / "runs*" / "*.json"), out_dir)
+
+    runs = analysis.load_runs(str(tmp_path / "runs*" / "*.json"), workers=1)
+    assert counts["messages"] == runs["total_messages"].sum()
+    assert (out_dir / "messages" / "condition=barter" / "N=3" / "part-0.parquet").is_file()
+
+    money = export.load_table(out_dir, "messages", filters=[("condition", "=", "money_exchange")])
+    assert set(money["receiver"]) | set(money["sender"]) >= {"Exchange"}
+    assert str(money["sender"].dtype) == "category"
+    prices = export.load_table(out_dir, "exchange_price_history")
+    assert set(prices["condition"]) == {"money_exchange"}
+    assert prices["price"].dtype == "float64"
+    metrics = export.load_table(out_dir, "exchange_round_metrics")
+    assert len(metrics) == counts["exchange_round_metrics"] > 0
+
+
+def test_export_converts_free_form_payload_values(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    from agentic_economy import export
+
+    def message(mid: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {"round": 1, "sender": "A0", "receiver": "A1", "message_id": mid, "payload": payload}
+
+    data = {
+        "condition": "barter",
+        "N": 2,
+        "seed": 0,
+        "messages": [
+            message("m0", {"action": "propose_trade", "to": 3, "give": "g0", "quantity": "1"}),
+            message("m1", {"action": "buy", "quantity": "one", "price": "2.5", "to": ["A1"]}),
+            message("m2", {"action": "sell", "quantity": 2.0, "price": {"bid": 1}, "side": 1}),
+        ],
+        "events": [{"event": "agent_action", "round": "2", "agent": 7, "proposal_id": 5}],
+    }
+    (tmp_path / "runs_x").mkdir()
+    (tmp_path / "runs_x" / "barter_N2_seed0.json").write_text(json.dumps(data))
+    out_dir = tmp_path / "parquet"
+    export.export_runs(str(tmp_path / "runs*" / "*.json"), out_dir)
+
+    messages = export.load_table(out_dir, "messages").sort_values("message_id")
+    assert messages["to"].astype(object).tolist()[:2] == ["3", '["A1"]']
+    assert pd.isna(messages["to"].iloc[2])
+    assert messages["quantity"].tolist()[0::2] == [1, 2]
+    assert pd.isna(messages["quantity"].iloc[1])
+    assert messages["price"].tolist()[1] == 2.5 and pd.isna(messages["price"].iloc[2])
+    assert messages["side"].astype(object).tolist()[2] == "1"
+    events = export.load_table(out_dir, "events")
+    assert events[["round", "agent", "proposal_id"]].astype(object).values.tolist() == [
+        [2, "7", "5"]
+    ]
+
+
+def test_summarize_log_counts_credit_pairs_and_invalid_actions() -> None:
+    def message(mid: str, sender: str, receiver: str, payload: dict) -> dict:
+        return {"round": 1, "sender": sender, "receiver": receiver, "message_id": mid, **payload}
+
+    data: Dict[str, Any] = {
+        "condition": "barter_chat_credit",
+        "N": 3,
+        "seed": 0,
+        "rounds_run": 2,
+        "agents": {"A0": {"target": "g1"}, "A1": {"target": "g2"}, "A2": {"target": "g0"}},
+        "inventory_final": {"A0": {"g1": 1}, "A1": {"g1": 0}, "A2": {}},
+        "messages": [
+            message("m0", "A0", "A1", {"payload": {"action": "propose_trade", "give": "c1"}}),
+            message("m1", "A1", "A0", {"payload": {"action": "accept", "of_message_id": "m0"}}),
+            message("m2", "A1", "A2", {"payload": {"action": "propose_trade", "give": "g1"}}),
+            message("m3", "A2", "A1", {"payload": {"action": "accept", "of_message_id": "m2"}}),
+            message("m4", "A2", "A2", {"payload": {"action": "send_message"}}),
+            message("m5", "A1", "", {"payload": {"action": "send_message"}}),
+        ],
+        "events": [{"event": "invalid_action"}, {"event": "trade_executed"}, "noise"],
+        "exchange_round_metrics": [
+            {"inbox_total": 2, "outbox_total": 1, "price_total_abs_change": 0.1},
+            {"inbox_total": 1, "outbox_total": 1, "price_total_abs_change": 0.2},
+        ],
+    }
+    data["messages"][2]["payload"]["receive"] = "g2"
+    row = analysis.summarize_log(data, Path("runs_x/log.json"))
+
+    assert row["run_set"] == "runs_x"
+    assert row["total_messages"] == 6
+    assert row["unique_pairs"] == 2
+    assert row["credit_proposals"] == 1
+    assert row["credit_accepts"] == 1
+    assert row["send_messages"] == 2
+    assert row["invalid_actions"] == 1
+    assert row["success_count"] == 1
+    assert row["exchange_inbox_messages"] == 3
+    assert row["exchange_price_abs_change"] == 0.1 + 0.2
+
+
+def test_streaming_summaries_match_in_memory(tmp_path: Path) -> None:
+    _write_runs(tmp_path)
+    pattern = str(tmp_path / "runs*" / "*.json")
+
+    streamed = analysis.load_runs(pattern, workers=1, streaming=True)
+
+    pd.testing.assert_frame_equal(streamed, analysis.load_runs(pattern, workers=1))
+
+
+def test_scan_log_streams_items_across_chunk_boundaries(tmp_path: Path) -> None:
+    from agentic_economy.logstream import scan_log
+
+    log = {
+        "condition": "barter",
+        "N": 12345,
+        "messages": [{"round": i, "payload": {"text": "x" * i}} for i in range(40)],
+        "events": [],
+        "price": 1.25e-3,
+        "agents": {"A0": {"target": "g1"}},
+    }
+    path = tmp_path / "log.json"
+    path.write_text(json.dumps(log, indent=2), encoding="utf-8")
+
+    items: list = []
+    fields = scan_log(path, {"messages": items.append, "events": items.append}, chunk_size=7)
+
+    assert items == log["messages"]
+    assert fields == {key: log[key] for key in ("condition", "N", "price", "agents")}
+
+
+@pytest.mark.parametrize("suffix", [".json.gz", ".json.zst"])
+def test_compressed_logs_load_like_plain_json(tmp_path: Path, suffix: str) -> None:
+    if suffix == ".json.zst":
+        pytest.importorskip("zstandard")
+    result = BarterChatCreditSimulation(4, 4, 1, 5, StatelessLLM(), "dummy").run()  # type: ignore[arg-type]
+    result.write_json(tmp_path / "plain" / "runs_x" / "log.json")
+    result.write_json(tmp_path / "packed" / "runs_x" / f"log{suffix}")
+
+    plain = analysis.load_runs(str(tmp_path / "plain" / "runs_x" / "*.json"), workers=1)
+    for streaming in (False, True):
+        packed = analysis.load_runs(
+            str(tmp_path / "packed" / "runs_x" / "*.json"), workers=1, streaming=streaming
+        )
+        pd.testing.assert_frame_equal(packed.drop(columns="path"), plain.drop(columns="path"))
+    assert packed["path"].iloc[0].endswith(suffix)
+
+
+def test_add_clearing_metrics_vectorized_over_ragged_curves() -> None:
+    runs = pd.DataFrame(
+        {
+            "n_agents": [4, 4, 3],
+            "rounds_cap": [5, 5, 5],
+            "total_messages": [12, 30, 9],
+            "success_count": [4, 1, 0],
+            "success_by_round": [[0, 2, 4], [0, 0, 1, 1, 1], None],
+            "trades_by_round": [[0, 1, 1], [0, 0, 0, 2, 0], None],
+        }
+    )
+
+    out = analysis.add_clearing_metrics(runs)
+
+    assert out["rounds_to_clear_50"].iloc[0] == 2.0
+    assert pd.isna(out["rounds_to_clear_50"].iloc[1])
+    assert out["rounds_to_clear_100"].iloc[0] == 3.0
+    assert out["clearing_auc"].iloc[0] == (0 + 2 + 4 + 4 + 4) / (5 * 4)
+    assert out["clearing_auc"].iloc[1] == 3 / 20
+    assert out["first_trade_round"].tolist()[:2] == [2.0, 4.0]
+    assert out["messages_per_success"].tolist()[:2] == [3.0, 30.0]
+    assert out.iloc[2][analysis.CLEARING_COLUMNS].isna().all()
+
+
+def test_bootstrap_ci_resamples_every_group_at_once() -> None:
+    values = np.array(
+        [[0.0, 5.0], [1.0, 5.0], [2.0, np.nan], [4.0, 1.0], [6.0, 3.0], [7.0, np.nan]]
+    )
+    codes = np.array([0, 0, 1, 2, 2, 2])
+
+    for method in analysis.CI_METHODS:
+        low, high = analysis.bootstrap_ci(values, codes, 3, resamples=4000, method=method)
+
+        # Two runs {0, 1}: resampled means are 0, 0.5 or 1.
+        assert (low[0, 0], high[0, 0]) == (0.0, 1.0)
+        assert (low[0, 1], high[0, 1]) == (5.0, 5.0)
+        assert np.isnan(low[1]).all() and np.isnan(high[1]).all()
+        assert low[2, 0] < 17 / 3 < high[2, 0]
+        assert (low[2, 1], high[2, 1]) == (1.0, 3.0)
+
+    with pytest.raises(ValueError, match="Unknown CI method"):
+        analysis.bootstrap_ci(values, codes, 3, method="normal")
+
+
+def test_aggregate_runs_adds_ci_columns_next_to_mean_and_std() -> None:
+    runs = pd.read_csv(Path("results/runs_core_full.csv"))
+
+    aggregated = analysis.aggregate_runs(runs, resamples=500)
+
+    assert aggregated.columns[6:11].tolist() == [
+        "runs",
+        "total_messages_mean",
+        "total_messages_std",
+        "total_messages_ci_low",
+        "total_messages_ci_high",
+    ]
+    bounded = aggregated.dropna(subset=["success_rate_ci_low"])
+    assert not bounded.empty
+    assert (bounded["success_rate_ci_low"] <= bounded["success_rate_mean"]).all()
+    assert (bounded["success_rate_mean"] <= bounded["success_rate_ci_high"]).all()
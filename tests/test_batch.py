@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from agentic_economy.batch import LocalBatchBackend, parse_batch_output, run_batch
+from agentic_economy.simulation import (
+    BarterSimulation,
+    BaseSimulation,
+    CentralPlannerSimulation,
+    MoneyExchangeSimulation,
+)
+from tests.helpers import StatelessLLM, respond_stateless, run_log
+
+
+def _build() -> List[BaseSimulation]:
+    llm = StatelessLLM()
+    return [
+        BarterSimulation(4, 3, 0, 5, llm, "dummy"),  # type: ignore[arg-type]
+        MoneyExchangeSimulation(3, 3, 1, 5, llm, "dummy"),  # type: ignore[arg-type]
+        CentralPlannerSimulation(2, 3, 2, 5, llm, "dummy"),  # type: ignore[arg-type]
+    ]
+
+
+def test_run_batch_matches_serial_runs(tmp_path: Path) -> None:
+    serial = [run_log(simulation.run()) for simulation in _build()]
+    batched = run_batch(_build(), LocalBatchBackend(respond_stateless), tmp_path, poll_interval=0.0)
+
+    assert [run_log(result) for result in batched] == serial
+    first_input = (tmp_path / "step0000_input.jsonl").read_text(encoding="utf-8").splitlines()
+    custom_ids = [json.loads(line)["custom_id"] for line in first_input]
+    assert "run0-round1-A0" in custom_ids
+    assert "run1-round1-A2" in custom_ids
+    assert not any(custom_id.startswith("run2-") for custom_id in custom_ids)
+
+
+class FlakyBackend(LocalBatchBackend):
+    def __init__(self) -> None:
+        super().__init__(respond_stateless)
+        self.failed_once = False
+
+    def fetch(self, job_id: str, output_path: Path) -> bool:
+        super().fetch(job_id, output_path)
+        if not self.failed_once:
+            lines = output_path.read_text(encoding="utf-8").splitlines()
+            record = json.loads(lines[0])
+            record["response"] = {"status_code": 500, "body": {"error": "boom"}}
+            lines[0] = json.dumps(record)
+            output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            self.failed_once = True
+        return True
+
+
+def test_run_batch_retries_failed_requests(tmp_path: Path) -> None:
+    serial = [run_log(simulation.run()) for simulation in _build()]
+    batched = run_batch(_build(), FlakyBackend(), tmp_path, poll_interval=0.0)
+
+    assert [run_log(result) for result in batched] == serial
+    assert (tmp_path / "step0000_retry1_input.jsonl").exists()
+    _, errors = parse_batch_output(tmp_path / "step0000_output.jsonl")
+    assert len(errors) == 1
+
+
+def test_run_batch_raises_after_retries(tmp_path: Path) -> None:
+    class BrokenBackend(LocalBatchBackend):
+        def fetch(self, job_id: str, output_path: Path) -> bool:
+            self._jobs.pop(job_id)
+            output_path.write_text("", encoding="utf-8")
+            return True
+
+    with pytest.raises(RuntimeError, match="unanswered"):
+        run_batch(
+            _build(), BrokenBackend(respond_stateless), tmp_path, poll_interval=0.0, max_retries=1
+        )
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from agentic_economy import build
+
+TABLE_TARGETS = ["runs_core_tables", "scaling_fits", "core_sweep_table", "results_pages"]
+
+
+def _results_copy(root: Path) -> Path:
+    results_dir = root / "results"
+    results_dir.mkdir()
+    for name in (
+        "runs_core_aggregate.csv",
+        "all_runs_full.csv",
+        "all_runs_aggregate.csv",
+        "run_sets.json",
+    ):
+        shutil.copy(Path("results") / name, results_dir / name)
+    return results_dir
+
+
+def test_build_targets_skips_unchanged_and_rebuilds_dependents(tmp_path: Path) -> None:
+    results_dir = _results_copy(tmp_path)
+    state = tmp_path / "state.json"
+    targets = build.results_targets(results_dir)
+
+    first = build.build_targets(targets, state, only=TABLE_TARGETS)
+    assert first == {
+        "runs_core_tables": "missing_inputs",
+        "scaling_fits": "built",
+        "core_sweep_table": "built",
+        "results_pages": "built",
+    }
+    assert (results_dir / "paper" / "showcase_table.tex").exists()
+
+    second = build.build_targets(targets, state, only=TABLE_TARGETS)
+    assert set(second.values()) == {"missing_inputs", "unchanged"}
+
+    core = results_dir / "runs_core_aggregate.csv"
+    core.write_text(core.read_text() + "\n", encoding="utf-8")
+    (results_dir / "showcase.md").unlink()
+    stale = build.build_targets(targets, state, only=TABLE_TARGETS, dry_run=True)
+    assert stale["core_sweep_table"] == "stale"
+    assert stale["results_pages"] == "stale"
+    assert stale["scaling_fits"] == "unchanged"
+
+    changed = build.build_targets(targets, state, only=TABLE_TARGETS)
+    assert changed["core_sweep_table"] == "built"
+    assert changed["results_pages"] == "built"
+    assert changed["scaling_fits"] == "unchanged"
+
+    other_showcase = build.results_targets(results_dir, showcase_n=5)
+    assert build.build_targets(other_showcase, state, only=["results_pages"], dry_run=True) == {
+        "results_pages": "stale"
+    }
+
+
+def test_fingerprint_follows_imported_package_modules(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from agentic_economy import analysis, results_pages
+
+    assert {"analysis.py", "export.py", "logstream.py"} <= {
+        path.name for path in build.module_sources([analysis])
+    }
+    assert "sweep.py" in {path.name for path in build.module_sources([results_pages])}
+
+    results_dir = _results_copy(tmp_path)
+    state = tmp_path / "state.json"
+    targets = build.results_targets(results_dir)
+    build.build_targets(targets, state, only=["scaling_fits"])
+
+    # An edit to logstream, which scaling only reaches through analysis, invalidates it.
+    file_digest = build._file_digest
+    monkeypatch.setattr(
+        build,
+        "_file_digest",
+        lambda path: "edited" if path.name == "logstream.py" else file_digest(path),
+    )
+    assert build.build_targets(targets, state, only=["scaling_fits"], dry_run=True) == {
+        "scaling_fits": "stale"
+    }
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+import agentic_economy
+from agentic_economy import cli
+from agentic_economy.llm_client import LLMClient
+from agentic_economy.simulation import CONDITIONS, BarterSimulation, register_condition
+
+HEAVY_MODULES = ("openai", "pandas", "matplotlib", "dotenv")
+
+
+def _loaded_after(code: str) -> List[str]:
+    """Heavy top-level modules a fresh interpreter has imported after running `code`."""
+    probe = (
+        "import contextlib, io, json, sys\n"
+        f"{code}\n"
+        f"print(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))\n"
+    )
+    env = dict(os.environ)
+    source_root = str(Path(agentic_economy.__file__).resolve().parents[1])
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [source_root, env.get("PYTHONPATH")]))
+    completed = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True, env=env
+    )
+    loaded: List[str] = json.loads(completed.stdout.splitlines()[-1])
+    return loaded
+
+
+def _cli_help(*argv: str) -> str:
+    return (
+        "from agentic_economy import cli\n"
+        f"sys.argv = ['agentic-economy', *{list(argv)!r}, '--help']\n"
+        "with contextlib.redirect_stdout(io.StringIO()), contextlib.suppress(SystemExit):\n"
+        "    cli.main()"
+    )
+
+
+def test_help_imports_no_heavy_dependencies() -> None:
+    for argv in ([], ["run"], ["llm-live"], ["plan"], ["export"], ["results", "build"]):
+        assert _loaded_after(_cli_help(*argv)) == [], argv
+
+
+def test_reporting_help_imports_no_plotting_or_dataframes() -> None:
+    code = (
+        "from agentic_economy import reporting\n"
+        "sys.argv = ['reporting', '--help']\n"
+        "with contextlib.redirect_stdout(io.StringIO()), contextlib.suppress(SystemExit):\n"
+        "    reporting.main()"
+    )
+    assert _loaded_after(code) == []
+
+
+def test_offline_modules_never_import_openai() -> None:
+    for module in ("export", "analysis", "build", "scaling", "results_pages"):
+        assert "openai" not in _loaded_after(f"import agentic_economy.{module}"), module
+    loaded = _loaded_after("from agentic_economy import batch, scheduler, simulation")
+    assert "openai" not in loaded
+
+
+def test_condition_options_parse_bool_and_optional_values() -> None:
+    class Bazaar(BarterSimulation):
+        condition = "bazaar"
+        option_help = {"haggle": "Let agents haggle.", "stalls": "Market stalls."}
+
+        def __init__(
+            self,
+            n_agents: int,
+            rounds: int,
+            seed: int,
+            history_limit: int,
+            llm_client: LLMClient,
+            model_name: str,
+            haggle: bool = True,
+            stalls: Optional[int] = None,
+        ):
+            super().__init__(n_agents, rounds, seed, history_limit, llm_client, model_name)
+
+    register_condition(Bazaar)
+    try:
+        parser = argparse.ArgumentParser()
+        cli.add_condition_options(parser)
+        args = parser.parse_args(["--haggle", "false", "--stalls", "3"])
+        assert (args.haggle, args.stalls) == (False, 3)
+        assert parser.parse_args(["--haggle", "yes"]).haggle is True
+        with pytest.raises(SystemExit):
+            parser.parse_args(["--haggle", "maybe"])
+        assert "Let agents haggle. bazaar only; default True." in parser.format_help()
+    finally:
+        del CONDITIONS["bazaar"]
+
+    class Undocumented(Bazaar):
+        condition = "bazaar"
+        option_help = {"haggle": "Let agents haggle."}
+
+    with pytest.raises(ValueError, match="stalls need `option_help`"):
+        register_condition(Undocumented)
+    assert "bazaar" not in CONDITIONS
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict
+
+from openai import RateLimitError
+
+from agentic_economy.llm_client import LLMClient
+from agentic_economy.monitor import SweepMonitor, decision_budget, prometheus_text
+from agentic_economy.scheduler import run_interleaved
+from agentic_economy.simulation import BarterSimulation, MoneyExchangeSimulation
+from tests.helpers import StatelessLLM, respond_stateless
+
+
+def test_monitor_follows_an_interleaved_sweep() -> None:
+    simulations = [
+        BarterSimulation(4, 3, 0, 5, StatelessLLM(), "dummy"),  # type: ignore[arg-type]
+        MoneyExchangeSimulation(3, 3, 1, 5, StatelessLLM(), "dummy"),  # type: ignore[arg-type]
+    ]
+    monitor = SweepMonitor(
+        planned_runs=3, planned_decisions=2 * decision_budget(4, 3) + decision_budget(3, 3)
+    )
+    idle = monitor.snapshot()
+    assert idle["runs_in_flight"] == 0 and idle["eta_seconds"] is None
+    assert idle["llm_latency_seconds"]["p50"] is None
+
+    for simulation in simulations:
+        monitor.track(simulation)
+    results = run_interleaved(
+        simulations,
+        max_workers=4,
+        on_complete=lambda index, _: monitor.finish(simulations[index]),
+    )
+
+    snapshot = monitor.snapshot()
+    assert snapshot["runs_finished"] == 2 and snapshot["runs_in_flight"] == 0
+    assert snapshot["decisions"] == sum(result.usage["llm_calls"] for result in results)  # type: ignore
+    assert snapshot["llm_retries"] == snapshot["llm_rate_limited"] == 0
+    assert set(snapshot["llm_latency_seconds"]) == {"p50", "p90", "p99"}
+    # One planned run of four agents has not started, so some work is still expected.
+    assert snapshot["eta_seconds"] is not None and snapshot["eta_seconds"] >= 0
+
+
+def test_monitor_counts_retries_and_rate_limits() -> None:
+    class FlakyResponses:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def create(self, input: Any, **_: Any) -> Any:
+            self.calls += 1
+            if self.calls == 1:
+                # A 429 without building an HTTP response for the SDK's constructor.
+                raise RateLimitError.__new__(RateLimitError)
+            return type("Resp", (), {"output_text": json.dumps(respond_stateless(input))})()
+
+    fake_client = type("FakeClient", (), {"responses": FlakyResponses()})()
+    client = LLMClient(model="dummy", client=fake_client, retry_delay=0.0)
+    simulation = BarterSimulation(2, 1, 0, 5, client, "dummy")
+    monitor = SweepMonitor(planned_runs=1, planned_decisions=decision_budget(2, 1))
+    monitor.track(simulation)
+    simulation.run()
+
+    snapshot = monitor.snapshot()
+    assert snapshot["decisions"] == 2
+    assert snapshot["llm_retries"] == 1 and snapshot["llm_rate_limited"] == 1
+    assert "agentic_economy_llm_rate_limited_total 1" in prometheus_text(snapshot)
+
+
+def test_serve_writes_status_file_and_metrics_endpoint(tmp_path: Path) -> None:
+    monitor = SweepMonitor(planned_runs=1, planned_decisions=decision_budget(3, 2))
+    simulation = monitor.track(
+        BarterSimulation(3, 2, 0, 5, StatelessLLM(), "dummy")  # type: ignore[arg-type]
+    )
+    status_path = tmp_path / "status.json"
+    with monitor.serve(status_path, port=0, interval=0.01) as port:
+        steps = simulation.steps()
+        next(steps)
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            metrics = response.read().decode()
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/status") as response:
+            status: Dict[str, Any] = json.loads(response.read())
+        steps.close()
+
+    assert 'agentic_economy_run_round{condition="barter",n_agents="3",seed="0"} 1' in metrics
+    assert status["runs_in_flight"] == 1 and status["runs"][0]["round"] == 1
+    assert json.loads(status_path.read_text())["runs_planned"] == 1
+    assert not status_path.with_name("status.json.tmp").exists()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from agentic_economy.planner import calibrate, check_cost_budget, estimate_sweep
+from agentic_economy.simulation import CONDITIONS, SimulationSpec
+from agentic_economy.sweep import SweepConfig, plan_sweep
+from tests.helpers import StatelessLLM
+
+
+def _config(output_dir: Path, **overrides: object) -> SweepConfig:
+    data = {
+        "output_dir": str(output_dir),
+        "conditions": ["barter", "money_exchange"],
+        "n": [4],
+        "seeds": 2,
+        "rounds": 3,
+        "model": "dummy",
+        "backend": "concurrent",
+        "concurrency": 4,
+        **overrides,
+    }
+    return SweepConfig.from_dict(data)
+
+
+def _write_past_run(directory: Path, seed: int) -> None:
+    spec = SimulationSpec("barter", 4, seed, 3, 10, "dummy")
+    result = spec.build(StatelessLLM()).run()  # type: ignore[arg-type]
+    result.usage = {"llm_calls": 10, "input_tokens": 1000, "output_tokens": 200}
+    result.timing = {"wall_clock_seconds": 25.0, "llm_seconds": 20.0}
+    directory.mkdir(parents=True, exist_ok=True)
+    result.write_json(directory / f"barter_N4_seed{seed}.json")
+
+
+def test_call_pattern_of_each_condition() -> None:
+    assert CONDITIONS["barter"].calls_per_round(5) == 5
+    assert CONDITIONS["barter_chat_credit"].calls_per_round(5) == 5
+    assert CONDITIONS["money_exchange"].calls_per_round(5) == 6
+    assert CONDITIONS["money_exchange"].phases_per_round(5) == 2
+    assert CONDITIONS["central_planner"].calls_per_round(5) == 0
+    assert CONDITIONS["central_planner"].phases_per_round(5) == 0
+
+
+def test_estimate_is_calibrated_from_past_runs(tmp_path: Path) -> None:
+    for seed in (0, 1):
+        _write_past_run(tmp_path / "runs_past", seed)
+    config = _config(tmp_path / "runs_new", prices={"input": 1.0, "output": 5.0})
+    costs = calibrate(
+        config, f"{tmp_path.as_posix()}/runs*/*.json", index_path=str(tmp_path / "index.sqlite")
+    )
+    assert (costs["barter"].input_tokens, costs["barter"].seconds) == (100.0, 2.0)
+    assert costs["barter"].calls == 20
+    # No money_exchange logs yet: the model's other conditions stand in.
+    assert costs["money_exchange"].source == "dummy (all conditions)"
+
+    estimate = estimate_sweep(config, plan_sweep(config), costs)
+    # Barter: 4 calls x 3 rounds; money_exchange adds the hub call each round; two seeds each.
+    assert (estimate.runs, estimate.calls) == (4, 2 * 12 + 2 * 15)
+    assert estimate.tokens == 54 * 120
+    assert estimate.usd == pytest.approx((54 * 100 * 1.0 + 54 * 20 * 5.0) / 1e6)
+    # 108 call-seconds over 4 workers; the longest run's critical path is 3 x 2 x 2 s.
+    assert estimate.wall_seconds == pytest.approx(27.0)
+    assert estimate_sweep(config, plan_sweep(config), costs, concurrency=64).wall_seconds == 12.0
+    assert estimate_sweep(config, plan_sweep(config), costs, concurrency=1).wall_seconds == 108.0
+
+    batch = _config(tmp_path / "runs_batch", backend="batch", prices={"input": 1, "output": 5})
+    batch_estimate = estimate_sweep(batch, plan_sweep(batch), costs)
+    assert batch_estimate.wall_seconds is None
+    assert batch_estimate.usd == pytest.approx((estimate.usd or 0.0) / 2)
+
+
+def test_budgets_refuse_projected_overruns(tmp_path: Path) -> None:
+    config = _config(tmp_path / "runs_new", budget={"tokens": 1000})
+    costs = calibrate(config, f"{tmp_path.as_posix()}/none/*.json", str(tmp_path / "index.sqlite"))
+    assert costs["barter"].source == "default"
+    estimate = estimate_sweep(config, plan_sweep(config), costs)
+    with pytest.raises(ValueError, match="projected at up to"):
+        check_cost_budget(config, estimate)
+
+    config.budget = {"usd": 100.0}
+    with pytest.raises(ValueError, match="No price known for model dummy"):
+        check_cost_budget(config, estimate)
+    config.prices = {"input": 0.25, "output": 2.0}
+    check_cost_budget(config, estimate_sweep(config, plan_sweep(config), costs))
+
+    with pytest.raises(ValueError, match=r"Unknown \[budget\] key"):
+        _config(tmp_path / "runs_bad", budget={"dollars": 5})
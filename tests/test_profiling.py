@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import pstats
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from agentic_economy.llm_client import LLMClient
+from agentic_economy.profiling import SpanRecorder, flame_summary, profiled, timed
+from agentic_economy.simulation import BarterSimulation, MoneyExchangeSimulation
+from tests.helpers import StatelessLLM, respond_stateless, run_log
+
+
+def test_span_recorder_breaks_seconds_down_by_round() -> None:
+    recorder = SpanRecorder()
+    recorder.add("actions", 1, 0.5)
+    recorder.add("actions", 3, 0.25)
+    recorder.add("prompts", 1, 1.0)
+    with timed(recorder, "prompts", 2):
+        pass
+
+    by_round = recorder.by_round()
+    assert list(by_round) == ["prompts", "actions"]
+    assert by_round["actions"] == [0.5, 0.0, 0.25]
+    assert by_round["prompts"][0] == 1.0 and len(by_round["prompts"]) == 2
+    assert recorder.calls == {"actions": 2, "prompts": 2}
+    with timed(None, "prompts", 1):
+        pass
+
+
+def test_spans_cover_every_phase_without_changing_the_run() -> None:
+    class FakeResponses:
+        def create(self, input: Any, **_: Any) -> Any:
+            return type("Resp", (), {"output_text": json.dumps(respond_stateless(input))})()
+
+    client = LLMClient(model="dummy", client=type("C", (), {"responses": FakeResponses()})())
+    plain = MoneyExchangeSimulation(4, 5, 0, 5, StatelessLLM(), "dummy")  # type: ignore[arg-type]
+    timed_sim = MoneyExchangeSimulation(4, 5, 0, 5, client, "dummy")
+    timed_sim.span_recorder = SpanRecorder()
+    baseline, result = plain.run(), timed_sim.run()
+
+    assert result.phase_seconds is not None and baseline.phase_seconds is None
+    assert set(result.phase_seconds) == {"prompts", "llm_request", "parse_json", "actions"}
+    assert all(len(seconds) == result.rounds_run for seconds in result.phase_seconds.values())
+    assert timed_sim.span_recorder.calls["parse_json"] == result.usage["llm_calls"]  # type: ignore
+    for log in (run_log(baseline), run_log(result)):
+        log.pop("phase_seconds")
+        log.pop("usage")
+    assert run_log(baseline)["messages"] == run_log(result)["messages"]
+
+
+def test_flame_summary_ranks_phases_across_runs() -> None:
+    recorders = []
+    for seed in range(2):
+        sim = BarterSimulation(3, 3, seed, 5, StatelessLLM(), "dummy")  # type: ignore[arg-type]
+        sim.span_recorder = SpanRecorder()
+        sim.run()
+        sim.span_recorder.add("write_json", 1, 10.0)
+        recorders.append(sim.span_recorder)
+
+    summary = flame_summary(recorders)
+    assert summary["runs"] == 2
+    assert summary["phases"][0]["phase"] == "write_json"
+    assert summary["phases"][0]["calls"] == 2
+    assert sum(phase["share"] for phase in summary["phases"]) == pytest.approx(1.0, abs=0.01)
+
+
+def test_cprofile_dumps_stats_next_to_the_output(tmp_path: Path) -> None:
+    with profiled("cprofile", tmp_path / "barter_N3_seed0") as path:
+        BarterSimulation(3, 2, 0, 5, StatelessLLM(), "dummy").run()  # type: ignore[arg-type]
+    assert path == tmp_path / "barter_N3_seed0.prof"
+    stats = pstats.Stats(str(path))
+    assert any(name == "steps" for _, _, name in stats.stats)  # type: ignore[attr-defined]
+    with profiled(None, tmp_path / "unused") as path:
+        pass
+    assert path is None
+    with pytest.raises(ValueError):
+        with profiled("perf", tmp_path / "unused"):
+            pass
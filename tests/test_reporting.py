@@ -6,7 +6,7 @@ from typing import Any
 
 import pandas as pd
 
-from agentic_economy import reporting
+from agentic_economy import reporting, scaling
 
 
 def test_generate_core_sweep_overview(tmp_path: Path) -> None:
@@ -65,3 +65,31 @@ def test_main_generates_outputs(tmp_path: Path, monkeypatch: Any) -> None:
     assert (out_dir / "showcase_overview.png").exists()
     assert (out_dir / "showcase_overview.pdf").exists()
     assert (paper_dir / "core_sweep_table.tex").exists()
+
+
+def test_generate_clearing_overview(tmp_path: Path) -> None:
+    rows = []
+    for condition, slope in (("barter", 2.0), ("money_exchange", 0.5)):
+        for n in (3, 5, 8):
+            row: dict[str, Any] = {"condition": condition, "n_agents": n}
+            for column in ("rounds_to_clear_50", "rounds_to_clear_90", "messages_per_success"):
+                row[f"{column}_mean"] = slope * n
+                row[f"{column}_std"] = 0.1
+            row["clearing_auc_mean"] = 1.0 / (slope * n)
+            row["clearing_auc_std"] = 0.01
+            rows.append(row)
+    outputs = reporting.generate_clearing_overview(pd.DataFrame(rows), tmp_path)
+
+    assert set(outputs) == {tmp_path / "clearing_overview.png", tmp_path / "clearing_overview.pdf"}
+    for path in outputs:
+        assert path.stat().st_size > 0
+
+
+def test_generate_scaling_overview(tmp_path: Path) -> None:
+    runs_df = pd.read_csv(Path("results/all_runs_full.csv"))
+    fits_df = scaling.fit_scaling(runs_df, resamples=200)
+    outputs = reporting.generate_scaling_overview(fits_df, tmp_path)
+
+    assert set(outputs) == {tmp_path / "scaling_overview.png", tmp_path / "scaling_overview.pdf"}
+    for path in outputs:
+        assert path.stat().st_size > 0
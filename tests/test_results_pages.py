@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import sys
 from pathlib import Path
 from typing import Any
@@ -36,11 +37,34 @@ def test_write_showcase_page(tmp_path: Path) -> None:
     assert "Money/Exchange" in md
     assert "Central planner" in md
     assert "Barter + credits" in md
+    assert "| success_rate_ci |" in md
 
     tex = out_tex.read_text(encoding="utf-8")
     assert "\\begin{table}" in tex
     assert "\\label{tab:showcase}" in tex
     assert "Money/Exchange" in tex
+    assert "95\\% CI" in tex
+
+
+def test_showcase_rows_follow_the_run_set_index(tmp_path: Path) -> None:
+    out_md = tmp_path / "showcase.md"
+    run_sets = tmp_path / "run_sets.json"
+    run_sets.write_text(
+        json.dumps({"runs_5mini_emergent": {"showcase_priority": 9}}), encoding="utf-8"
+    )
+    results_pages.write_showcase_page(
+        Path("results/all_runs_aggregate.csv"),
+        out_md,
+        n_agents=8,
+        rounds_cap=8,
+        model="gpt-5-mini",
+        latex_out_path=tmp_path / "showcase_table.tex",
+        run_sets_path=run_sets,
+    )
+    rows = out_md.read_text(encoding="utf-8").splitlines()
+    assert any(row.startswith("| Barter | runs_5mini_emergent | 3 |") for row in rows)
+    # Central planner runs exist only in one run set, ranked or not.
+    assert any(row.startswith("| Central planner | runs_5mini_full |") for row in rows)
 
 
 def test_main_generates_pages(tmp_path: Path, monkeypatch: Any) -> None:
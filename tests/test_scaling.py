@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from agentic_economy import scaling
+
+
+def _runs() -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    rows = []
+    for n in (3, 5, 8, 12, 20):
+        for seed in range(6):
+            noise = rng.lognormal(0.0, 0.05)
+            rows.append(
+                {
+                    "run_set": "runs_a",
+                    "condition": "barter",
+                    "model": "m",
+                    "rounds_cap": 8,
+                    "n_agents": n,
+                    "total_messages": 2.0 * n**2 * noise,
+                    "total_tokens": None,
+                }
+            )
+            rows.append(
+                {
+                    "run_set": "runs_a",
+                    "condition": "money_exchange",
+                    "model": "m",
+                    "rounds_cap": 8,
+                    "n_agents": n,
+                    "total_messages": 3.0 * n * noise,
+                    "total_tokens": 500.0 * n * noise,
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def test_fit_scaling_recovers_exponents_with_bootstrap_ci() -> None:
+    fits = scaling.fit_scaling(_runs(), resamples=500)
+    power = fits[fits["law"] == "power_law"].set_index(["condition", "metric"])
+
+    barter = power.loc[("barter", "total_messages")]
+    assert barter["b_ci_low"] < 2.0 < barter["b_ci_high"]
+    assert abs(barter["b"] - 2.0) < 0.05
+    assert barter["predicted_ci_low"] < 2.0e6 < barter["predicted_ci_high"]
+    hub = power.loc[("money_exchange", "total_messages")]
+    assert abs(hub["b"] - 1.0) < 0.05
+    assert hub["r2"] > 0.99
+    # Runs without token usage are left out; missing columns are skipped.
+    assert ("barter", "total_tokens") not in power.index
+    assert ("money_exchange", "total_tokens") in power.index
+    assert set(fits["metric"]) == {"total_messages", "total_tokens"}
+    assert set(fits["law"]) == {"power_law", "log_linear"}
+
+    pd.testing.assert_frame_equal(fits, scaling.fit_scaling(_runs(), resamples=500))
+
+
+def test_fit_scaling_groups_by_model_and_cap_and_skips_degenerate_ci() -> None:
+    runs = _runs()
+    # A second round cap in another run set, with one run per N: no spread to resample.
+    other = runs[(runs["condition"] == "barter") & (runs.index % 12 == 0)].copy()
+    other["run_set"] = "runs_b"
+    other["rounds_cap"] = 20
+    other["total_messages"] *= 3.0
+    fits = scaling.fit_scaling(pd.concat([runs, other]), metrics=["total_messages"], resamples=200)
+    power = fits[fits["law"] == "power_law"].set_index(["condition", "rounds_cap"])
+
+    assert abs(power.loc[("barter", 8), "b"] - 2.0) < 0.05
+    capped = power.loc[("barter", 20)]
+    assert capped["runs"] == 5
+    assert capped[["b_ci_low", "b_ci_high", "predicted_ci_low", "predicted_ci_high"]].isna().all()
+    assert pd.notna(capped["b"])
+
+    only_a = scaling.fit_scaling(
+        pd.concat([runs, other]), metrics=["total_messages"], resamples=200, run_sets=["runs_a"]
+    )
+    assert set(only_a["rounds_cap"]) == {8}
+
+
+def test_scaling_main_writes_csv_and_markdown(tmp_path: Path, monkeypatch: Any) -> None:
+    runs_csv = tmp_path / "runs.csv"
+    _runs().to_csv(runs_csv, index=False)
+    argv = [
+        "agentic_economy.scaling",
+        "--runs-csv",
+        str(runs_csv),
+        "--out-csv",
+        str(tmp_path / "fits.csv"),
+        "--out-md",
+        str(tmp_path / "fits.md"),
+        "--resamples",
+        "200",
+    ]
+    monkeypatch.setattr(sys, "argv", argv)
+    scaling.main()
+
+    fits = pd.read_csv(tmp_path / "fits.csv")
+    assert list(fits.columns) == scaling.FIT_COLUMNS
+    assert len(fits) == 6
+    assert "predicted is at N=1000" in (tmp_path / "fits.md").read_text(encoding="utf-8")
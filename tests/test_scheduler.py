@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Any, Dict, List
+
+from agentic_economy.scheduler import drive_concurrently, run_interleaved
+from agentic_economy.simulation import (
+    BarterChatSimulation,
+    BarterSimulation,
+    BaseSimulation,
+    CentralPlannerSimulation,
+    MoneyExchangeSimulation,
+)
+from tests.helpers import respond_stateless, run_log
+
+
+class JitteryLLM:
+    """Stateless responder with random latency so completions arrive out of order."""
+
+    def __init__(self) -> None:
+        self.rng = random.Random(7)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def complete_json(self, messages: Any) -> Dict[str, Any]:
+        with self.lock:
+            delay = self.rng.uniform(0.0, 0.01)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        time.sleep(delay)
+        with self.lock:
+            self.in_flight -= 1
+        return respond_stateless(messages)
+
+
+def _build(llm: Any) -> List[BaseSimulation]:
+    return [
+        BarterSimulation(4, 3, 0, 5, llm, "dummy"),
+        BarterChatSimulation(3, 2, 1, 5, llm, "dummy"),
+        MoneyExchangeSimulation(5, 3, 2, 5, llm, "dummy"),
+        CentralPlannerSimulation(3, 3, 3, 5, llm, "dummy"),
+    ]
+
+
+def test_run_interleaved_matches_serial_runs() -> None:
+    serial = [run_log(simulation.run()) for simulation in _build(JitteryLLM())]
+
+    llm = JitteryLLM()
+    completed: List[int] = []
+    results = run_interleaved(
+        _build(llm), max_workers=8, on_complete=lambda index, _: completed.append(index)
+    )
+
+    assert [run_log(result) for result in results] == serial
+    assert sorted(completed) == [0, 1, 2, 3]
+    # Decisions from different runs share the pool instead of queueing per run.
+    assert llm.peak_in_flight > 5
+
+
+def test_drive_concurrently_stops_early() -> None:
+    def counter(limit: int) -> Any:
+        for turn in range(limit):
+            yield {"agent": [{"role": "user", "content": str(turn)}]}
+        return limit
+
+    calls: List[int] = []
+
+    def decide(key: str, messages: Any) -> Dict[str, Any]:
+        calls.append(1)
+        return {"action": "idle"}
+
+    results = drive_concurrently(
+        [(counter(2), decide), (counter(50), decide)],
+        max_workers=1,
+        should_stop=lambda: len(calls) >= 4,
+    )
+    assert results[0] == 2
+    assert results[1] is None
+    assert len(calls) < 50
@@ -3,15 +3,23 @@ from __future__ import annotations
 import json
 from typing import Any, Dict
 
+import pytest
+
+from agentic_economy import prompts
 from agentic_economy.llm_client import LLMClient
 from agentic_economy.simulation import (
+    CONDITIONS,
+    AgentState,
     BarterChatCreditSimulation,
     BarterChatSimulation,
     BarterSimulation,
     BarterWithCreditSimulation,
     CentralPlannerSimulation,
     MoneyExchangeSimulation,
+    SimulationSpec,
+    register_condition,
 )
+from tests.helpers import StatelessLLM, respond_stateless
 
 
 class DummyLLM:
@@ -117,6 +125,37 @@ def test_money_exchange_initial_state() -> None:
     assert all(agent.money == 1.0 for agent in sim.agents.values())
 
 
+def test_spec_builds_registered_conditions_with_their_options() -> None:
+    spec = SimulationSpec(
+        "money_exchange",
+        4,
+        1,
+        3,
+        2,
+        "dummy",
+        {"starting_money": 2.5, "exchange_inventory_units": 5},
+    )
+    rebuilt = SimulationSpec.from_dict(json.loads(json.dumps(spec.to_dict())))
+    assert rebuilt == spec
+    llm: Any = DummyLLM()
+    sim = rebuilt.build(llm)
+    assert isinstance(sim, MoneyExchangeSimulation)
+    assert all(agent.money == 2.5 for agent in sim.agents.values())
+    assert set(sim.exchange_inventory.values()) == {5}
+    assert sim._parameters()["exchange_inventory_units"] == 5
+
+    assert set(CONDITIONS) >= {"barter", "barter_chat_credit", "central_planner"}
+    with pytest.raises(ValueError, match="no option"):
+        SimulationSpec("barter", 4, 1, 3, 2, "dummy", {"starting_money": 2.0}).build(llm)
+    with pytest.raises(ValueError, match="Unknown condition"):
+        SimulationSpec("bazaar", 4, 1, 3, 2, "dummy").build(llm)
+    with pytest.raises(ValueError, match="already registered"):
+
+        @register_condition
+        class OtherBarter(BarterSimulation):
+            pass
+
+
 def test_barter_run_completes_trade() -> None:
     script = {
         "A0": [
@@ -322,3 +361,208 @@ def test_money_exchange_pads_outbox() -> None:
     )
     result = sim.run()
     assert result.messages
+
+
+def test_barter_async_rounds_apply_each_decision_on_return() -> None:
+    script = {
+        "A0": [{"action": "propose_trade", "to": "A1", "give": "g0", "receive": "g1"}],
+        "A1": [{"action": "accept", "of_message_id": "m0"}],
+    }
+    sim = BarterSimulation(
+        n_agents=2,
+        rounds=3,
+        seed=0,
+        history_limit=5,
+        llm_client=ScriptedBarterLLM(script),  # type: ignore[arg-type]
+        model_name="dummy",
+    )
+    result = sim.run_async(max_workers=1)
+
+    # A1 sees A0's proposal within the same round instead of waiting for the barrier.
+    assert result.successful_agents == 2
+    assert result.rounds_run == 1
+    assert result.condition == "barter_async"
+    assert result.parameters["schedule"] == "async"
+    assert result.events is not None
+    clocks = [ev["clock"] for ev in result.events]
+    assert clocks == sorted(clocks)
+    assert any(ev["event"] == "trade_executed" and ev["clock"] == 2 for ev in result.events)
+
+
+def test_money_exchange_async_rounds_round_trip() -> None:
+    sim = MoneyExchangeSimulation(
+        n_agents=2,
+        rounds=3,
+        seed=0,
+        history_limit=4,
+        llm_client=ScriptedMoneyLLM(),  # type: ignore[arg-type]
+        model_name="dummy",
+        starting_money=1.0,
+    )
+    result = sim.run_async(max_workers=2)
+    assert result.successful_agents == 2
+    assert result.condition == "money_exchange_async"
+    assert result.exchange_round_metrics
+    assert all("clock" in metric for metric in result.exchange_round_metrics)
+
+
+def test_central_planner_has_no_async_rounds() -> None:
+    sim = CentralPlannerSimulation(
+        n_agents=2,
+        rounds=1,
+        seed=0,
+        history_limit=5,
+        llm_client=DummyLLM(),  # type: ignore[arg-type]
+        model_name="dummy",
+    )
+    with pytest.raises(ValueError, match="no per-agent LLM decisions"):
+        sim.run_async(max_workers=1)
+
+
+def test_agent_history_is_bounded_with_cached_json_view() -> None:
+    state = AgentState(name="A0", inventory={"g0": 1}, target_good="g1", history_limit=3)
+    for idx in range(5):
+        state.record_history({"direction": "outgoing", "message_id": f"m{idx}", "payload": {}})
+
+    assert [entry["message_id"] for entry in state.history] == ["m2", "m3", "m4"]
+    assert [entry["message_id"] for entry in state.recent_history(2)] == ["m3", "m4"]
+    for limit in (1, 2, 3, 10):
+        expected = json.dumps(state.recent_history(limit), ensure_ascii=True, separators=(",", ":"))
+        assert state.recent_history_json(limit) == expected
+    assert prompts.barter_user_prompt(
+        1, state.recent_history_json(3), state.inventory, "g1"
+    ) == prompts.barter_user_prompt(1, state.recent_history(3), state.inventory, "g1")
+
+
+def test_prompt_cache_tracks_inventory_history_and_money() -> None:
+    sim = MoneyExchangeSimulation(3, 3, 0, 5, DummyLLM(), "dummy")  # type: ignore[arg-type]
+    agent = sim.agents["A0"]
+
+    def fresh(round_number: int) -> list:
+        return [
+            {
+                "role": "system",
+                "content": prompts.money_agent_system_prompt(
+                    agent.name, agent.inventory, agent.money, agent.target_good
+                ),
+            },
+            {
+                "role": "user",
+                "content": prompts.money_agent_user_prompt(
+                    round_number,
+                    agent.recent_history(sim.history_limit),
+                    agent.inventory,
+                    agent.money,
+                    agent.target_good,
+                ),
+            },
+        ]
+
+    first = sim._agent_messages(agent, 1)
+    assert first == fresh(1)
+    assert sim._agent_messages(agent, 2) == fresh(2)
+    assert sim._agent_messages(agent, 2)[0]["content"] is first[0]["content"]
+
+    good = next(iter(agent.inventory))
+    agent.inventory[good] -= 1
+    assert sim._agent_messages(agent, 3) == fresh(3)
+    agent.money += 1.5
+    assert sim._agent_messages(agent, 3) == fresh(3)
+    agent.record_history({"direction": "incoming", "message_id": "m9", "payload": {}})
+    assert sim._agent_messages(agent, 4) == fresh(4)
+
+
+def test_round_metrics_track_clearing_curve() -> None:
+    for cls in (BarterSimulation, CentralPlannerSimulation, MoneyExchangeSimulation):
+        result = cls(5, 6, 0, 5, StatelessLLM(), "dummy").run()  # type: ignore[arg-type]
+        curve = result.round_metrics
+        assert curve is not None
+        assert len(curve["successful_agents"]) == len(curve["trades"]) == result.rounds_run
+        assert curve["successful_agents"][-1] == result.successful_agents
+        assert sum(curve["trades"]) > 0
+
+
+def test_simulation_records_token_usage_and_timing() -> None:
+    class FakeResponses:
+        def create(self, input: Any, **_: Any) -> Any:
+            action = json.dumps(respond_stateless(input))
+            usage = type("Usage", (), {"input_tokens": 100, "output_tokens": 7})()
+            return type("Resp", (), {"output_text": action, "usage": usage})()
+
+    fake_client = type("FakeClient", (), {"responses": FakeResponses()})()
+    client = LLMClient(model="dummy", client=fake_client)
+    result = BarterSimulation(3, 4, 0, 5, client, "dummy").run()
+
+    assert result.usage is not None and result.timing is not None
+    calls = result.usage["llm_calls"]
+    assert calls == 3 * result.rounds_run
+    assert result.usage["input_tokens"] == 100 * calls
+    assert result.usage["output_tokens"] == 7 * calls
+    assert result.timing["wall_clock_seconds"] >= result.timing["llm_seconds"] >= 0.0
+
+
+def test_stall_detection_stops_idle_runs_and_records_skipped_rounds() -> None:
+    result = BarterSimulation(3, 10, 0, 5, DummyLLM(), "dummy", stall_rounds=2).run()  # type: ignore
+
+    assert result.rounds_run == 2
+    assert result.usage is not None and result.usage["llm_calls"] == 3 * 2
+    assert result.stall == {
+        "stall_rounds": 2,
+        "stalled": True,
+        "skipped_rounds": 8,
+        "skipped_calls": 0,
+        "skipped_calls_by_round": [0, 0],
+    }
+    assert result.parameters["stall_rounds"] == 2
+    assert [event for event in result.events or [] if event["event"] == "run_stalled"] == [
+        {"event": "run_stalled", "round": 2, "idle_rounds": 2, "skipped_rounds": 8}
+    ]
+
+    # Off by default: the run plays every round and its log is unchanged.
+    plain = BarterSimulation(3, 10, 0, 5, DummyLLM(), "dummy").run()  # type: ignore[arg-type]
+    assert plain.rounds_run == 10 and plain.stall is None
+    assert "stall_rounds" not in plain.parameters
+
+    # A proposal the receiver has not seen yet can still be accepted, so its round is not idle.
+    proposal = {"action": "propose_trade", "to": "A1", "give": "g0", "receive": "g1"}
+    llm = ScriptedBarterLLM({"A0": [proposal]})
+    pending = BarterSimulation(3, 10, 0, 5, llm, "dummy", stall_rounds=2).run()  # type: ignore
+    assert pending.rounds_run == 3
+    assert pending.stall is not None and pending.stall["stalled"]
+
+    with pytest.raises(ValueError, match="synchronous rounds"):
+        BarterSimulation(3, 3, 0, 5, DummyLLM(), "dummy", stall_rounds=2).run_async(3)  # type: ignore
+
+
+def test_ignored_or_unexecutable_proposals_do_not_block_stall_detection() -> None:
+    # A1 passes over A0's proposal in round 2; it stays acceptable but no longer open.
+    proposal = {"action": "propose_trade", "to": "A1", "give": "g0", "receive": "g1"}
+    llm = ScriptedBarterLLM({"A0": [proposal]})
+    simulation = BarterSimulation(3, 10, 0, 5, llm, "dummy", stall_rounds=2)  # type: ignore
+    ignored = simulation.run()
+    assert ignored.rounds_run == 3
+    assert ignored.stall is not None and ignored.stall["stalled"]
+    assert len(simulation._proposals) == 1 and simulation._open_proposals() == []
+
+    # A proposal whose offered good the proposer has given away is not open either.
+    simulation = BarterSimulation(3, 10, 0, 5, DummyLLM(), "dummy", stall_rounds=2)  # type: ignore
+    simulation.current_round = 1
+    simulation._apply_barter_actions({"A0": dict(proposal)}, 1)
+    assert len(simulation._open_proposals()) == 1
+    simulation.agents["A0"].inventory["g0"] = 0
+    assert simulation._open_proposals() == []
+
+
+def test_credit_and_chat_skip_satisfied_agents_with_nothing_to_answer() -> None:
+    for cls in (BarterChatSimulation, BarterWithCreditSimulation, BarterChatCreditSimulation):
+        full = cls(6, 8, 0, 5, StatelessLLM(), "dummy").run()  # type: ignore[arg-type]
+        skipping = cls(6, 8, 0, 5, StatelessLLM(), "dummy", stall_rounds=3).run()  # type: ignore
+        assert skipping.stall is not None and skipping.usage is not None
+        assert skipping.stall["skipped_calls"] > 0
+        assert skipping.usage["llm_calls"] + skipping.stall["skipped_calls"] == (
+            6 * skipping.rounds_run
+        )
+        assert skipping.inventory_final == full.inventory_final
+
+    barter = BarterSimulation(6, 8, 0, 5, StatelessLLM(), "dummy", stall_rounds=3).run()  # type: ignore
+    assert barter.stall is not None and barter.stall["skipped_calls"] == 0
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from agentic_economy import cli
+from agentic_economy.sweep import (
+    check_budget,
+    expand,
+    load_run_sets,
+    load_sweep,
+    plan_sweep,
+    register_run_set,
+    showcase_priorities,
+    sweep_specs,
+    write_manifest,
+)
+from tests.helpers import respond_stateless
+
+SWEEP_TOML = """
+output_dir = "{output_dir}"
+conditions = ["barter", "money_exchange"]
+n = [3, 8]
+seeds = 2
+rounds = 4
+backend = "concurrent"
+concurrency = 8
+showcase_priority = 7
+
+[options]
+starting_money = 2.0
+
+[budget]
+decisions = 100
+"""
+
+
+def test_sweep_specs_give_each_condition_only_its_options() -> None:
+    specs = sweep_specs(
+        ["barter", "money_exchange"],
+        [3, 5],
+        range(2),
+        rounds=4,
+        history_limit=6,
+        model="dummy",
+        options={"starting_money": 3.0, "exchange_inventory_units": None},
+    )
+    assert len(specs) == 8
+    assert {spec.condition: spec.options for spec in specs} == {
+        "barter": {},
+        "money_exchange": {"starting_money": 3.0},
+    }
+    assert [(spec.n_agents, spec.seed) for spec in specs[:4]] == [(3, 0), (3, 1), (5, 0), (5, 1)]
+
+
+def test_plan_skips_existing_logs_and_orders_largest_first(tmp_path: Path) -> None:
+    output_dir = tmp_path / "runs_demo"
+    spec_path = tmp_path / "demo.toml"
+    spec_path.write_text(SWEEP_TOML.format(output_dir=output_dir.as_posix()), encoding="utf-8")
+    output_dir.mkdir()
+    (output_dir / "barter_N8_seed1.json.gz").write_bytes(b"")
+    (output_dir / "notes.txt").write_text("not a log", encoding="utf-8")
+    (output_dir / ".sweep_manifest.json").write_text("{}", encoding="utf-8")
+
+    config = load_sweep(spec_path)
+    jobs = plan_sweep(config)
+    assert len(jobs) == 8 and jobs[0].exists and jobs[0].log_stem == "barter_N8_seed1"
+    pending = [job for job in jobs if not job.exists]
+    assert [job.spec.n_agents for job in pending] == [8, 8, 8, 3, 3, 3, 3]
+    assert pending[1].spec.options == {"starting_money": 2.0}
+    with pytest.raises(ValueError, match="over its budget of 100"):
+        check_budget(config, jobs)
+    config.budget["decisions"] = 200
+    check_budget(config, jobs)
+
+    manifest = json.loads(write_manifest(config, jobs).read_text(encoding="utf-8"))
+    assert manifest["run_set"] == "runs_demo"
+    assert [job["status"] for job in manifest["jobs"]].count("existing") == 1
+    assert manifest["jobs"][1]["estimated_decisions"] == 32
+
+
+def test_yaml_random_sample_is_seeded_subset_of_grid(tmp_path: Path) -> None:
+    spec_path = tmp_path / "explore.yaml"
+    spec_path.write_text(
+        "conditions: [barter, barter_chat, money_exchange]\n"
+        "n: [3, 5, 8]\n"
+        "seeds: [0, 1, 2]\n"
+        "rounds: 6\n"
+        "sampling: {method: random, samples: 5, seed: 3}\n",
+        encoding="utf-8",
+    )
+    config = load_sweep(spec_path)
+    assert config.output_dir == Path("runs_explore")
+    sample = expand(config)
+    assert len(sample) == 5 and sample == expand(config)
+    grid = sweep_specs(config.conditions, config.n_values, config.seeds, 6, 10, config.model)
+    assert all(spec in grid for spec in sample)
+
+    for bad in (
+        "backend: gpu\n",
+        "workers: 4\n",
+        "options: {starting_money: 2}\n",
+        "adaptive: {target_ci_width: 0.2, metric: succes_rate}\n",
+    ):
+        spec_path.write_text("conditions: [barter]\nn: 3\nrounds: 2\n" + bad, encoding="utf-8")
+        with pytest.raises(ValueError):
+            load_sweep(spec_path)
+    spec_path.write_text(
+        "conditions: [barter]\nn: 3\nrounds: 2\n"
+        "adaptive: {target_ci_width: 0.2, metric: clearing_auc}\n",
+        encoding="utf-8",
+    )
+    assert load_sweep(spec_path).adaptive["metric"] == "clearing_auc"
+
+
+def test_register_run_set_updates_the_index(tmp_path: Path) -> None:
+    index = tmp_path / "run_sets.json"
+    index.write_text(json.dumps({"runs_core": {"showcase_priority": 5}}), encoding="utf-8")
+    spec_path = tmp_path / "demo.toml"
+    spec_path.write_text(SWEEP_TOML.format(output_dir="runs_demo"), encoding="utf-8")
+
+    entry = register_run_set(load_sweep(spec_path), index)
+    assert entry["manifest"] == "runs_demo/.sweep_manifest.json"
+    run_sets = load_run_sets(index)
+    assert showcase_priorities(run_sets) == {"runs_core": 5, "runs_demo": 7}
+    assert load_run_sets(tmp_path / "missing.json") == {}
+
+
+def test_serial_and_async_sweep_files_run_end_to_end(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    models: List[str] = []
+
+    class StubClient:
+        def __init__(self, model: str) -> None:
+            models.append(model)
+
+        def complete_json(self, messages: Any) -> Dict[str, Any]:
+            return respond_stateless(messages)
+
+    monkeypatch.setattr(cli, "LLMClient", StubClient)
+    for backend in ("serial", "async"):
+        output_dir = tmp_path / f"runs_{backend}"
+        spec = tmp_path / f"{backend}.toml"
+        spec.write_text(
+            f'output_dir = "{output_dir.as_posix()}"\n'
+            'conditions = ["barter", "money_exchange"]\n'
+            'n = [3]\nseeds = 1\nrounds = 2\nmodel = "stub-model"\n'
+            f'backend = "{backend}"\n'
+        )
+        argv = ["agentic-economy", "sweep", str(spec), "--run-sets", str(tmp_path / "sets.json")]
+        monkeypatch.setattr(sys, "argv", argv)
+        cli.main()
+
+        suffix = "_async" if backend == "async" else ""
+        assert sorted(path.name for path in output_dir.glob("[!.]*.json")) == [
+            f"barter{suffix}_N3_seed0.json",
+            f"money_exchange{suffix}_N3_seed0.json",
+        ]
+        log = json.loads((output_dir / f"barter{suffix}_N3_seed0.json").read_text())
+        assert log["parameters"]["model"] == "stub-model"
+    # One client per model and sweep, built from the specs rather than a --model flag.
+    assert models == ["stub-model", "stub-model"]
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List
+
+from openai import RateLimitError
+
+from agentic_economy.cli import ExtraFieldsFormatter
+from agentic_economy.llm_client import LLMClient
+from agentic_economy.scheduler import run_interleaved
+from agentic_economy.simulation import BarterSimulation, MoneyExchangeSimulation
+from agentic_economy.tracing import TraceExporter
+from tests.helpers import StatelessLLM, respond_stateless, run_log
+
+
+def _attributes(span: Dict[str, Any]) -> Dict[str, Any]:
+    return {item["key"]: next(iter(item["value"].values())) for item in span["attributes"]}
+
+
+def _spans(path: Path) -> List[List[Dict[str, Any]]]:
+    return [
+        json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        for line in path.read_text().splitlines()
+    ]
+
+
+def test_trace_nests_run_round_decision_and_http_attempt(tmp_path: Path) -> None:
+    class FlakyResponses:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def create(self, input: Any, **_: Any) -> Any:
+            self.calls += 1
+            if self.calls == 2:
+                raise RateLimitError.__new__(RateLimitError)
+            usage = type("Usage", (), {"input_tokens": 50, "output_tokens": 5})()
+            action = json.dumps(respond_stateless(input))
+            return type("Resp", (), {"output_text": action, "usage": usage})()
+
+    client = LLMClient(
+        model="dummy", client=type("C", (), {"responses": FlakyResponses()})(), retry_delay=0.0
+    )
+    exporter = TraceExporter(tmp_path / "traces.jsonl")
+    simulation = BarterSimulation(3, 3, 0, 5, client, "dummy")
+    simulation.tracer = exporter.trace({"condition": "barter", "n_agents": 3, "seed": 0})
+    result = simulation.run()
+    exporter.finish(simulation.tracer, {"rounds_run": result.rounds_run})
+    exporter.close()
+
+    (spans,) = _spans(tmp_path / "traces.jsonl")
+    by_id = {span["spanId"]: span for span in spans}
+    names = [span["name"] for span in spans]
+    assert names.count("run") == 1
+    assert names.count("round") == result.rounds_run
+    assert names.count("decision") == 3 * result.rounds_run
+    assert {span["traceId"] for span in spans} == {spans[0]["traceId"]}
+    parents = {"round": "run", "decision": "round", "http_attempt": "decision"}
+    for span in spans:
+        if span["name"] != "run":
+            assert by_id[span["parentSpanId"]]["name"] == parents[span["name"]]
+        assert int(span["startTimeUnixNano"]) <= int(span["endTimeUnixNano"])
+
+    decisions = [span for span in spans if span["name"] == "decision"]
+    retried = [span for span in decisions if _attributes(span)["retry_count"] == "1"]
+    assert len(retried) == 1
+    attempts = [span for span in spans if span["parentSpanId"] == retried[0]["spanId"]]
+    assert [_attributes(span)["http.response.status_code"] for span in attempts] == ["429", "200"]
+    assert attempts[0]["status"]["code"] == 2 and attempts[0]["kind"] == 3
+    assert _attributes(retried[0])["gen_ai.usage.input_tokens"] == "50"
+    run_attributes = _attributes(by_id[simulation.tracer.run_span_id])
+    assert run_attributes["condition"] == "barter"
+    assert run_attributes["rounds_run"] == str(result.rounds_run)
+
+
+def test_tracing_leaves_interleaved_runs_unchanged(tmp_path: Path) -> None:
+    def build() -> List[Any]:
+        return [
+            BarterSimulation(4, 3, 0, 5, StatelessLLM(), "dummy"),  # type: ignore[arg-type]
+            MoneyExchangeSimulation(3, 3, 1, 5, StatelessLLM(), "dummy"),  # type: ignore
+        ]
+
+    plain = [run_log(result) for result in run_interleaved(build(), max_workers=4)]
+    exporter = TraceExporter(tmp_path / "traces.jsonl")
+    simulations = build()
+    for simulation in simulations:
+        simulation.tracer = exporter.trace({"condition": simulation.condition})
+    traced = run_interleaved(simulations, max_workers=4)
+    exporter.finish(simulations[0].tracer, {})
+    # The second run never finishes explicitly; closing exports it as failed.
+    exporter.close()
+
+    assert [run_log(result) for result in traced] == plain
+    first, second = _spans(tmp_path / "traces.jsonl")
+    assert "status" not in first[-1]
+    assert second[-1]["name"] == "run" and second[-1]["status"]["code"] == 2
+    assert any(_attributes(span).get("agent") == "Exchange" for span in second)
+
+
+def test_log_formatter_keeps_extra_fields() -> None:
+    formatter = ExtraFieldsFormatter("%(message)s")
+    record = logging.makeLogRecord({"msg": "llm_retry", "attempt": 1, "error": "RateLimitError"})
+    assert json.loads(formatter.format(record)) == {
+        "event": "llm_retry",
+        "attempt": 1,
+        "error": "RateLimitError",
+    }
+    plain = logging.makeLogRecord({"msg": '{"event": "run_complete"}'})
+    assert formatter.format(plain) == '{"event": "run_complete"}'